@@ -0,0 +1,59 @@
+"""Per-frame benchmark: :class:`EdgeCollection` vs. one ``Line`` per edge.
+
+Run with ``python benchmarks/bench_edge_frames.py [sizes ...]``.  Each row
+recolours every edge to one of ``--colors`` colours, then times rendering a
+frame of the result with the Cairo camera, for the bucketed collection
+and for a ``VGroup`` of lines built by :func:`build_edges`.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from manim import Camera, color_gradient
+
+from network_manim.edges import EdgeCollection
+from network_manim.graph_utils import build_edges
+
+
+def _frame_time(camera, mobject, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        camera.reset()
+        camera.capture_mobject(mobject)
+    return (time.perf_counter() - start) / repeats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[1000, 5000, 20000])
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--colors", type=int, default=4)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    positions = np.c_[rng.uniform(-7, 7, (args.nodes, 2)), np.zeros(args.nodes)]
+    palette = color_gradient(["#F75969", "#5CAAEA"], args.colors)
+    camera = Camera()
+    print(f"{'E':>6} {'collection':>12} {'lines':>12}   (s/frame)")
+    for size in args.sizes:
+        edges = rng.integers(0, args.nodes, (size, 2))
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        colour_of = rng.integers(0, args.colors, len(edges))
+
+        collection = EdgeCollection.from_positions(positions, edges, trim=0.2)
+        lines = build_edges(positions, edges, trim=0.2)
+        for c, color in enumerate(palette):
+            collection.set_style(np.flatnonzero(colour_of == c), color=color)
+        for line, c in zip(lines, colour_of):
+            line.set_color(palette[c])
+
+        t_collection = _frame_time(camera, collection, args.repeats)
+        t_lines = _frame_time(camera, lines, args.repeats)
+        print(f"{size:>6} {t_collection:12.4f} {t_lines:12.4f}")
+
+
+if __name__ == "__main__":
+    main()
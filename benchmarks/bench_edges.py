@@ -0,0 +1,56 @@
+"""Setup-time benchmark: :func:`build_edges` vs. one ``Line`` per edge.
+
+Run with ``python benchmarks/bench_edges.py [sizes ...]``.  Each row times
+building *E* trimmed edges between random nodes, with the vectorised
+builder and, up to ``--legacy-max`` edges, with the former scalar loop
+(unit vector, trim, ``Line(...).set_opacity(...)`` per edge).
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from manim import Line
+
+from network_manim.graph_utils import build_edges
+
+
+def _legacy_edges(positions, edges, trim):
+    lines = []
+    for i, j in edges:
+        A, B = positions[i], positions[j]
+        unit = (B - A) / np.linalg.norm(B - A)
+        lines.append(Line(A + unit * trim, B - unit * trim, stroke_width=2.0).set_opacity(1))
+    return lines
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[1000, 5000, 20000])
+    parser.add_argument("--nodes", type=int, default=2000)
+    parser.add_argument("--legacy-max", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    positions = np.c_[rng.uniform(-7, 7, (args.nodes, 2)), np.zeros(args.nodes)]
+    print(f"{'E':>6} {'build_edges':>12} {'legacy':>12}   (s)")
+    for size in args.sizes:
+        edges = rng.integers(0, args.nodes, (size, 2))
+        edges = edges[edges[:, 0] != edges[:, 1]]
+        t_batch = _timed(build_edges, positions, edges, trim=0.2)
+        if size <= args.legacy_max:
+            legacy = f"{_timed(_legacy_edges, positions, edges, 0.2):12.3f}"
+        else:
+            legacy = f"{'skipped':>12}"
+        print(f"{size:>6} {t_batch:12.3f} {legacy}")
+
+
+if __name__ == "__main__":
+    main()
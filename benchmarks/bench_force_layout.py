@@ -0,0 +1,49 @@
+"""Force layout benchmark: Barnes–Hut :func:`force_layout` vs. ``nx.spring_layout``.
+
+Run with ``python benchmarks/bench_force_layout.py [sizes ...]``.  Each row
+lays out a random geometric graph of that many nodes (about ``--degree``
+neighbours each) for ``--iterations`` iterations with both, then times a
+warm start after one extra edge.  ``spring_layout`` is skipped above
+``--nx-max`` nodes, where it takes minutes (and needs SciPy past 500).
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import time
+
+import networkx as nx
+import numpy as np
+
+from network_manim.graph_utils import force_layout
+
+
+def _timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[500, 2000, 10000])
+    parser.add_argument("--degree", type=float, default=6.0)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--nx-max", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'N':>6} {'E':>7} {'barnes-hut':>11} {'warm x20':>9} {'spring':>9}   (s)")
+    for n in args.sizes:
+        graph = nx.random_geometric_graph(n, math.sqrt(args.degree / (math.pi * n)), seed=0)
+        edges = np.array(graph.edges, dtype=np.intp).reshape(-1, 2)
+        cold, positions = _timed(force_layout, n, edges, iterations=args.iterations)
+        more = np.vstack([edges, [[0, n - 1]]])
+        warm, _ = _timed(force_layout, n, more, initial=positions, iterations=20)
+        spring = "-"
+        if n <= args.nx_max:
+            spring = f"{_timed(nx.spring_layout, graph, iterations=args.iterations, seed=0)[0]:9.2f}"
+        print(f"{n:>6} {len(edges):>7} {cold:11.2f} {warm:9.2f} {spring:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Label rasterisation benchmark: ``Text`` per node vs. :class:`AtlasLabels`.
+
+Run with ``python benchmarks/bench_labels.py [sizes ...]``.  Each row
+places that many node labels at random and times drawing them into a
+camera frame (``Camera.capture_mobjects``, as every frame of a render
+does) both ways, at ``--quality``.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from manim import UP, Camera, VGroup, config
+
+from network_manim.labels import AtlasLabels
+from network_manim.text import TextFactory
+
+
+def _per_frame(camera, mobjects, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        camera.reset()
+        camera.capture_mobjects(mobjects)
+    return (time.perf_counter() - start) / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[200, 2000])
+    parser.add_argument("--frames", type=int, default=5)
+    parser.add_argument("--quality", default="medium_quality")
+    args = parser.parse_args()
+    config.quality = args.quality
+
+    print(f"{'N':>6} {'Text ms':>9} {'atlas ms':>9}")
+    for n in args.sizes:
+        rng = np.random.default_rng(0)
+        positions = np.c_[rng.uniform(-6, 6, n), rng.uniform(-3.5, 3.5, n), np.zeros(n)]
+        names = [f"N{i}" for i in range(n)]
+        factory = TextFactory()
+        texts = VGroup(*[
+            factory(name, scale=0.4).next_to(p, UP, buff=0.1) for name, p in zip(names, positions)
+        ])
+        atlas = AtlasLabels(names, positions, size=0.2, direction=UP, buff=0.1)
+        atlas.alphas[:] = 1
+
+        camera = Camera()
+        text_time = _per_frame(camera, [texts], args.frames)
+        atlas_time = _per_frame(camera, [atlas], args.frames)
+        print(f"{n:>6} {text_time * 1e3:9.1f} {atlas_time * 1e3:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Node animation benchmark: :class:`NodeKeyframes` vs. one ``.animate`` per dot.
+
+Run with ``python benchmarks/bench_node_keyframes.py [sizes ...]``.  Each row
+moves, shrinks and recolours that many dots at once, both ways, and reports
+the set-up time (``begin``), the time per interpolated frame and the
+memory allocated while doing so (``tracemalloc`` peak).
+"""
+from __future__ import annotations
+
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+from manim import BLUE, AnimationGroup, Dot
+
+from network_manim.keyframes import NodeKeyframes
+
+
+def _measure(make, frames):
+    tracemalloc.start()
+    start = time.perf_counter()
+    anim = make()
+    anim.begin()
+    setup = time.perf_counter() - start
+    start = time.perf_counter()
+    for alpha in np.linspace(0, 1, frames):
+        anim.interpolate(alpha)
+    per_frame = (time.perf_counter() - start) / frames
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return setup, per_frame, peak / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[100, 1000, 5000])
+    parser.add_argument("--frames", type=int, default=30)
+    args = parser.parse_args()
+
+    print(f"{'N':>6} {'':>10} {'begin s':>8} {'frame ms':>9} {'peak MB':>8}")
+    for n in args.sizes:
+        rng = np.random.default_rng(0)
+        targets = np.c_[rng.uniform(-6, 6, (n, 2)), np.zeros(n)]
+        dots = [Dot([x, 0, 0], radius=0.1) for x in np.linspace(-6, 6, n)]
+        ways = {
+            "keyframes": lambda: NodeKeyframes(dots, positions=targets, scale=0.5, colors=BLUE),
+            ".animate": lambda: AnimationGroup(*[
+                dot.animate.move_to(target).scale(0.5).set_fill(BLUE) for dot, target in zip(dots, targets)
+            ]),
+        }
+        for name, make in ways.items():
+            setup, per_frame, peak = _measure(make, args.frames)
+            print(f"{n:>6} {name:>10} {setup:8.3f} {per_frame * 1e3:9.2f} {peak:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""End-to-end benchmark: ``MultiCliqueAnimated7.construct`` through a null renderer.
+
+Run with ``python benchmarks/bench_render.py [cases ...]``.  A case is
+``default`` (the department network) or ``<k>x<n>``: one middle clique
+plus *k* cliques of *n* nodes on each side, randomly cross-linked.  Every
+case runs in each of ``--modes``:
+
+* ``skip``   -- animations skipped, no frame is drawn (pure scene logic);
+* ``low``    -- every frame rasterised at low quality, none encoded;
+* ``medium`` -- the same at medium quality.
+
+Each run happens in a fresh process and records wall time, ``play``
+calls, frames, mobject counts (top-level and whole families, at the end
+and the peak over all plays) and peak RSS.  Results are appended to a
+JSON-lines history (``--history``) with the commit they were measured at,
+and compared with the previous entry for the same case and mode.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+MODES = {"skip": "low_quality", "low": "low_quality", "medium": "medium_quality"}
+HISTORY = Path(__file__).with_name("results") / "render_history.jsonl"
+
+
+def synthetic_spec(sides: int, size: int, *, seed: int = 0) -> dict:
+    """One middle clique and *sides* cliques of *size* nodes left and right."""
+    rng = np.random.default_rng(seed)
+    cliques = [{"name": "Mid", "group": "middle", "nodes": [f"M{i}" for i in range(size)]}]
+    for side in ("left", "right"):
+        for k in range(sides):
+            name = f"{side[0].upper()}{k}"
+            cliques.append({"name": name, "group": side, "nodes": [f"{name}-{i}" for i in range(size)]})
+    nodes = [node for clique in cliques for node in clique["nodes"]]
+    pairs = rng.choice(len(nodes), size=(len(nodes), 2))
+    edges = [[nodes[a], nodes[b]] for a, b in pairs if a // size != b // size]
+    return {"cliques": cliques, "edges": edges}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kB on Linux, bytes on macOS
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+
+def _run(case: str, mode: str) -> dict:
+    """Render *case* in *mode* in this (fresh) process and measure it."""
+    from manim import config
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    from network_manim.scenes.multi_clique import MultiCliqueAnimated7
+
+    class NullRenderer(CairoRenderer):
+        """Draws frames (unless skipping) but encodes nothing; counts what it does."""
+
+        def __init__(self, **kwargs):
+            super().__init__(**kwargs)
+            self.frames = 0
+            self.peak_mobjects = self.peak_family = 0
+
+        def play(self, scene, *args, **kwargs):
+            super().play(scene, *args, **kwargs)
+            self.peak_mobjects = max(self.peak_mobjects, len(scene.mobjects))
+            self.peak_family = max(self.peak_family, len(scene.get_mobject_family_members()))
+
+        def add_frame(self, frame, num_frames=1):
+            if not self.skip_animations:
+                self.frames += num_frames
+            super().add_frame(frame, num_frames)
+
+    config.quality = MODES[mode]
+    config.dry_run = True
+    config.verbosity = "ERROR"
+    spec = None if case == "default" else synthetic_spec(*map(int, case.split("x")))
+    renderer = NullRenderer(skip_animations=mode == "skip")
+
+    start = time.perf_counter()
+    scene = MultiCliqueAnimated7(spec=spec, renderer=renderer)
+    scene.render()
+    seconds = time.perf_counter() - start
+
+    return {
+        "case": case,
+        "mode": mode,
+        "nodes": len(scene.spec),
+        "edges": len(scene.spec.edges),
+        "seconds": round(seconds, 3),
+        "plays": renderer.num_plays,
+        "frames": renderer.frames,
+        "mobjects": len(scene.mobjects),
+        "family": len(scene.get_mobject_family_members()),
+        "peak_mobjects": renderer.peak_mobjects,
+        "peak_family": renderer.peak_family,
+        "peak_rss_mb": round(_peak_rss_mb(), 1),
+    }
+
+
+def _commit() -> str:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _previous(history: Path) -> dict:
+    """Latest recorded result per ``(case, mode)``."""
+    latest = {}
+    if history.exists():
+        for line in history.read_text().splitlines():
+            entry = json.loads(line)
+            for result in entry["results"]:
+                latest[result["case"], result["mode"]] = result
+    return latest
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("cases", nargs="*", default=["default", "3x8", "6x12"])
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--history", type=Path, default=HISTORY)
+    parser.add_argument("--no-save", action="store_true", help="Do not append to the history.")
+    args = parser.parse_args()
+
+    previous = _previous(args.history)
+    context = multiprocessing.get_context("spawn")
+    results = []
+    print(f"{'case':>8} {'mode':>6} {'s':>8} {'Δ':>7} {'plays':>6} {'frames':>7} {'family':>7} {'RSS MB':>7}")
+    for case in args.cases:
+        for mode in args.modes:
+            # A fresh process per run keeps peak RSS and caches independent
+            with context.Pool(1) as pool:
+                result = pool.apply(_run, (case, mode))
+            results.append(result)
+            before = previous.get((case, mode))
+            delta = f"{result['seconds'] / before['seconds'] - 1:+7.1%}" if before and before["seconds"] else f"{'':>7}"
+            print(
+                f"{case:>8} {mode:>6} {result['seconds']:8.2f} {delta} {result['plays']:>6} "
+                f"{result['frames']:>7} {result['peak_family']:>7} {result['peak_rss_mb']:>7.0f}"
+            )
+
+    if not args.no_save:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": _commit(),
+            "python": platform.python_version(),
+            "results": results,
+        }
+        with args.history.open("a") as fh:
+            fh.write(json.dumps(entry) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Scaling benchmark: :class:`ReplacementMap` vs. the old all-pairs scan.
+
+Run with ``python benchmarks/bench_replacement.py [sizes ...]``.  Each row
+times replacing *n* dots by identity, by position (fresh dots at the same
+centres) and, up to ``--legacy-max`` nodes, with the former O(n·m)
+``np.allclose`` loop.  The per-node columns stay flat for the map and grow
+linearly for the legacy scan.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+import numpy as np
+from manim import Dot
+
+from network_manim.graph_utils import ReplacementMap
+
+
+def _legacy_replace(dot_list, replacement_map):
+    new_list = []
+    for dot in dot_list:
+        for old, new in replacement_map.items():
+            if np.allclose(dot.get_center(), old.get_center()):
+                new_list.append(new)
+                break
+        else:
+            new_list.append(dot)
+    return new_list
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[250, 500, 1000, 2000, 4000, 8000])
+    parser.add_argument("--legacy-max", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"{'n':>6} {'identity':>12} {'position':>12} {'legacy':>12}   (µs per node)")
+    for n in args.sizes:
+        points = np.c_[rng.uniform(-7, 7, (n, 2)), np.zeros(n)]
+        old = [Dot(p) for p in points]
+        new = [Dot(p) for p in points]
+        probes = [Dot(p) for p in points]
+
+        mapping = ReplacementMap(zip(old, new))
+        t_identity = _timed(mapping.replace, old)
+        t_position = _timed(ReplacementMap(zip(old, new)).replace, probes)
+        if n <= args.legacy_max:
+            t_legacy = _timed(_legacy_replace, old, dict(zip(old, new)))
+            legacy = f"{t_legacy / n * 1e6:12.1f}"
+        else:
+            legacy = f"{'skipped':>12}"
+        print(f"{n:>6} {t_identity / n * 1e6:12.1f} {t_position / n * 1e6:12.1f} {legacy}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Label benchmark: one ``Text`` per node vs. :class:`TextFactory`.
+
+Run with ``python benchmarks/bench_text.py [sizes ...]``.  Each row builds
+that many distinct node labels, plus every title a second time, both
+ways; the factory lays the strings out on ``--workers`` processes first.
+Manim's on-disk SVG cache is pointed at a fresh directory, so Pango runs
+every time.
+"""
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+
+from manim import Text, tempconfig
+
+from network_manim.text import TextFactory
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("sizes", nargs="*", type=int, default=[50, 500])
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    print(f"{'N':>6} {'Text s':>8} {'factory s':>10}")
+    for n in args.sizes:
+        labels = [f"N{i}" for i in range(n)] * 2
+        times = []
+        for build in ("text", "factory"):
+            with tempfile.TemporaryDirectory() as media, tempconfig({"media_dir": media}):
+                start = time.perf_counter()
+                if build == "text":
+                    [Text(label).scale(0.4) for label in labels]
+                else:
+                    factory = TextFactory()
+                    factory.prerender(labels, workers=args.workers)
+                    [factory(label, scale=0.4) for label in labels]
+                times.append(time.perf_counter() - start)
+        print(f"{n:>6} {times[0]:8.2f} {times[1]:10.2f}")
+
+
+if __name__ == "__main__":
+    main()
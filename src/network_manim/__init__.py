@@ -1,6 +1,31 @@
 """Top‑level package for Network‑Manim."""
-from importlib.metadata import version as _v
-__version__ = _v("network-manim", default="0.0.0")
+from importlib import import_module
+from importlib.metadata import PackageNotFoundError, version as _v
 
-# Public API
-from .scenes.multi_clique import MultiCliqueAnimated7  # noqa: F401
\ No newline at end of file
+try:
+    __version__ = _v("network-manim")
+except PackageNotFoundError:  # running from a source checkout
+    __version__ = "0.0.0"
+
+# Public API, imported on first use so that ``import network_manim`` (and
+# the CLI's help) does not pull in Manim
+_LAZY = {
+    "MultiCliqueAnimated7": ".scenes.multi_clique",
+    "GraphSpec": ".spec",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), *_LAZY])
+
+
+__all__ = ["GraphSpec", "MultiCliqueAnimated7", "__version__"]
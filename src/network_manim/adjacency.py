@@ -0,0 +1,221 @@
+"""Raster-backed adjacency matrices: one image for the cells, one path for the grid."""
+from __future__ import annotations
+
+import hashlib
+from typing import Mapping
+
+import numpy as np
+from manim import (
+    GREY,
+    RESAMPLING_ALGORITHMS,
+    UL,
+    Animation,
+    ImageMobject,
+    ManimColor,
+    VMobject,
+    config,
+    linear,
+)
+
+
+def _rgba(color, opacity: float = 1.0) -> np.ndarray:
+    return ManimColor(color).to_int_rgba_with_alpha(opacity).astype(np.uint8)
+
+
+def grid_lines(
+    rows: int,
+    cols: int,
+    cell_size: float,
+    *,
+    top_left=(0, 0, 0),
+    color=GREY,
+    stroke_width: float = 1.0,
+    size=None,
+) -> VMobject:
+    """Return a ``rows``×``cols`` cell grid as a single :class:`VMobject`.
+
+    All ``rows + cols + 2`` lines are subpaths of one mobject, so the grid is
+    hashed and drawn once per frame however large it is.  *size*, a
+    ``(width, height)`` pair, sets how far the lines reach (default: just
+    across the cells).
+    """
+    x0, y0 = top_left[0], top_left[1]
+    width, height = (cols * cell_size, rows * cell_size) if size is None else size
+    grid = VMobject(stroke_color=color, stroke_width=stroke_width)
+    for k in range(cols + 1):
+        x = x0 + k * cell_size
+        grid.start_new_path(np.array([x, y0, 0.0]))
+        grid.add_line_to(np.array([x, y0 - height, 0.0]))
+    for k in range(rows + 1):
+        y = y0 - k * cell_size
+        grid.start_new_path(np.array([x0, y, 0.0]))
+        grid.add_line_to(np.array([x0 + width, y, 0.0]))
+    return grid
+
+
+class AdjacencyMatrixMobject(ImageMobject):
+    """Typed adjacency matrix drawn as a single raster, one pixel per cell.
+
+    Cell ``[r, c]`` of *types* is drawn *r* cells below the top edge and *c*
+    cells right of the left edge, in ``colors[types[r, c]]``; type 0 means "no
+    edge" and stays transparent.  Cells start visible unless *hidden* is set
+    (use :class:`RevealMatrix` to bring them in).  Colour and visibility are
+    updated in place with vectorised writes, so animating a 5,000×5,000
+    matrix costs the same number of mobjects as a 5×5 one.
+    """
+
+    def __init__(
+        self,
+        types: np.ndarray,
+        *,
+        cell_size: float,
+        colors: Mapping[int, object],
+        hidden: bool = False,
+        **kwargs,
+    ) -> None:
+        types = np.asarray(types, dtype=np.int8)
+        if types.ndim != 2:
+            raise ValueError(f"expected a 2-D typed adjacency, got shape {types.shape}")
+        self.types = types
+        self.cell_size = cell_size
+        # Part of the instance dict, so Manim's (truncating) play-call hash
+        # still changes with any cell of a large matrix.
+        self.types_digest = hashlib.sha1(types.tobytes()).hexdigest()
+        self.palette = np.zeros((256, 4), dtype=np.uint8)
+        for etype, color in colors.items():
+            self.palette[etype] = _rgba(color)
+        self.visible = np.full(types.shape, not hidden)
+
+        super().__init__(self._render(), **kwargs)
+        rows, cols = types.shape
+        self.stretch_to_fit_width(cols * cell_size)
+        self.stretch_to_fit_height(rows * cell_size)
+        # Sharp cells when magnified, area-averaged when there are more cells
+        # than screen pixels.
+        on_screen = rows * cell_size * config.pixel_height / config.frame_height
+        self.set_resampling_algorithm(
+            RESAMPLING_ALGORITHMS["nearest" if rows <= on_screen else "box"]
+        )
+
+    def _render(self) -> np.ndarray:
+        pixels = self.palette[self.types.astype(np.uint8)]
+        pixels[..., 3] *= self.visible
+        return pixels
+
+    @property
+    def _flat(self) -> np.ndarray:
+        return self.pixel_array.reshape(-1, 4)
+
+    def cells_of_type(self, etype: int) -> np.ndarray:
+        """Flat indices of the cells holding *etype*."""
+        return np.flatnonzero(self.types == etype)
+
+    def set_type_color(self, etype: int, color, opacity: float = 1.0) -> AdjacencyMatrixMobject:
+        """Recolour every cell of *etype* at once."""
+        self.palette[etype] = _rgba(color, opacity)
+        self._paint(self.cells_of_type(etype), self.palette[etype])
+        return self
+
+    def set_cells_visible(self, cells: np.ndarray, visible: bool = True) -> AdjacencyMatrixMobject:
+        """Show or hide the cells at flat indices *cells*."""
+        self.visible.reshape(-1)[cells] = visible
+        flat = self._flat
+        flat[cells, 3] = self.palette[self.types.reshape(-1)[cells].astype(np.uint8), 3] * visible
+        return self
+
+    def _paint(self, cells: np.ndarray, rgba: np.ndarray) -> None:
+        flat = self._flat
+        flat[cells, :3] = rgba[:3]
+        flat[cells, 3] = rgba[3] * self.visible.reshape(-1)[cells]
+
+    def grid(self, **style) -> VMobject:
+        """Return :func:`grid_lines` aligned with this matrix's cells."""
+        rows, cols = self.types.shape
+        return grid_lines(rows, cols, self.cell_size, top_left=self.get_corner(UL), **style)
+
+
+# --------------------------------------------------------------------------- #
+#   Vectorised animations
+# --------------------------------------------------------------------------- #
+
+class RevealMatrix(Animation):
+    """Bring the non-empty cells of an :class:`AdjacencyMatrixMobject` in.
+
+    *axis* (``"row"`` or ``"column"``) sets the sweep direction: whole rows or
+    columns appear together, or with *per_cell* one cell at a time in that
+    order.  Each frame only writes the alpha channel of the newly revealed
+    cells.
+    """
+
+    def __init__(
+        self,
+        matrix: AdjacencyMatrixMobject,
+        *,
+        axis: str = "row",
+        per_cell: bool = False,
+        **kwargs,
+    ) -> None:
+        if axis not in ("row", "column"):
+            raise ValueError(f"axis must be 'row' or 'column', not {axis!r}")
+        self.axis = axis
+        self.per_cell = per_cell
+        kwargs.setdefault("introducer", True)
+        kwargs.setdefault("rate_func", linear)
+        super().__init__(matrix, **kwargs)
+
+    def create_starting_mobject(self) -> AdjacencyMatrixMobject:
+        # Nothing is interpolated from a start state, so skip the raster copy.
+        return self.mobject
+
+    def begin(self) -> None:
+        matrix = self.mobject
+        rows, cols = matrix.types.shape
+        cells = np.flatnonzero(matrix.types)  # row-major
+        if self.axis == "row":
+            self._keys, self._steps = cells // cols, rows
+        else:
+            cells = cells[np.argsort(cells % cols, kind="stable")]
+            self._keys, self._steps = cells % cols, cols
+        self._cells = cells
+        self._shown = 0
+        matrix.set_cells_visible(cells, False)
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        if self.per_cell:
+            count = int(alpha * len(self._cells))
+        else:
+            count = int(np.searchsorted(self._keys, int(alpha * self._steps)))
+        if count > self._shown:
+            self.mobject.set_cells_visible(self._cells[self._shown : count], True)
+        elif count < self._shown:
+            self.mobject.set_cells_visible(self._cells[count : self._shown], False)
+        self._shown = count
+
+
+class RecolorCells(Animation):
+    """Fade the cells of each edge type in *colors* to its new colour."""
+
+    def __init__(self, matrix: AdjacencyMatrixMobject, colors: Mapping[int, object], **kwargs) -> None:
+        self.colors = dict(colors)
+        super().__init__(matrix, **kwargs)
+
+    def create_starting_mobject(self) -> AdjacencyMatrixMobject:
+        return self.mobject
+
+    def begin(self) -> None:
+        matrix = self.mobject
+        self._targets = [
+            (etype, matrix.cells_of_type(etype), matrix.palette[etype].astype(float), _rgba(color))
+            for etype, color in self.colors.items()
+        ]
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        matrix = self.mobject
+        for etype, cells, start, end in self._targets:
+            rgba = np.round(start + (end - start) * alpha).astype(np.uint8)
+            matrix.palette[etype] = rgba
+            matrix._paint(cells, rgba)
@@ -0,0 +1,109 @@
+"""Batch many small ``play``/``wait`` calls into one staggered play."""
+from __future__ import annotations
+
+from typing import Iterable
+
+from manim import AnimationGroup, Mobject, Scene, Succession, Wait, config
+from manim.animation.animation import Animation, prepare_animation
+
+
+def coalesce(animations: Iterable[Animation], min_run_time: float) -> list[Animation]:
+    """Merge runs of animations shorter than *min_run_time* into parallel groups.
+
+    A run is closed as soon as it lasts *min_run_time* in total, or before an
+    animation that touches a mobject already in it, so two steps of the same
+    mobject never play at once.  Each merged group keeps the summed run time
+    of its members; longer animations pass through unchanged.
+    """
+    merged: list[Animation] = []
+    run: list[Animation] = []
+    run_time = 0.0
+    touched: set[int] = set()
+
+    def close() -> None:
+        nonlocal run, run_time, touched
+        if len(run) == 1:
+            merged.append(run[0])
+        elif run:
+            merged.append(AnimationGroup(*run, run_time=run_time))
+        run, run_time, touched = [], 0.0, set()
+
+    for anim in animations:
+        duration = anim.get_run_time()
+        if duration >= min_run_time:
+            close()
+            merged.append(anim)
+            continue
+        family = {id(mob) for mob in anim.mobject.get_family()}
+        if family & touched:
+            close()
+        run.append(anim)
+        run_time += duration
+        touched |= family
+        if run_time >= min_run_time:
+            close()
+    close()
+    return merged
+
+
+class AnimationBatch:
+    """Queue ``play``/``wait`` calls and render them as a single :class:`Succession`.
+
+    Every queued step keeps its own run time, so the result looks like the
+    separate plays it replaces, but Manim hashes, renders and encodes it as
+    one partial movie.  Steps shorter than a frame are merged by
+    :func:`coalesce` instead of each costing a whole frame.  Use it as a
+    context manager; the batch is played when the block exits::
+
+        with AnimationBatch(self) as batch:
+            for dot in dots:
+                batch.play(dot.animate.set_fill(RED), run_time=0.1)
+            batch.wait(2)
+
+    ``.animate`` targets are computed when a step is queued, so queue at most
+    one ``.animate`` step per mobject in a batch.
+    """
+
+    def __init__(self, scene: Scene) -> None:
+        self.scene = scene
+        self._steps: list[Animation] = []
+        self._front: list[Mobject] = []
+
+    def play(self, *animations, **kwargs) -> AnimationBatch:
+        """Queue *animations* to run together, like :meth:`Scene.play`."""
+        anims = [prepare_animation(anim) for anim in animations]
+        for anim in anims:
+            for key, value in kwargs.items():
+                setattr(anim, key, value)
+        self._steps.append(anims[0] if len(anims) == 1 else AnimationGroup(*anims))
+        return self
+
+    def wait(self, duration: float = 1.0) -> AnimationBatch:
+        """Queue a pause of *duration* seconds."""
+        self._steps.append(Wait(duration))
+        return self
+
+    def bring_to_front(self, *mobjects: Mobject) -> AnimationBatch:
+        """Bring *mobjects* to the front once the batch has been played."""
+        self._front.extend(mob for mob in mobjects if mob is not None)
+        return self
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def flush(self) -> None:
+        """Play everything queued so far as one animation."""
+        steps = coalesce(self._steps, 1 / config.frame_rate)
+        self._steps = []
+        if steps:
+            self.scene.play(steps[0] if len(steps) == 1 else Succession(*steps))
+        if self._front:
+            self.scene.bring_to_front(*self._front)
+            self._front = []
+
+    def __enter__(self) -> AnimationBatch:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
@@ -0,0 +1,317 @@
+"""Asset loading for image nodes: label index, thumbnails and decoded-image cache."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterable, NamedTuple, Sequence
+
+import numpy as np
+from PIL import Image, ImageChops, ImageDraw
+
+from .config import CACHE_DIR, IMAGE_CACHE_SIZE
+
+
+def decode_image(path: str | Path) -> np.ndarray:
+    """Decode *path* into a read-only ``(h, w, 4)`` uint8 RGBA array."""
+    with Image.open(path) as img:
+        pixels = np.array(img.convert("RGBA"))
+    pixels.setflags(write=False)
+    return pixels
+
+
+# --------------------------------------------------------------------------- #
+#   Label → asset index
+# --------------------------------------------------------------------------- #
+
+class AssetIndex:
+    """Map lower-cased node labels to image files found in *roots*.
+
+    The directories are scanned once, on first lookup, and every later lookup
+    is a dict access.  When two roots hold the same label the earlier root
+    wins, like probing the folders in order.  The mapping is persisted to a
+    small JSON *manifest* (default: under :data:`~network_manim.config.CACHE_DIR`)
+    and reused by later processes until the mtime of one of the roots changes,
+    i.e. until a file is added, removed or renamed there.
+    """
+
+    _VERSION = 1
+
+    def __init__(
+        self,
+        roots: Sequence[str | Path],
+        *,
+        suffix: str = ".png",
+        manifest: str | Path | None = None,
+    ) -> None:
+        self.roots = [Path(r) for r in roots]
+        self.suffix = suffix.lower()
+        if manifest is None:
+            key = "\0".join(str(r.resolve()) for r in self.roots) + self.suffix
+            digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+            manifest = CACHE_DIR / f"asset-index-{digest}.json"
+        self.manifest = Path(manifest)
+        self._paths: dict[str, Path] | None = None
+
+    def get(self, label: str, default: str | Path | None = None) -> Path | None:
+        """Return the file for *label* (case-insensitive) or *default*."""
+        if self._paths is None:
+            self._paths = self._load()
+        path = self._paths.get(label.lower())
+        if path is None:
+            return None if default is None else Path(default)
+        return path
+
+    def __contains__(self, label: str) -> bool:
+        return self.get(label) is not None
+
+    def __len__(self) -> int:
+        if self._paths is None:
+            self._paths = self._load()
+        return len(self._paths)
+
+    def refresh(self) -> None:
+        """Rescan the roots now and rewrite the manifest."""
+        mtimes = self._mtimes()
+        self._paths = self._scan()
+        self._save(mtimes, self._paths)
+
+    # ------------------------------------------------------------------ #
+
+    def _mtimes(self) -> list[int | None]:
+        mtimes = []
+        for root in self.roots:
+            try:
+                mtimes.append(root.stat().st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return mtimes
+
+    def _scan(self) -> dict[str, Path]:
+        paths: dict[str, Path] = {}
+        for root in self.roots:
+            try:
+                entries = list(os.scandir(root))
+            except OSError:
+                continue
+            for entry in sorted(entries, key=lambda e: e.name):
+                stem, ext = os.path.splitext(entry.name)
+                if ext.lower() == self.suffix and entry.is_file():
+                    paths.setdefault(stem.lower(), Path(entry.path))
+        return paths
+
+    def _load(self) -> dict[str, Path]:
+        mtimes = self._mtimes()
+        try:
+            data = json.loads(self.manifest.read_text())
+        except (OSError, ValueError):
+            data = None
+        if (
+            isinstance(data, dict)
+            and data.get("version") == self._VERSION
+            and data.get("roots") == [str(r) for r in self.roots]
+            and data.get("mtimes") == mtimes
+        ):
+            return {label: Path(p) for label, p in data["paths"].items()}
+
+        paths = self._scan()
+        self._save(mtimes, paths)
+        return paths
+
+    def _save(self, mtimes: list[int | None], paths: dict[str, Path]) -> None:
+        data = {
+            "version": self._VERSION,
+            "roots": [str(r) for r in self.roots],
+            "mtimes": mtimes,
+            "paths": {label: str(p) for label, p in paths.items()},
+        }
+        try:
+            self.manifest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.manifest.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data))
+            os.replace(tmp, self.manifest)
+        except OSError:
+            pass  # read-only cache dir: the in-memory index still works
+
+
+# --------------------------------------------------------------------------- #
+#   Circular thumbnails (content-hash keyed disk cache)
+# --------------------------------------------------------------------------- #
+
+_THUMBNAIL_DIR = CACHE_DIR / "thumbnails"
+_THUMBNAIL_VERSION = 1  # bump when the crop/resample recipe changes
+_DIGEST_CACHE_SIZE = 4096
+# (path, mtime, size) -> digest, least recently used first
+_digests: OrderedDict[tuple[str, int, int], str] = OrderedDict()
+_digests_lock = threading.Lock()
+
+
+def content_digest(path: str | Path) -> str:
+    """SHA-256 of the bytes of *path*, memoised per ``(path, mtime, size)``.
+
+    Only the :data:`_DIGEST_CACHE_SIZE` most recently used digests are kept.
+    """
+    stat = os.stat(path)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    with _digests_lock:
+        digest = _digests.get(key)
+        if digest is not None:
+            _digests.move_to_end(key)
+            return digest
+
+    sha = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            sha.update(chunk)
+    digest = sha.hexdigest()
+    with _digests_lock:
+        _digests[key] = digest
+        while len(_digests) > _DIGEST_CACHE_SIZE:
+            _digests.popitem(last=False)
+    return digest
+
+
+def make_thumbnail(path: str | Path, diameter: int, *, cache_dir: Path | None = None) -> Path:
+    """Return a ``diameter``×``diameter`` circular crop of *path*, cached on disk.
+
+    The image is centre-cropped to a square, downsampled once with a Lanczos
+    filter and masked to an anti-aliased circle.  Thumbnails are keyed by the
+    content hash of the source, so renames and copies share one entry and an
+    edited portrait gets a new one.
+    """
+    cache_dir = _THUMBNAIL_DIR if cache_dir is None else Path(cache_dir)
+    digest = content_digest(path)
+    out = cache_dir / f"{digest[:32]}-{diameter}-v{_THUMBNAIL_VERSION}.png"
+    if out.exists():
+        return out
+
+    img = _circular_crop(path, diameter)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Per thread too: the preload pool may crop two copies of one file at once
+    tmp = out.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+    img.save(tmp, format="PNG")
+    os.replace(tmp, out)
+    return out
+
+
+def _circular_crop(path: str | Path, diameter: int) -> Image.Image:
+    """The thumbnail of :func:`make_thumbnail`, in memory."""
+    with Image.open(path) as src:
+        img = src.convert("RGBA")
+    w, h = img.size
+    side = min(w, h)
+    left, top = (w - side) // 2, (h - side) // 2
+    img = img.crop((left, top, left + side, top + side))
+    img = img.resize((diameter, diameter), Image.LANCZOS)
+
+    # Draw the mask 4× larger and shrink it for a smooth edge.
+    big = diameter * 4
+    mask = Image.new("L", (big, big), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, big - 1, big - 1), fill=255)
+    mask = mask.resize((diameter, diameter), Image.LANCZOS)
+    img.putalpha(ImageChops.multiply(img.getchannel("A"), mask))
+    return img
+
+
+# --------------------------------------------------------------------------- #
+#   Decoded-image cache
+# --------------------------------------------------------------------------- #
+
+class CacheInfo(NamedTuple):
+    """Counters reported by :meth:`ImageCache.cache_info`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ImageCache:
+    """Bounded LRU cache of decoded RGBA pixel arrays.
+
+    Entries are keyed by ``(content digest, diameter)``: every file with the
+    same bytes, like a placeholder portrait that many labels fall back to,
+    maps to one entry, and editing a PNG on disk gives it a new one.  With
+    *diameter* set (in pixels) the entry holds the :func:`make_thumbnail` of
+    the asset rather than the full image.  The arrays handed out are shared
+    between all callers and are flagged read-only.
+    """
+
+    def __init__(self, maxsize: int = IMAGE_CACHE_SIZE) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._evictions = 0
+
+    def get(self, path: str | Path, diameter: int | None = None) -> np.ndarray:
+        """Return the decoded pixels of *path*, decoding only on a miss.
+
+        The pixels only depend on the file and *diameter*, so nodes of
+        any radius drawn at the same diameter share them.
+        """
+        path = Path(path)
+        key = (content_digest(path), diameter)
+        with self._lock:
+            pixels = self._entries.get(key)
+            if pixels is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return pixels
+            self._misses += 1
+
+        # Decode outside the lock so concurrent misses do not serialise.
+        if diameter is None:
+            pixels = decode_image(path)
+        else:
+            try:
+                pixels = decode_image(make_thumbnail(path, diameter))
+            except OSError:
+                # Read-only thumbnail dir: crop from the source, in memory
+                pixels = np.array(_circular_crop(path, diameter))
+                pixels.setflags(write=False)
+        with self._lock:
+            self._entries[key] = pixels
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return pixels
+
+    def preload(
+        self, items: Iterable[tuple[str | Path, int | None]], *, workers: int | None = None
+    ) -> int:
+        """Decode every ``(path, diameter)`` of *items* now, on *workers* threads.
+
+        Hashing, cropping and PNG decoding release the GIL, so the files
+        load in parallel; later :meth:`get` calls for them are hits (as
+        long as they fit in :attr:`maxsize`).  Returns the number of
+        distinct items.
+        """
+        items = list(dict.fromkeys((Path(path), diameter) for path, diameter in items))
+        if not items:
+            return 0
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="preload") as pool:
+            # list() re-raises the first decoding error here
+            list(pool.map(lambda item: self.get(*item), items))
+        return len(items)
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                self._hits, self._misses, self._evictions, self.maxsize, len(self._entries)
+            )
+
+    def cache_clear(self) -> None:
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+
+#: Process-wide cache used by :func:`network_manim.graph_utils.circular_image_node`.
+image_cache = ImageCache()
@@ -1,22 +1,131 @@
-"""Simple Typer CLI wrapper around Manim."""
+"""Simple Typer CLI wrapper around Manim.
+
+Manim is only imported by the commands that render, so ``--help`` and
+``list`` stay fast.
+"""
+import fnmatch
+import os
+import time
+from pathlib import Path
+from typing import List, Optional
+
 import typer
-from manim import config
-from .scenes.multi_clique import MultiCliqueAnimated7
+from .registry import available_scenes, load_scene
+
+app = typer.Typer(rich_help_panel="🕹️  Commands")
+
+def _load(scene: str) -> type:
+    try:
+        return load_scene(scene)
+    except KeyError:
+        typer.secho(f"Unknown scene ‘{scene}’.", fg=typer.colors.RED, err=True)
+        raise typer.Exit(1)
 
-app = typer.Typer(add_help_option=False, rich_help_panel="🕹️  Commands")
+def _scene_kwargs(spec: Optional[Path]) -> dict:
+    """Keyword arguments for the scene: ``spec`` only when given, for scenes without one."""
+    return {"spec": spec} if spec is not None else {}
+
+def _preload(scene_cls: type, spec: Optional[Path]) -> None:
+    """Decode the scene's portraits before it is built, and say how long that took."""
+    asset_labels = getattr(scene_cls, "asset_labels", None)
+    if asset_labels is None:
+        return
+    from .graph_utils import preload_images
+
+    start = time.perf_counter()
+    count = preload_images(asset_labels(spec))
+    typer.echo(f"Preloaded {count} images in {time.perf_counter() - start:.2f}s")
+
+@app.command("list")
+def list_scenes() -> None:
+    """List the registered scenes."""
+    for name, target in sorted(available_scenes().items()):
+        typer.echo(f"{name:<20} {target}")
 
 @app.command()
-def render(scene: str = "multi-clique", quality: str = "m") -> None:
+def render(
+    scene: str = typer.Argument("multi-clique"),
+    quality: str = "m",
+    spec: Optional[Path] = typer.Option(None, help="TOML/JSON network spec to render."),
+    jobs: int = typer.Option(1, "--jobs", "-j", min=1, help="Render sections on this many processes."),
+    cache: bool = typer.Option(True, help="Reuse unchanged sections from the section cache."),
+    profile: bool = typer.Option(False, help="Time every play; write a Chrome trace and print the slowest."),
+    trace: Path = typer.Option(Path("render-trace.json"), help="Where --profile writes its Chrome trace."),
+    top: int = typer.Option(15, help="Steps listed in the --profile summary."),
+) -> None:
     """Render *scene* at the desired *quality* (l, m, h, 4k)."""
-    match scene:
-        case "multi-clique":
-            scene_cls = MultiCliqueAnimated7
-        case _:
-            typer.secho(f"Unknown scene ‘{scene}’.", fg=typer.colors.RED, err=True)
+    scene_cls = _load(scene)
+    from .render import render_scene, set_quality
+    from .section_cache import SectionCache
+
+    set_quality(quality)
+    _preload(scene_cls, spec)
+
+    if profile:
+        # In-process and past the section cache, so that every play is measured
+        from .profiling import PlayProfiler
+
+        instance = scene_cls(**_scene_kwargs(spec))
+        with PlayProfiler(instance) as profiler:
+            instance.render()
+        typer.echo(profiler.summary(top))
+        typer.echo(f"Chrome trace written to {profiler.write_chrome_trace(trace)}")
+        return
+
+    output = render_scene(
+        scene_cls, quality=quality, jobs=jobs, scene_kwargs=_scene_kwargs(spec),
+        cache=SectionCache() if cache else None,
+    )
+    typer.echo(f"Rendered {output}")
+
+@app.command()
+def storyboard(
+    scene: str = typer.Argument("multi-clique"),
+    quality: str = "l",
+    spec: Optional[Path] = typer.Option(None, help="TOML/JSON network spec to render."),
+    jobs: int = typer.Option(os.cpu_count() or 1, "--jobs", "-j", min=1, help="Worker processes."),
+    output: Optional[Path] = typer.Option(None, "--output", "-o", help="Contact sheet PNG to write."),
+    columns: int = typer.Option(6, min=1, help="Stills per row."),
+) -> None:
+    """Preview the layout: the last frame of every section of *scene* on one PNG."""
+    scene_cls = _load(scene)
+    from .storyboard import render_storyboard
+
+    sheet = render_storyboard(
+        scene_cls, quality=quality, jobs=jobs, scene_kwargs=_scene_kwargs(spec), output=output, columns=columns
+    )
+    typer.echo(f"Storyboard written to {sheet}")
+
+@app.command()
+def batch(
+    scenes: List[str] = typer.Argument(..., help="Scene names or glob patterns, e.g. 'multi-*'."),
+    quality: List[str] = typer.Option(["m"], "--quality", "-q", help="Quality to render at; repeatable."),
+    spec: Optional[Path] = typer.Option(None, help="TOML/JSON network spec for every scene."),
+    jobs: int = typer.Option(os.cpu_count() or 1, "--jobs", "-j", min=1, help="Worker processes."),
+    cache: bool = typer.Option(True, help="Reuse unchanged sections from the section cache."),
+    summary: Path = typer.Option(Path("batch-summary.json"), help="Where to write the JSON summary."),
+) -> None:
+    """Render every matching scene at every *quality* from one warm process pool."""
+    registered = available_scenes()
+    selected = {}
+    for pattern in scenes:
+        matches = fnmatch.filter(registered, pattern)
+        if not matches:
+            typer.secho(f"No scene matches ‘{pattern}’.", fg=typer.colors.RED, err=True)
             raise typer.Exit(1)
+        selected.update((name, _load(name)) for name in matches)
+    from .render import render_batch
 
-    config.quality = quality
-    scene_cls().render()
+    results = render_batch(
+        selected, quality, workers=jobs, scene_kwargs=_scene_kwargs(spec), cache=cache, summary=summary
+    )
+    failed = [r for r in results if r["status"] != "ok"]
+    for r in results:
+        status = r.get("output") or r.get("error")
+        typer.echo(f"{r['scene']:>20} {r['quality']:>4} {r['seconds']:8.1f}s  {status}")
+    typer.echo(f"Summary written to {summary}")
+    if failed:
+        raise typer.Exit(1)
 
 if __name__ == "__main__":  # pragma: no cover
-    app()
\ No newline at end of file
+    app()
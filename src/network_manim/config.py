@@ -1,3 +1,6 @@
+import os
+from pathlib import Path
+
 # ────────────────────────────────────────────────────────────
 # → “Inputs” at the very top:
 FPS = 30                     # Change this to adjust frames per second
@@ -6,8 +9,18 @@ NODE_RADIUS_IMAGE = 0.35      # Radius of each node (image), default is 0.3
 NODE_RADIUS = 0.2         # Radius of each node (uniform), default is 0.2
 EDGE_OPACITY = 1          # Opacity of all edges (0 to 1), default is 0.6
 SHOW_LABELS = False           # Set to False to hide node labels
+ATLAS_LABELS = False          # Draw node labels from a glyph atlas, for thousands of nodes
 MATRIX_NODE_RADIUS = 0.12    # smaller radius for the matrix labels, default is 0.12
 GRID_BUFF         = 1.0     # how far below the nodes to place the grid, default is 1.0
 EDGE_WIDTH       = 2.0     # Width of edges, default is 2.0
+IMAGE_CACHE_SIZE = 512     # Max decoded portraits kept in memory, default is 512
+NODE_THUMBNAILS  = True    # Pre-crop portraits to circles at render resolution
+
+COLORS = {}                # Optional label → colour for fallback dots (no PNG)
+
+# Group sub-folders probed (in order) for portraits named after node labels
+ASSET_GROUPS = ("sds", "biostat", "stat", "mstat", "fam", "fr", "sfam")
+# Where manifests and other derived files are kept between renders
+CACHE_DIR = Path(os.environ.get("NMANIM_CACHE_DIR", "~/.cache/network-manim")).expanduser()
 
 # ────────────────────────────────────────────────────────────
\ No newline at end of file
@@ -0,0 +1,255 @@
+"""Edge collections: straight edges as subpaths of one VMobject per style."""
+from __future__ import annotations
+
+import hashlib
+
+import numpy as np
+from manim import WHITE, Animation, ManimColor, VGroup, VMobject
+
+from .config import EDGE_WIDTH
+from .graph_utils import edge_endpoints
+
+# Points per cubic Bézier curve with the Cairo renderer (an instance
+# attribute of VMobject, not a class one)
+_CUBIC = 4
+
+
+class EdgeCollection(VGroup):
+    """Straight edges grouped into one :class:`VMobject` per style bucket.
+
+    Edge *k* runs from ``starts[k]`` to ``ends[k]``.  All edges sharing a
+    colour, stroke width and opacity are subpaths of a single bucket mobject,
+    so a frame hashes, sorts and strokes one path per bucket however many
+    edges there are.  Restyling edges (:meth:`set_style`) moves them between
+    buckets; :meth:`set_progress` draws edges partially (0 hides an edge)
+    and :meth:`put_endpoints` moves them.  Calls that show, hide or restyle
+    edges rebuild only the buckets involved; moving or redrawing visible
+    edges writes their points in place, in time proportional to the edges
+    touched.
+    """
+
+    def __init__(
+        self,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        *,
+        color=WHITE,
+        width: float = EDGE_WIDTH,
+        opacity: float = 1.0,
+        drawn: bool = True,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self.starts = np.array(starts, dtype=float).reshape(-1, 3)
+        self.ends = np.array(ends, dtype=float).reshape(-1, 3)
+        if self.starts.shape != self.ends.shape:
+            raise ValueError(f"{len(self.starts)} starts but {len(self.ends)} ends")
+        self.progress = np.full(len(self.starts), 1.0 if drawn else 0.0)
+        # Position of each visible edge within its bucket, -1 when hidden
+        self._slot = np.full(len(self.starts), -1, dtype=np.intp)
+        self.styles: list[tuple[str, float, float]] = []
+        self._style_ids: dict[tuple[str, float, float], int] = {}
+        self._buckets: list[VMobject] = []
+        self.style = np.full(len(self.starts), self._style_id(color, width, opacity), dtype=np.intp)
+        self._refresh(self.style[:1])
+        self._update_digest()
+
+    @classmethod
+    def from_positions(
+        cls, positions: np.ndarray, edges: np.ndarray, *, trim: float | np.ndarray = 0.0, **kwargs
+    ) -> EdgeCollection:
+        """Build the collection of *edges* (``(E, 2)`` indices) between *positions*."""
+        starts, ends = edge_endpoints(positions, edges, trim)
+        return cls(starts, ends, **kwargs)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.starts)
+
+    def bucket(self, color=WHITE, width: float = EDGE_WIDTH, opacity: float = 1.0) -> VMobject:
+        """The bucket mobject drawing edges of this style (created if needed)."""
+        return self._buckets[self._style_id(color, width, opacity)]
+
+    # ------------------------------------------------------------------ #
+    #   Updates
+    # ------------------------------------------------------------------ #
+
+    def set_style(self, indices, *, color=None, width=None, opacity=None) -> EdgeCollection:
+        """Move edges *indices* to the bucket with the given style changes."""
+        indices = _as_indices(indices)
+        old = self.style[indices]
+        new = np.empty_like(old)
+        for sid in np.unique(old):
+            c, w, o = self.styles[sid]
+            new[old == sid] = self._style_id(
+                c if color is None else color,
+                w if width is None else width,
+                o if opacity is None else opacity,
+            )
+        self._assign(indices, new)
+        self._update_digest()
+        return self
+
+    def set_progress(self, indices, progress) -> EdgeCollection:
+        """Draw edges *indices* up to *progress* (0 = hidden, 1 = whole edge)."""
+        self._set_progress(_as_indices(indices), progress)
+        self._update_digest()
+        return self
+
+    def put_endpoints(self, indices, starts, ends) -> EdgeCollection:
+        """Move edges *indices* to run from *starts* to *ends*."""
+        self._put_endpoints(_as_indices(indices), starts, ends)
+        self._update_digest()
+        return self
+
+    # ------------------------------------------------------------------ #
+    #   Per-frame updates; animations refresh the digest when they finish
+    # ------------------------------------------------------------------ #
+
+    def _set_progress(self, indices: np.ndarray, progress) -> None:
+        was_visible = self.progress[indices] > 0
+        self.progress[indices] = progress
+        if np.array_equal(was_visible, self.progress[indices] > 0):
+            self._write(indices[was_visible])
+        else:
+            self._refresh(self.style[indices])
+
+    def _put_endpoints(self, indices: np.ndarray, starts, ends) -> None:
+        self.starts[indices] = starts
+        self.ends[indices] = ends
+        self._write(indices[self._slot[indices] >= 0])
+
+    def _style_id(self, color, width: float, opacity: float) -> int:
+        key = (ManimColor(color).to_hex(), float(width), float(opacity))
+        sid = self._style_ids.get(key)
+        if sid is None:
+            sid = self._style_ids[key] = len(self.styles)
+            self.styles.append(key)
+            bucket = VMobject(stroke_color=key[0], stroke_width=key[1], stroke_opacity=key[2], fill_opacity=0)
+            self._buckets.append(bucket)
+            self.add(bucket)
+        return sid
+
+    def _assign(self, indices: np.ndarray, style_ids: np.ndarray) -> EdgeCollection:
+        touched = np.concatenate([self.style[indices], style_ids])
+        self.style[indices] = style_ids
+        self._refresh(touched)
+        return self
+
+    def _points(self, indices: np.ndarray) -> np.ndarray:
+        """``(k * 4, 3)`` Bézier points of the visible part of edges *indices*."""
+        t = np.linspace(0, 1, _CUBIC)[None, :, None]
+        start = self.starts[indices]
+        span = (self.ends[indices] - start) * self.progress[indices, None]
+        return (start[:, None, :] + span[:, None, :] * t).reshape(-1, 3)
+
+    def _refresh(self, style_ids: np.ndarray) -> None:
+        """Rebuild the buckets *style_ids* from their visible edges."""
+        for sid in np.unique(style_ids):
+            members = self.style == sid
+            idx = np.flatnonzero(members & (self.progress > 0))
+            self._slot[members] = -1
+            self._slot[idx] = np.arange(len(idx))
+            self._buckets[sid].points = self._points(idx)
+
+    def _write(self, indices: np.ndarray) -> None:
+        """Overwrite the points of visible edges *indices* in their buckets."""
+        if not len(indices):
+            return
+        n = _CUBIC
+        rows = (self._slot[indices, None] * n + np.arange(n)).reshape(-1)
+        points = self._points(indices)
+        styles = np.repeat(self.style[indices], n)
+        for sid in np.unique(styles):
+            at = styles == sid
+            self._buckets[sid].points[rows[at]] = points[at]
+
+    def _update_digest(self) -> None:
+        # Manim's play-call hash truncates large arrays; keep a full digest.
+        self.edges_digest = hashlib.sha1(
+            b"".join(a.tobytes() for a in (self.starts, self.ends, self.progress, self.style))
+        ).hexdigest()
+
+
+def _as_indices(indices) -> np.ndarray:
+    return np.asarray(indices, dtype=np.intp).reshape(-1)
+
+
+# --------------------------------------------------------------------------- #
+#   Vectorised animations
+# --------------------------------------------------------------------------- #
+
+class _EdgeAnimation(Animation):
+    def __init__(self, edges: EdgeCollection, indices, **kwargs) -> None:
+        self.indices = _as_indices(indices)
+        super().__init__(edges, **kwargs)
+
+    def create_starting_mobject(self) -> EdgeCollection:
+        # Edge state is interpolated from arrays saved in begin(), not a copy.
+        return self.mobject
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject._update_digest()
+
+
+class DrawEdges(_EdgeAnimation):
+    """Draw edges *indices* from their start to their end, like :class:`Create`.
+
+    With *lag_ratio* 0 all edges grow together; with 1 they are drawn one
+    after another in the order given.
+    """
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        n = len(self.indices)
+        span = (n - 1) * self.lag_ratio + 1
+        progress = np.clip(alpha * span - np.arange(n) * self.lag_ratio, 0, 1)
+        self.mobject._set_progress(self.indices, progress)
+
+
+class RestyleEdges(_EdgeAnimation):
+    """Move edges *indices* to a new style bucket one after another, in order."""
+
+    def __init__(self, edges: EdgeCollection, indices, *, color=None, width=None, opacity=None, **kwargs) -> None:
+        self.restyle = {"color": color, "width": width, "opacity": opacity}
+        super().__init__(edges, indices, **kwargs)
+
+    def begin(self) -> None:
+        edges = self.mobject
+        self._before = edges.style[self.indices].copy()
+        edges.set_style(self.indices, **self.restyle)
+        self._after = edges.style[self.indices].copy()
+        edges._assign(self.indices, self._before)
+        self._done = 0
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        count = int(self.rate_func(alpha) * len(self.indices))
+        if count > self._done:
+            self.mobject._assign(self.indices[self._done : count], self._after[self._done : count])
+        elif count < self._done:
+            self.mobject._assign(self.indices[count : self._done], self._before[count : self._done])
+        self._done = count
+
+
+class MoveEdges(_EdgeAnimation):
+    """Slide edges *indices* to run from *starts* to *ends*."""
+
+    def __init__(self, edges: EdgeCollection, indices, starts, ends, **kwargs) -> None:
+        self.target_starts = np.asarray(starts, dtype=float)
+        self.target_ends = np.asarray(ends, dtype=float)
+        super().__init__(edges, indices, **kwargs)
+
+    def begin(self) -> None:
+        self._starts = self.mobject.starts[self.indices].copy()
+        self._ends = self.mobject.ends[self.indices].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        self.mobject._put_endpoints(
+            self.indices,
+            self._starts + (self.target_starts - self._starts) * alpha,
+            self._ends + (self.target_ends - self._ends) * alpha,
+        )
@@ -1,14 +1,17 @@
 """Shared helper functions extracted from the monolith."""
 from __future__ import annotations
 
-import os
 import numpy as np
 
+import hashlib
 import itertools
+import json
+import math
+import os
+from collections import defaultdict
 from pathlib import Path
-from typing import Sequence
+from typing import Hashable, Iterable, NamedTuple, Sequence
 
-from functools import lru_cache
 
 from manim import (
     Dot,
@@ -17,41 +20,219 @@ from manim import (
     Group,
     ImageMobject,
     Line,
+    Mobject,
     Scene,
     VGroup,
+    config,
+    interpolate,
 )
-from .config import EDGE_WIDTH, NODE_RADIUS_IMAGE, COLORS
+from .assets import AssetIndex, image_cache
+from .config import ASSET_GROUPS, CACHE_DIR, EDGE_WIDTH, NODE_RADIUS_IMAGE, NODE_THUMBNAILS, COLORS
 
 # --------------------------------------------------------------------------- #
-#   Assets directory – PNGs named exactly like node labels
+#   Assets directory – PNGs named like node labels, optionally in group folders
 # --------------------------------------------------------------------------- #
 _ASSETS_DIR = Path(__file__).with_suffix("").parent / "assets"
+_ASSET_INDEX = AssetIndex([_ASSETS_DIR, *(_ASSETS_DIR / group for group in ASSET_GROUPS)])
+
+
+class CachedImageMobject(ImageMobject):
+    """:class:`ImageMobject` drawing a pixel buffer owned by :data:`image_cache`.
+
+    ``ImageMobject`` copies any array it is given; this subclass keeps a
+    reference instead, so every node built from the same asset and size
+    shares one decoded, read-only buffer.  Copies (``.copy()``, animation
+    targets) share it too.  A node gets a private copy only when it is
+    tinted (:meth:`set_color`, :meth:`set_opacity`, :meth:`fade`), and
+    colour interpolation hands the shared buffer back once it is reached.
+    """
+
+    def __init__(self, pixels: np.ndarray, **kwargs):
+        # Initialise on a 1×1 slice (copied), then swap in the shared buffer.
+        super().__init__(pixels[:1, :1], **kwargs)
+        self.pixel_array = pixels
+        self.reset_points()
+
+    def __deepcopy__(self, memo):
+        if not self.pixel_array.flags.writeable:
+            memo[id(self.pixel_array)] = self.pixel_array  # shared, not copied
+        return super().__deepcopy__(memo)
+
+    def _own_pixels(self) -> None:
+        """Copy the shared buffer before writing to it."""
+        if not self.pixel_array.flags.writeable:
+            self.pixel_array = self.pixel_array.copy()
+
+    def set_color(self, color, alpha=None, family=True):
+        self._own_pixels()
+        return super().set_color(color, alpha, family)
+
+    def set_opacity(self, alpha: float):
+        self._own_pixels()
+        return super().set_opacity(alpha)
+
+    def interpolate_color(self, mobject1, mobject2, alpha: float) -> None:
+        a, b = mobject1.pixel_array, mobject2.pixel_array
+        shared = a if a is b or alpha <= 0 else b if alpha >= 1 else None
+        if shared is None or shared.flags.writeable:
+            super().interpolate_color(mobject1, mobject2, alpha)
+            return
+        self.fill_opacity = interpolate(mobject1.fill_opacity, mobject2.fill_opacity, alpha)
+        self.stroke_opacity = interpolate(mobject1.stroke_opacity, mobject2.stroke_opacity, alpha)
+        self.pixel_array = shared
+
+
+def thumbnail_diameter(radius: float) -> int:
+    """Pixel diameter of a node of *radius* at the active quality."""
+    return max(1, math.ceil(2 * radius * config.pixel_height / config.frame_height))
+
+
+def asset_path(label: str) -> Path | None:
+    """Return the portrait file for node *label*, or ``None`` without one."""
+    return _ASSET_INDEX.get(label)
+
+
+def warm_assets() -> int:
+    """Scan (or load the manifest of) the assets directory now; return the portrait count.
+
+    Call before forking workers so they share the index instead of each
+    scanning the folders.
+    """
+    return len(_ASSET_INDEX)
+
+
+def preload_images(
+    labels: Iterable[str], radius: float = NODE_RADIUS_IMAGE, *, workers: int | None = None
+) -> int:
+    """Decode the portraits of *labels* into :data:`image_cache` on a thread pool.
+
+    Nodes of *radius* built afterwards by :func:`circular_image_node`, at
+    the same quality, then never wait on disk.  Labels without a portrait
+    are skipped.  Returns the number of distinct images loaded.
+    """
+    diameter = thumbnail_diameter(radius) if NODE_THUMBNAILS else None
+    paths = {path for path in map(_ASSET_INDEX.get, labels) if path is not None}
+    return image_cache.preload(((path, diameter) for path in sorted(paths)), workers=workers)
 
 
 def circular_image_node(label: str, radius: float = NODE_RADIUS_IMAGE) -> ImageMobject:
-    """Return a circular node wrapping ``assets/{label}.png`` (fallback Dot)."""
-    path = _ASSETS_DIR / f"{label}.png"
-    if path.exists():
-        img = ImageMobject(str(path), z_index=1)
+    """Return a circular node wrapping ``assets/[group/]{label}.png`` (fallback Dot).
+
+    With :data:`~network_manim.config.NODE_THUMBNAILS` on, the portrait is
+    cropped to a circle and downsampled to its on-screen size once (see
+    :func:`~network_manim.assets.make_thumbnail`) instead of carrying the full
+    resolution image into every frame.
+    """
+    path = _ASSET_INDEX.get(label)
+    if path is not None:
+        diameter = thumbnail_diameter(radius) if NODE_THUMBNAILS else None
+        img = CachedImageMobject(image_cache.get(path, diameter), z_index=1)
         img.height = 2 * radius
-        # thin stroke so edges overlap neatly
-        img.set_stroke(width=1, opacity=1)
         return img
 
     # Fallback – plain dot with colour from the palette or white
     return Dot(radius=radius, color=COLORS.get(label, "WHITE"), z_index=1)
 
 
+# --------------------------------------------------------------------------- #
+#   Node replacement (e.g. image nodes → plain dots)
+# --------------------------------------------------------------------------- #
+
+class ReplacementMap:
+    """Mapping from old node mobjects to their replacements with O(1) lookups.
+
+    A lookup tries, in order, the identity of the old mobject, its stable
+    node *key* (when one was given to :meth:`add`), and finally the node's
+    centre in a spatial hash quantised to *tol*.  Two replacements registered
+    within *tol* of each other make a positional lookup there ambiguous; that
+    raises :class:`ValueError` instead of silently picking one.
+    """
+
+    def __init__(self, pairs: Iterable[tuple[Mobject, Mobject]] = (), *, tol: float = 1e-6):
+        self.tol = tol
+        self._by_id: dict[int, tuple[Mobject, Mobject]] = {}
+        self._by_key: dict[Hashable, Mobject] = {}
+        self._cells: dict[tuple[int, ...], list[tuple[np.ndarray, Mobject]]] | None = None
+        for old, new in pairs:
+            self.add(old, new)
+
+    def add(self, old: Mobject, new: Mobject, *, key: Hashable | None = None) -> None:
+        """Register *new* as the replacement of *old* (and of node *key*)."""
+        # Keep *old* alive alongside its id so the id cannot be recycled.
+        self._by_id[id(old)] = (old, new)
+        if key is not None:
+            self._by_key[key] = new
+        self._cells = None  # rebuilt lazily on the next positional lookup
+
+    def get(self, mob: Mobject, default=None, *, key: Hashable | None = None):
+        """Return the replacement of *mob* (or node *key*), else *default*."""
+        hit = self._by_id.get(id(mob))
+        if hit is not None:
+            return hit[1]
+        if key is not None and key in self._by_key:
+            return self._by_key[key]
+        return self._match_position(mob.get_center(), default)
+
+    def __getitem__(self, mob: Mobject) -> Mobject:
+        new = self.get(mob, _MISSING)
+        if new is _MISSING:
+            raise KeyError(mob)
+        return new
+
+    def __contains__(self, mob: Mobject) -> bool:
+        return self.get(mob, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def items(self):
+        return self._by_id.values()
+
+    def replace(self, mobs: Iterable[Mobject]) -> list[Mobject]:
+        """Return *mobs* with every replaceable entry swapped, in one pass."""
+        return [self.get(mob, mob) for mob in mobs]
+
+    # ------------------------------------------------------------------ #
+
+    def _cell(self, point: np.ndarray) -> tuple[int, ...]:
+        return tuple(int(v) for v in np.floor(point / self.tol))
+
+    def _match_position(self, center: np.ndarray, default):
+        if self._cells is None:
+            self._cells = defaultdict(list)
+            for old, new in self._by_id.values():
+                point = old.get_center()
+                self._cells[self._cell(point)].append((point, new))
+
+        bx, by, bz = self._cell(center)
+        matches = []
+        for dx, dy, dz in _NEIGHBOUR_OFFSETS:
+            for point, new in self._cells.get((bx + dx, by + dy, bz + dz), ()):
+                if np.max(np.abs(point - center)) <= self.tol and all(
+                    new is not m for m in matches
+                ):
+                    matches.append(new)
+        if len(matches) > 1:
+            raise ValueError(
+                f"{len(matches)} replacement nodes overlap at {center}; "
+                "look them up by identity or node key instead"
+            )
+        return matches[0] if matches else default
+
+
+_MISSING = object()
+_NEIGHBOUR_OFFSETS = tuple(itertools.product((-1, 0, 1), repeat=3))
+
+
 def replace_dot_list(dot_list, replacement_map):
-    new_list = []
-    for dot in dot_list:
-        for old, new in replacement_map.items():
-            if np.allclose(dot.get_center(), old.get_center()):
-                new_list.append(new)
-                break
-        else:
-            new_list.append(dot)
-    return new_list
+    """Swap the entries of *dot_list* found in *replacement_map*.
+
+    *replacement_map* is a :class:`ReplacementMap` or a plain ``{old: new}``
+    dict; either way the cost is linear in the number of dots.
+    """
+    if not isinstance(replacement_map, ReplacementMap):
+        replacement_map = ReplacementMap(replacement_map.items())
+    return replacement_map.replace(dot_list)
 
 
 # Keep a reference to the original Dot for fallback
@@ -63,6 +244,78 @@ def CustomDot(label_or_pos, **kwargs):
     return OriginalDot(label_or_pos, **kwargs)
 
 
+def edge_endpoints(
+    positions: np.ndarray, edges: np.ndarray, trim: float | np.ndarray = 0.0
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return the ``(E, 3)`` start and end points of *edges*, trimmed at both ends.
+
+    *edges* is an ``(E, 2)`` index array into the ``(N, 3)`` *positions*.
+    *trim* is one radius for every node or an ``(N,)`` array of per-node
+    radii.  Edges shorter than their two trims meet at the point between
+    the node borders; zero-length edges collapse onto their node.
+    """
+    edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    a = positions[edges[:, 0]]
+    b = positions[edges[:, 1]]
+    delta = b - a
+    length = np.linalg.norm(delta, axis=1, keepdims=True)
+    unit = np.divide(delta, length, out=np.zeros_like(delta), where=length > 0)
+
+    trim = np.asarray(trim, dtype=float)
+    if trim.ndim:
+        trim_a, trim_b = trim[edges[:, 0], None], trim[edges[:, 1], None]
+    else:
+        trim_a = trim_b = np.full_like(length, trim)
+    total = trim_a + trim_b
+    scale = np.divide(length, total, out=np.ones_like(length), where=total > length)
+    return a + unit * trim_a * scale, b - unit * trim_b * scale
+
+
+def lines_between(
+    starts: np.ndarray,
+    ends: np.ndarray,
+    *,
+    color: str = "WHITE",
+    width: float = EDGE_WIDTH,
+    opacity: float = 1.0,
+) -> list[Line]:
+    """Return one :class:`~manim.mobject.geometry.line.Line` per ``starts[k]``–``ends[k]``.
+
+    The Bézier points of every line are computed in one numpy pass and set
+    on copies of a single styled template, skipping ``Line``'s per-instance
+    set-up.
+    """
+    template = Line(stroke_color=color, stroke_width=width, stroke_opacity=opacity, z_index=0)
+    t = np.linspace(0, 1, template.n_points_per_cubic_curve)[None, :, None]
+    points = starts[:, None, :] + (ends - starts)[:, None, :] * t  # (E, 4, 3)
+
+    lines = []
+    for start, end, pts in zip(starts, ends, points):
+        line = template.copy()
+        line.start, line.end = start, end
+        line.points = pts
+        lines.append(line)
+    return lines
+
+
+def build_edges(
+    positions: np.ndarray,
+    edges: np.ndarray,
+    *,
+    trim: float | np.ndarray = 0.0,
+    color: str = "WHITE",
+    width: float = EDGE_WIDTH,
+    opacity: float = 1.0,
+) -> VGroup:
+    """Return the :class:`VGroup` of straight edges *edges* between *positions*.
+
+    *edges* is an ``(E, 2)`` index array into the ``(N, 3)`` *positions*;
+    see :func:`edge_endpoints` for *trim*.
+    """
+    starts, ends = edge_endpoints(positions, edges, trim)
+    return VGroup(*lines_between(starts, ends, color=color, width=width, opacity=opacity))
+
+
 def build_edge(
     n1: VGroup,
     n2: VGroup,
@@ -72,15 +325,9 @@ def build_edge(
     buff: float | None = None,
 ) -> Line:
     """Return a straight edge connecting centers of *n1* and *n2*."""
-    line = Line(
-        n1.get_center(),
-        n2.get_center(),
-        buff=buff if buff is not None else n1.width * 0.5,
-        stroke_color=color,
-        stroke_width=width,
-        z_index=0,
-    )
-    return line
+    positions = np.array([n1.get_center(), n2.get_center()])
+    trim = buff if buff is not None else n1.width * 0.5
+    return build_edges(positions, [[0, 1]], trim=trim, color=color, width=width)[0]
 
 
 def build_clique(
@@ -90,10 +337,398 @@ def build_clique(
     width: float = EDGE_WIDTH,
 ) -> VGroup:
     """Fully connect *nodes* and return the :class:`~manim.mobject.types.VGroup` of edges."""
-    edges = VGroup(
-        *(build_edge(a, b, color=color, width=width) for a, b in itertools.combinations(nodes, 2))
-    )
-    return edges
+    positions = np.array([node.get_center() for node in nodes]).reshape(-1, 3)
+    radii = np.array([node.width * 0.5 for node in nodes])
+    pairs = np.array(list(itertools.combinations(range(len(nodes)), 2)), dtype=np.intp)
+    return build_edges(positions, pairs, trim=radii, color=color, width=width)
+
+
+# --------------------------------------------------------------------------- #
+#   Typed edges (adjacency-matrix lookups)
+# --------------------------------------------------------------------------- #
+
+class EdgeTypeIndex:
+    """Undirected typed edges with O(1) membership tests.
+
+    Nodes may be any hashable (mobjects, labels, …); each is interned to an
+    integer ID on first sight and an unordered pair is stored once under
+    ``(min_id, max_id)``.  When a pair is added with several types the
+    smallest one wins, matching a type-1-first search over separate lists.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[Hashable, int] = {}
+        self._types: dict[tuple[int, int], int] = {}
+
+    def node_id(self, node: Hashable) -> int:
+        """Return the integer ID of *node*, assigning the next free one."""
+        return self._ids.setdefault(node, len(self._ids))
+
+    def add(self, a: Hashable, b: Hashable, etype: int) -> None:
+        i, j = self.node_id(a), self.node_id(b)
+        key = (i, j) if i <= j else (j, i)
+        current = self._types.get(key)
+        if current is None or etype < current:
+            self._types[key] = etype
+
+    def add_edges(self, pairs: Iterable[tuple[Hashable, Hashable]], etype: int) -> None:
+        for a, b in pairs:
+            self.add(a, b, etype)
+
+    def lookup(self, a: Hashable, b: Hashable) -> int | None:
+        """Return the type of edge *a*–*b*, or ``None`` when there is none."""
+        i, j = self._ids.get(a), self._ids.get(b)
+        if i is None or j is None:
+            return None
+        return self._types.get((i, j) if i <= j else (j, i))
+
+    def __contains__(self, pair: tuple[Hashable, Hashable]) -> bool:
+        return self.lookup(*pair) is not None
+
+    def __len__(self) -> int:
+        return len(self._types)
+
+    def matrix(self, nodes: Sequence[Hashable]) -> np.ndarray:
+        """Return the symmetric ``(m, m)`` int8 typed adjacency of *nodes*.
+
+        Cell ``[r, c]`` holds the edge type between ``nodes[r]`` and
+        ``nodes[c]`` or 0 when they are not linked.  The cost is O(E + m).
+        """
+        m = len(nodes)
+        out = np.zeros((m, m), dtype=np.int8)
+        if not self._types:
+            return out
+
+        position = np.full(len(self._ids), -1, dtype=np.intp)
+        for k, node in enumerate(nodes):
+            node_id = self._ids.get(node)
+            if node_id is None:
+                continue
+            if position[node_id] >= 0:
+                raise ValueError(f"node {node!r} appears twice in the matrix order")
+            position[node_id] = k
+
+        pairs = np.array(list(self._types), dtype=np.intp)
+        types = np.fromiter(self._types.values(), dtype=np.int8, count=len(self._types))
+        rows, cols = position[pairs[:, 0]], position[pairs[:, 1]]
+        keep = (rows >= 0) & (cols >= 0)
+        out[rows[keep], cols[keep]] = types[keep]
+        out[cols[keep], rows[keep]] = types[keep]
+        return out
+
+
+# --------------------------------------------------------------------------- #
+#   Force-directed layout (Barnes–Hut)
+# --------------------------------------------------------------------------- #
+
+def _barnes_hut_repulsion(p: np.ndarray, theta: float, max_depth: int) -> np.ndarray:
+    """Sum over all other nodes of ``(p_i - p_j) / |p_i - p_j|²``, approximated.
+
+    A quadtree over the ``(N, 2)`` points *p* is built level by level, the
+    cell masses and centres of mass of each level with one ``bincount``.
+    The tree is then walked for all nodes at once: a frontier of
+    ``(node, cell)`` pairs either takes a cell whole, when it does not hold
+    the node and is smaller than *theta* times its distance, or opens it
+    into its non-empty children; the deepest cells left open are summed
+    node by node.  Each node meets O(log N) cells, so the whole sum costs
+    O(N log N) instead of O(N²).
+    """
+    n = len(p)
+    low = p.min(axis=0)
+    size = max(float((p.max(axis=0) - low).max()), 1e-12) * (1 + 1e-9)
+    # About four nodes per deepest cell
+    depth = int(min(max_depth, max(1, math.ceil(math.log2(n) / 2))))
+
+    cells, masses, centres = [], [], []
+    for level in range(depth + 1):
+        side = 1 << level
+        xy = np.minimum(((p - low) * (side / size)).astype(np.intp), side - 1)
+        cell = xy[:, 0] * side + xy[:, 1]
+        mass = np.bincount(cell, minlength=side * side).astype(float)
+        centre = np.stack([np.bincount(cell, weights=p[:, k], minlength=side * side) for k in (0, 1)], axis=1)
+        centre /= np.maximum(mass, 1)[:, None]
+        cells.append(cell)
+        masses.append(mass)
+        centres.append(centre)
+
+    force = np.zeros_like(p)
+
+    def add(node, delta, weight):
+        for k in (0, 1):
+            force[:, k] += np.bincount(node, weights=delta[:, k] * weight, minlength=n)
+
+    node = np.arange(n)
+    cell = np.zeros(n, dtype=np.intp)
+    for level in range(depth + 1):
+        mass = masses[level][cell]
+        delta = p[node] - centres[level][cell]
+        dist2 = np.einsum("ij,ij->i", delta, delta)
+        own = cells[level][node] == cell
+        far = ~own & ((size / (1 << level)) ** 2 < theta * theta * dist2)
+        add(node[far], delta[far], mass[far] / dist2[far])
+        node, cell = node[~far], cell[~far]
+        if level == depth:
+            break
+        # Open the near cells into their non-empty children
+        side = 1 << level
+        x, y = np.divmod(cell, side)
+        children = np.stack(
+            [(2 * x + dx) * (2 * side) + 2 * y + dy for dx in (0, 1) for dy in (0, 1)], axis=1
+        ).reshape(-1)
+        node = np.repeat(node, 4)
+        keep = masses[level + 1][children] > 0
+        node, cell = node[keep], children[keep]
+
+    # Near deepest cells: node by node, with the members of each cell
+    order = np.argsort(cells[depth], kind="stable")
+    first = np.concatenate([[0], np.cumsum(masses[depth])]).astype(np.intp)
+    count = first[cell + 1] - first[cell]
+    rank = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    other = order[np.repeat(first[cell], count) + rank]
+    node = np.repeat(node, count)
+    delta = p[node] - p[other]
+    dist2 = np.einsum("ij,ij->i", delta, delta)
+    apart = dist2 > 0
+    add(node[apart], delta[apart], 1 / dist2[apart])
+    return force
+
+
+def force_layout(
+    n: int,
+    edges=(),
+    *,
+    initial: np.ndarray | None = None,
+    iterations: int = 100,
+    k: float = 1.0,
+    gravity: float = 0.1,
+    temperature: float | None = None,
+    theta: float = 0.8,
+    seed: int = 0,
+    max_depth: int = 10,
+) -> np.ndarray:
+    """``(N, 3)`` Fruchterman–Reingold positions of *n* nodes linked by *edges*.
+
+    *edges* is an ``(E, 2)`` index array; *k* is the ideal distance
+    between nodes, in the units of the result, which can go straight to
+    :func:`build_edges` or back in as *initial*.  Repulsion between all
+    pairs is approximated with a Barnes–Hut quadtree (opening angle
+    *theta*, see :func:`_barnes_hut_repulsion`), so an iteration costs
+    O(N log N); a weak *gravity* towards the origin keeps disconnected
+    parts close.
+
+    Without *initial* the nodes start at random (from *seed*) in a square
+    of side ``k * sqrt(n)``.  With *initial*, an ``(N, 2)`` or ``(N, 3)``
+    earlier layout, the nodes start there and the step size (*temperature*,
+    cooled linearly to zero) defaults to *k* instead of a tenth of the
+    square, so successive layouts of an evolving graph stay stable.
+    """
+    edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    out = np.zeros((n, 3))
+    if n < 2:
+        return out
+    if initial is None:
+        side = k * math.sqrt(n)
+        p = np.random.default_rng(seed).uniform(-side / 2, side / 2, (n, 2))
+        start = 0.1 * side
+    else:
+        p = np.array(initial, dtype=float)[:, :2]
+        if len(p) != n:
+            raise ValueError(f"initial layout has {len(p)} nodes, expected {n}")
+        start = k
+    if temperature is not None:
+        start = temperature
+
+    a, b = edges.T
+    for step in range(iterations):
+        # Repulsion k²/d between all pairs, attraction d²/k along the edges
+        shift = k * k * _barnes_hut_repulsion(p, theta, max_depth) - gravity * p
+        delta = p[a] - p[b]
+        pull = delta * (np.linalg.norm(delta, axis=1) / k)[:, None]
+        for axis in (0, 1):
+            shift[:, axis] += np.bincount(b, weights=pull[:, axis], minlength=n)
+            shift[:, axis] -= np.bincount(a, weights=pull[:, axis], minlength=n)
+        length = np.linalg.norm(shift, axis=1)
+        limit = start * (1 - step / iterations)
+        p += shift * (np.minimum(length, limit) / np.maximum(length, 1e-12))[:, None]
+    out[:, :2] = p
+    return out
+
+
+# --------------------------------------------------------------------------- #
+#   Community layout: packed circles, nodes on a circle or force-placed
+# --------------------------------------------------------------------------- #
+
+_LAYOUT_VERSION = 2  # bump when the layout recipe changes, to retire cached layouts
+_GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+LAYOUT_METHODS = ("circle", "force")
+
+
+class CommunityLayout(NamedTuple):
+    """Where :func:`community_layout` put *k* communities and their *N* nodes."""
+
+    community: np.ndarray  # (N,) community of every node
+    centers: np.ndarray    # (k, 3)
+    radii: np.ndarray      # (k,)
+    offsets: np.ndarray    # (N, 3) node offsets from their centre, within the unit disk
+
+    @property
+    def positions(self) -> np.ndarray:
+        """``(N, 3)`` node positions."""
+        return self.centers[self.community] + self.radii[self.community, None] * self.offsets
+
+
+def community_radius(sizes, *, within: str = "circle", spacing: float = 0.9) -> np.ndarray:
+    """Radius of a community of each size in *sizes*, nodes *spacing* apart.
+
+    On a circle the neighbours are a chord of *spacing* apart; a force
+    layout fills a disk, whose area grows with the node count.
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    if within == "circle":
+        radii = spacing / (2 * np.sin(np.pi / np.maximum(sizes, 2)))
+    else:
+        radii = 0.6 * spacing * np.sqrt(sizes)
+    return np.where(sizes < 2, 0.0, radii)
+
+
+def pack_circles(radii, *, gap: float = 0.6, seed: int = 0, iterations: int = 2000) -> np.ndarray:
+    """``(k, 2)`` centres of non-overlapping circles of *radii*, packed round the origin.
+
+    The circles start on a golden-angle spiral, largest innermost, and
+    then relax, all pairs at once: each step pushes every overlapping pair
+    apart while, for the first 100 steps, a gentle pull towards the origin
+    closes the gaps.  The circles end (within 1e-4 of the largest radius)
+    at least *gap* apart.  The result is centred on its bounding box.
+    """
+    r = np.asarray(radii, dtype=float).reshape(-1) + gap / 2
+    k = len(r)
+    if k < 2:
+        return np.zeros((k, 2))
+    rng = np.random.default_rng(seed)
+    t = np.arange(k)
+    angle = t * _GOLDEN_ANGLE + rng.uniform(0, 2 * np.pi)
+    distance = 2 * r.mean() * np.sqrt(t)
+    p = np.empty((k, 2))
+    p[np.argsort(-r, kind="stable")] = distance[:, None] * np.stack([np.cos(angle), np.sin(angle)], axis=1)
+    p += rng.normal(scale=1e-3 * r.mean(), size=p.shape)  # no two centres coincide
+
+    reach = r[:, None] + r[None, :]
+    np.fill_diagonal(reach, 0.0)
+    tol = 1e-4 * r.max()
+    for step in range(iterations):
+        pulling = step < 100
+        if pulling:
+            p *= 0.995
+        dx = p[:, 0, None] - p[None, :, 0]
+        dy = p[:, 1, None] - p[None, :, 1]
+        distance = np.hypot(dx, dy)
+        overlap = np.clip(reach - distance, 0.0, None)
+        if not pulling and overlap.max() <= tol:
+            break
+        # Both circles of a pair move apart; slightly over-relaxed to converge faster
+        push = 0.6 * np.divide(overlap, distance, out=np.zeros_like(distance), where=distance > 0)
+        p[:, 0] += (push * dx).sum(axis=1)
+        p[:, 1] += (push * dy).sum(axis=1)
+
+    low, high = (p - r[:, None]).min(axis=0), (p + r[:, None]).max(axis=0)
+    return p - (low + high) / 2
+
+
+def _circle_offsets(rank: np.ndarray, size: np.ndarray) -> np.ndarray:
+    angle = 2 * np.pi * rank / np.maximum(size, 1)
+    return np.stack([np.cos(angle), np.sin(angle), np.zeros_like(angle)], axis=1)
+
+
+def _force_offsets(n: int, edges: np.ndarray, seed: int) -> np.ndarray:
+    """Force layout of *n* nodes linked by local *edges*, scaled into the unit disk."""
+    out = force_layout(n, edges, seed=seed)
+    out -= out.mean(axis=0)
+    reach = np.linalg.norm(out, axis=1).max() if n else 0.0
+    return out / reach if reach > 0 else out
+
+
+def _layout_key(community, edges, radii, **params) -> str:
+    digest = hashlib.sha256()
+    for array in (community, edges, np.round(radii, 9)):
+        digest.update(np.ascontiguousarray(array).tobytes())
+        digest.update(b"\0")
+    digest.update(json.dumps(dict(params, version=_LAYOUT_VERSION), sort_keys=True).encode())
+    return digest.hexdigest()[:32]
+
+
+def community_layout(
+    community,
+    edges=(),
+    *,
+    radii=None,
+    within: str = "circle",
+    spacing: float = 0.9,
+    gap: float = 0.6,
+    seed: int = 0,
+    cache: bool = True,
+    cache_dir: str | Path | None = None,
+) -> CommunityLayout:
+    """Lay out nodes grouped into communities: packed circles, nodes inside each.
+
+    *community* gives the community (``0 … k-1``) of every node and *edges*
+    is an ``(E, 2)`` index array.  Each community is a circle of its
+    *radii* (default: :func:`community_radius` of its size), packed with
+    :func:`pack_circles`; its nodes sit evenly on that circle, in node
+    order, or *within* ``"force"`` are placed by :func:`force_layout` from the edges inside
+    the community.
+
+    Layouts are cached on disk (default: under
+    :data:`~network_manim.config.CACHE_DIR`), keyed by a hash of the
+    graph, the parameters and *seed*, so re-renders and parallel workers
+    load them instead of recomputing.
+    """
+    if within not in LAYOUT_METHODS:
+        raise ValueError(f"unknown layout {within!r}, expected one of {LAYOUT_METHODS}")
+    community = np.asarray(community, dtype=np.intp).reshape(-1)
+    edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+    sizes = np.bincount(community, minlength=community.max() + 1 if len(community) else 0)
+    radii = community_radius(sizes, within=within, spacing=spacing) if radii is None else np.asarray(radii, dtype=float)
+    if len(radii) != len(sizes):
+        raise ValueError(f"{len(sizes)} communities but {len(radii)} radii")
+
+    path = None
+    if cache:
+        key = _layout_key(community, edges, radii, within=within, spacing=spacing, gap=gap, seed=seed)
+        path = Path(cache_dir) if cache_dir is not None else CACHE_DIR / "layouts"
+        path = path / f"{key}.npz"
+        if path.exists():
+            with np.load(path) as data:
+                return CommunityLayout(community, data["centers"], data["radii"], data["offsets"])
+
+    centers = np.zeros((len(sizes), 3))
+    centers[:, :2] = pack_circles(radii, gap=gap, seed=seed)
+    # Rank of every node within its community, in node order
+    order = np.argsort(community, kind="stable")
+    start = np.concatenate([[0], np.cumsum(sizes)])
+    rank = np.empty_like(community)
+    rank[order] = np.arange(len(community)) - start[community[order]]
+    if within == "circle":
+        offsets = _circle_offsets(rank, sizes[community])
+    else:
+        offsets = np.zeros((len(community), 3))
+        a, b = edges.T
+        inside = edges[community[a] == community[b]]
+        of_edge = community[inside[:, 0]]
+        for c in np.flatnonzero(sizes):
+            members = order[start[c]:start[c + 1]]
+            offsets[members] = _force_offsets(len(members), rank[inside[of_edge == c]], seed)
+    layout = CommunityLayout(community, centers, radii, offsets)
+
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as fh:
+                np.savez(fh, centers=centers, radii=radii, offsets=offsets)
+            os.replace(tmp, path)
+        except OSError:
+            pass  # read-only cache dir: the layout is computed every time
+    return layout
 
 
 # --------------------------------------------------------------------------- #
@@ -0,0 +1,236 @@
+"""Node labels drawn from a glyph atlas instead of one ``Text`` per node."""
+from __future__ import annotations
+
+import hashlib
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+from manim import UP, WHITE, Animation, ManimColor, config, interpolate
+from manim.mobject.types.image_mobject import AbstractImageMobject
+from manim.utils.color import ParsableManimColor
+from PIL import Image, ImageDraw, ImageFont
+
+
+class GlyphAtlas:
+    """The glyphs of *chars*, rasterised once at *pixels* size into one alpha strip.
+
+    *font* is a TrueType/OpenType file (default: Pillow's bundled font).
+    :meth:`sprite` lays a string out as quads copied from the strip, placed
+    by advance width; there is no kerning or shaping.
+    """
+
+    def __init__(self, chars: Iterable[str], pixels: int, font: Optional[str] = None) -> None:
+        self.font = ImageFont.load_default(size=pixels) if font is None else ImageFont.truetype(font, pixels)
+        ascent, descent = self.font.getmetrics()
+        self.height = ascent + descent
+        #: char -> (x in the strip, width, left bearing, advance), in pixels
+        self.quads: dict[str, tuple[int, int, int, float]] = {}
+
+        chars = sorted(set(chars))
+        boxes = [self.font.getbbox(char) for char in chars]
+        widths = [max(right - left, 0) for left, _, right, _ in boxes]
+        # One blank column between glyphs keeps their edges apart
+        strip = Image.new("L", (max(sum(widths) + len(chars), 1), self.height), 0)
+        draw = ImageDraw.Draw(strip)
+        x = 0
+        for char, (left, *_), width in zip(chars, boxes, widths):
+            draw.text((x - left, 0), char, font=self.font, fill=255)
+            self.quads[char] = (x, width, left, self.font.getlength(char))
+            x += width + 1
+        self.pixels = np.array(strip)
+
+    def sprite(self, string: str) -> np.ndarray:
+        """The ``(height, width)`` uint8 coverage of *string*."""
+        pen, placed = 0.0, []
+        for char in string:
+            x, width, left, advance = self.quads[char]
+            placed.append((x, width, round(pen) + left))
+            pen += advance
+        start = min((dst for _, _, dst in placed), default=0)
+        end = max((dst + width for _, width, dst in placed), default=0)
+        out = np.zeros((self.height, max(end - start, 1)), dtype=np.uint8)
+        for x, width, dst in placed:
+            region = out[:, dst - start:dst - start + width]
+            np.maximum(region, self.pixels[:, x:x + width], out=region)
+        return out
+
+
+class AtlasLabels(AbstractImageMobject):
+    """Labels of many nodes drawn as one frame-sized image from a :class:`GlyphAtlas`.
+
+    ``labels[i]`` (``None`` for no label) sits next to the node centred at
+    ``positions[i]``, towards *direction* (one vector or one per node) and
+    *buff* beyond *radius*, like ``Text(label).next_to(dot, direction, buff)``.
+    *size* is the em height in scene units.  *positions* is kept by
+    reference: given a :class:`~network_manim.layout.NodeLayout`'s
+    ``positions``, the labels follow every move without being touched.
+
+    Each label is laid out once, from atlas quads, into a list of covered
+    pixels.  A frame clears the pixels written last time and scatters the
+    visible labels' pixels at their nodes, in a few numpy operations, so
+    it costs the same per label whatever the graph size, and nothing per
+    hidden label.  Labels start hidden (see :class:`ShowLabels` and
+    :attr:`alphas`); the image covers the frame of a camera that does not
+    move.
+    """
+
+    def __init__(
+        self,
+        labels: Sequence[Optional[str]],
+        positions: np.ndarray,
+        *,
+        size: float = 0.2,
+        direction: np.ndarray = UP,
+        buff: float = 0.1,
+        radius: float = 0.0,
+        color: ParsableManimColor = WHITE,
+        font: Optional[str] = None,
+        **kwargs,
+    ) -> None:
+        n = len(positions)
+        if len(labels) != n:
+            raise ValueError(f"{len(labels)} labels for {n} positions")
+        self.positions = positions
+        #: Opacity of each label, 0 for hidden
+        self.alphas = np.zeros(n)
+        self.opacity = 1.0
+        ppu = config.pixel_height / config.frame_height
+        self.atlas = GlyphAtlas("".join(filter(None, labels)), max(6, round(size * ppu)), font)
+
+        # Covered pixels of label i are _dy/_dx/_coverage[_indptr[i]:_indptr[i + 1]],
+        # relative to _corners[i], the top left corner of its _sizes[i] box
+        # relative to the node
+        directions = np.broadcast_to(np.asarray(direction, dtype=float), (n, 3))
+        reach = (radius + buff) * ppu
+        self._corners = np.zeros((n, 2))
+        self._sizes = np.zeros((n, 2), dtype=np.intp)
+        dy, dx, coverage = [], [], []
+        for i, label in enumerate(labels):
+            sprite = self.atlas.sprite(label) if label else np.zeros((0, 0), dtype=np.uint8)
+            rows, cols = np.nonzero(sprite)
+            dy.append(rows)
+            dx.append(cols)
+            coverage.append(sprite[rows, cols])
+            h, w = self._sizes[i] = sprite.shape
+            right, up = directions[i, :2]
+            self._corners[i] = (right * (reach + w / 2) - w / 2, -up * (reach + h / 2) - h / 2)
+        counts = [len(rows) for rows in dy]
+        self._indptr = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(counts, out=self._indptr[1:])
+        self._owner = np.repeat(np.arange(n), counts)
+        self._dy = np.concatenate([np.zeros(0, dtype=np.intp), *dy]).astype(np.intp)
+        self._dx = np.concatenate([np.zeros(0, dtype=np.intp), *dx]).astype(np.intp)
+        self._coverage = np.concatenate([np.zeros(0, dtype=np.uint8), *coverage])
+
+        self.pixel_array = np.zeros((config.pixel_height, config.pixel_width, 4), dtype=np.uint8)
+        self.pixel_array[..., :3] = ManimColor(color).to_int_rgb()
+        # Offsets of the alpha bytes of each covered pixel in the flat buffer
+        self._offsets = (self._dy * config.pixel_width + self._dx) * 4 + 3
+        self._written = np.zeros(0, dtype=np.intp)
+        super().__init__(scale_to_resolution=config.pixel_height, **kwargs)
+        self._update_digest()
+
+    def __deepcopy__(self, memo):
+        # Animation copies share the positions and the laid out labels
+        for shared in (self.positions, self.atlas, self._indptr, self._dy, self._dx, self._coverage, self._offsets, self._owner):
+            memo[id(shared)] = shared
+        return super().__deepcopy__(memo)
+
+    def reset_points(self) -> None:
+        """The corners of the camera frame (UL, UR, DL, DR), so pixels map one to one."""
+        w, h = config.frame_width / 2, config.frame_height / 2
+        self.points = np.array([[-w, h, 0], [w, h, 0], [-w, -h, 0], [w, -h, 0]], dtype=float)
+
+    def get_pixel_array(self) -> np.ndarray:
+        flat = self.pixel_array.reshape(-1)
+        flat[self._written] = 0
+
+        visible = np.flatnonzero(self.alphas > 0)
+        height, width = self.pixel_array.shape[:2]
+        ppu = height / config.frame_height
+        corners = self._corners[visible]
+        cols = np.rint(self.positions[visible, 0] * ppu + width / 2 + corners[:, 0]).astype(np.intp)
+        rows = np.rint(height / 2 - self.positions[visible, 1] * ppu + corners[:, 1]).astype(np.intp)
+        h, w = self._sizes[visible].T
+        inside = (rows >= 0) & (cols >= 0) & (rows + h <= height) & (cols + w <= width)
+        partly = ~inside & (rows < height) & (cols < width) & (rows + h > 0) & (cols + w > 0)
+
+        base = (rows * width + cols) * 4
+        if len(visible) == len(self.alphas) and inside.all():
+            # Every label shown and in frame: no selection needed
+            idx, owner = slice(None), self._owner
+            targets = base[owner] + self._offsets
+        else:
+            # Labels wholly in frame: every pixel lands at a fixed offset from the corner
+            inside = np.flatnonzero(inside)
+            idx, owner = self._pixels(visible[inside])
+            owner = inside[owner]
+            targets = base[owner] + self._offsets[idx]
+            if partly.any():
+                # Labels across the frame edge: clipped pixel by pixel
+                partly = np.flatnonzero(partly)
+                clipped, part = self._pixels(visible[partly])
+                part = partly[part]
+                r = rows[part] + self._dy[clipped]
+                c = cols[part] + self._dx[clipped]
+                keep = (r >= 0) & (r < height) & (c >= 0) & (c < width)
+                idx = np.concatenate([idx, clipped[keep]])
+                owner = np.concatenate([owner, part[keep]])
+                targets = np.concatenate([targets, (r[keep] * width + c[keep]) * 4 + 3])
+
+        levels = np.clip(self.alphas[visible], 0, 1) * np.clip(self.opacity, 0, 1)
+        if np.all(levels == 1):
+            flat[targets] = self._coverage[idx]
+        else:
+            flat[targets] = np.rint(self._coverage[idx] * levels[owner]).astype(np.uint8)
+        self._written = targets
+        return self.pixel_array
+
+    def _pixels(self, labels: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Indices of the covered pixels of *labels*, and the position in *labels* of each one's label."""
+        begin, end = self._indptr[labels], self._indptr[labels + 1]
+        counts = end - begin
+        # Concatenate the CSR slices without a Python loop
+        owner = np.repeat(np.arange(len(labels)), counts)
+        return np.repeat(begin - np.cumsum(counts) + counts, counts) + np.arange(counts.sum()), owner
+
+    def set_opacity(self, alpha: float) -> AtlasLabels:
+        self.opacity = alpha
+        return self
+
+    def fade(self, darkness: float = 0.5, family: bool = True) -> AtlasLabels:
+        return self.set_opacity(1 - darkness)
+
+    def interpolate_color(self, mobject1, mobject2, alpha: float) -> None:
+        self.opacity = interpolate(mobject1.opacity, mobject2.opacity, alpha)
+
+    def _update_digest(self) -> None:
+        # Manim's play-call hash truncates large arrays; keep a full digest.
+        self.labels_digest = hashlib.sha1(
+            b"".join(a.tobytes() for a in (self.positions, self.alphas))
+        ).hexdigest()
+
+
+class ShowLabels(Animation):
+    """Fade labels *indices* of *labels* in (or out, with ``show=False``)."""
+
+    def __init__(self, labels: AtlasLabels, indices, *, show: bool = True, **kwargs) -> None:
+        self.indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        self.target = 1.0 if show else 0.0
+        super().__init__(labels, **kwargs)
+
+    def create_starting_mobject(self) -> AtlasLabels:
+        # The start is the alphas saved in begin(), not a copy.
+        return self.mobject
+
+    def begin(self) -> None:
+        self._starts = self.mobject.alphas[self.indices].copy()
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        self.mobject.alphas[self.indices] = self._starts + (self.target - self._starts) * alpha
+
+    def finish(self) -> None:
+        super().finish()
+        self.mobject._update_digest()
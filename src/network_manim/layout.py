@@ -0,0 +1,164 @@
+"""Array-backed node layouts whose edges follow their nodes."""
+from __future__ import annotations
+
+from typing import Optional, Sequence
+
+import numpy as np
+from manim import Animation, Group, Mobject
+
+from .edges import EdgeCollection
+from .graph_utils import edge_endpoints
+
+
+class NodeRecord:
+    """Node *index* of a :class:`NodeLayout`, with the mobjects drawing it."""
+
+    __slots__ = ("index", "name", "mobject", "label")
+
+    def __init__(self, index: int, name: str, mobject: Optional[Mobject] = None, label: Optional[Mobject] = None):
+        self.index = index
+        self.name = name
+        self.mobject = mobject
+        self.label = label
+
+    def __repr__(self) -> str:
+        return f"NodeRecord({self.index}, {self.name!r})"
+
+
+class NodeLayout:
+    """Node positions in one ``(N, 3)`` array, with a CSR index of incident edges.
+
+    *edges* is an ``(E, 2)`` index array and *radius* one trim radius or an
+    ``(N,)`` array of them.  When the layout owns an
+    :class:`~network_manim.edges.EdgeCollection` (*edge_mobject*), :meth:`move`
+    re-trims only the edges incident to the moved nodes, so moving *k* nodes
+    costs O(k + incident edges) whatever the size of the graph.  Mobjects
+    drawn straight from :attr:`positions` (e.g.
+    :class:`~network_manim.labels.AtlasLabels`) are registered with
+    :meth:`follow` instead of :meth:`attach`.
+    """
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        edges: np.ndarray,
+        *,
+        radius: float | np.ndarray = 0.0,
+        names: Optional[Sequence[str]] = None,
+        edge_mobject: Optional[EdgeCollection] = None,
+    ) -> None:
+        self.positions = np.array(positions, dtype=float).reshape(-1, 3)
+        self.edges = np.asarray(edges, dtype=np.intp).reshape(-1, 2)
+        n = len(self.positions)
+        self.radii = np.broadcast_to(np.asarray(radius, dtype=float), (n,)).copy()
+        names = names if names is not None else [str(i) for i in range(n)]
+        self.nodes = [NodeRecord(i, name) for i, name in enumerate(names)]
+
+        # CSR incidence: edges of node i are incident[indptr[i]:indptr[i + 1]]
+        ends = self.edges.reshape(-1)
+        order = np.argsort(ends, kind="stable")
+        self.incident = order // 2
+        self.indptr = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(np.bincount(ends, minlength=n), out=self.indptr[1:])
+
+        if edge_mobject is None:
+            edge_mobject = EdgeCollection(*self.endpoints())
+        elif edge_mobject.num_edges != len(self.edges):
+            raise ValueError(f"{edge_mobject.num_edges} edge mobjects for {len(self.edges)} edges")
+        self.edge_mobject = edge_mobject
+        self.followers: list[Mobject] = []
+
+    @classmethod
+    def from_spec(cls, spec, *, radius: float | np.ndarray = 0.0, **kwargs) -> NodeLayout:
+        """Layout of a :class:`~network_manim.spec.GraphSpec` at its final positions."""
+        return cls(spec.positions, spec.edges, radius=radius, names=spec.labels, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def incident_edges(self, indices) -> np.ndarray:
+        """Sorted ids of the edges touching any of nodes *indices*."""
+        indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        begin, end = self.indptr[indices], self.indptr[indices + 1]
+        counts = end - begin
+        # Concatenate the CSR slices without a Python loop
+        offsets = np.repeat(begin - np.cumsum(counts) + counts, counts)
+        return np.unique(self.incident[offsets + np.arange(counts.sum())])
+
+    def endpoints(self, edge_ids=None) -> tuple[np.ndarray, np.ndarray]:
+        """Trimmed ``(starts, ends)`` of edges *edge_ids* (default: all)."""
+        edges = self.edges if edge_ids is None else self.edges[edge_ids]
+        return edge_endpoints(self.positions, edges, self.radii)
+
+    def attach(self, i: int, mobject: Optional[Mobject], label: Optional[Mobject] = None) -> NodeRecord:
+        """Draw node *i* with *mobject* (and *label*), which then follow :meth:`move`."""
+        record = self.nodes[i]
+        record.mobject, record.label = mobject, label
+        return record
+
+    def follow(self, mobject: Mobject) -> Mobject:
+        """Redraw *mobject*, which reads :attr:`positions`, whenever nodes move.
+
+        Like the edge mobject, it keeps an ``edges_digest``-style hash of its
+        state up to date in ``_update_digest()``, called after every move.
+        """
+        self.followers.append(mobject)
+        return mobject
+
+    def move(self, indices, positions, *, edge_ids: Optional[np.ndarray] = None) -> NodeLayout:
+        """Move nodes *indices* to *positions*, with their mobjects and incident edges.
+
+        Labels keep their offset from the node.  Pass *edge_ids* (from
+        :meth:`incident_edges`) to skip the incidence lookup when moving the
+        same nodes every frame.
+        """
+        indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        positions = np.broadcast_to(np.asarray(positions, dtype=float), (len(indices), 3))
+        deltas = positions - self.positions[indices]
+        self.positions[indices] = positions
+        for i, delta in zip(indices, deltas):
+            record = self.nodes[i]
+            for mob in (record.mobject, record.label):
+                if mob is not None:
+                    mob.shift(delta)
+        if edge_ids is None:
+            edge_ids = self.incident_edges(indices)
+        if len(edge_ids):
+            self.edge_mobject._put_endpoints(edge_ids, *self.endpoints(edge_ids))
+        return self
+
+
+class MoveNodes(Animation):
+    """Slide nodes *indices* of *layout* to *positions*, their edges following.
+
+    Each frame interpolates the ``(k, 3)`` positions in one numpy step and
+    re-trims only the incident edges.
+    """
+
+    def __init__(self, layout: NodeLayout, indices, positions, **kwargs) -> None:
+        self.layout = layout
+        self.indices = np.asarray(indices, dtype=np.intp).reshape(-1)
+        self.targets = np.broadcast_to(np.asarray(positions, dtype=float), (len(self.indices), 3)).copy()
+        mobjects = [
+            mob for i in self.indices for mob in (layout.nodes[i].mobject, layout.nodes[i].label) if mob is not None
+        ]
+        super().__init__(Group(layout.edge_mobject, *layout.followers, *mobjects), **kwargs)
+
+    def create_starting_mobject(self) -> Mobject:
+        # Positions are interpolated from arrays saved in begin(), not a copy.
+        return self.mobject
+
+    def begin(self) -> None:
+        self._starts = self.layout.positions[self.indices].copy()
+        self._edge_ids = self.layout.incident_edges(self.indices)
+        super().begin()
+
+    def interpolate_mobject(self, alpha: float) -> None:
+        alpha = self.rate_func(alpha)
+        positions = self._starts + (self.targets - self._starts) * alpha
+        self.layout.move(self.indices, positions, edge_ids=self._edge_ids)
+
+    def finish(self) -> None:
+        super().finish()
+        for mob in (self.layout.edge_mobject, *self.layout.followers):
+            mob._update_digest()
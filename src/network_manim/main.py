@@ -30,6 +30,11 @@ if not SHOW_MESSAGES:
     from manim import logger
     logger.setLevel(logging.WARNING)
 
+# Label → portrait index over the group-based folders (scanned once, cached on disk)
+from network_manim.assets import AssetIndex, image_cache
+from network_manim.graph_utils import CachedImageMobject
+ASSET_INDEX = AssetIndex(["sds", "biostat", "stat", "mstat", "fam", "fr", "sfam"])
+
 # Helper function to load a circular image node from group-based folders
 def circular_image_node(label, radius=NODE_RADIUS_IMAGE):
     if label == "X":
@@ -37,14 +42,9 @@ def circular_image_node(label, radius=NODE_RADIUS_IMAGE):
     elif label == "Y":
         path = "sds/olhede.png"
     else:
-        for folder in ["sds", "biostat", "stat", "mstat", "fam", "fr", "sfam"]:
-            candidate = f"{folder}/{label.lower()}.png"
-            if os.path.exists(candidate):
-                path = candidate
-                break
-        else:
-            path = "picture2.png"
-    img = ImageMobject(path).scale_to_fit_height(2 * radius)
+        path = str(ASSET_INDEX.get(label, "picture2.png"))
+    # One shared, read-only buffer per file, however many labels fall back to it
+    img = CachedImageMobject(image_cache.get(path)).scale_to_fit_height(2 * radius)
     img.set_z_index(1)
     return img
 
@@ -0,0 +1,192 @@
+"""Per-play profiling of scene renders, exported as a Chrome trace."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+from manim import Wait
+from manim.renderer import cairo_renderer
+
+_PHASES = ("hash", "render", "encode")
+
+
+class PlayRecord(NamedTuple):
+    """What one ``play`` (or ``wait``) call cost."""
+
+    index: int
+    section: Optional[str]
+    line: str              # "<file>:<line>" of the scene code that played
+    kind: str              # "play" or "wait"
+    animations: int
+    mobjects: int          # mobject family members in the scene before the play
+    frames: int
+    start: float           # seconds since profiling started
+    wall: float
+    hash: float
+    render: float
+    encode: float
+
+
+class PlayProfiler:
+    """Time every play of *scene*: hashing, frame rendering and encoding.
+
+    Use as a context manager around ``scene.render()``.  Only the scene's
+    renderer and file writer are instrumented, for the duration of the
+    ``with`` block; scenes need no changes.  The calling line is the
+    innermost frame in the scene's own source file, so plays issued by
+    helpers (batches, builders) are charged to the step that asked for them.
+    """
+
+    def __init__(self, scene) -> None:
+        self.scene = scene
+        self.records: list[PlayRecord] = []
+        self._source = sys.modules[type(scene).__module__].__file__
+        self._slices: list[tuple[str, float, float]] = []
+        self._current: Optional[dict[str, float]] = None
+        self._frames = 0
+        self._restore: list[Callable[[], None]] = []
+
+    # ------------------------------------------------------------------ #
+    #   Instrumentation
+    # ------------------------------------------------------------------ #
+
+    def __enter__(self) -> PlayProfiler:
+        self._t0 = time.perf_counter()
+        renderer = self.scene.renderer
+        self._wrap(renderer, "play", self._timed_play)
+        self._wrap(renderer, "add_frame", self._counted_frames)
+        self._wrap(cairo_renderer, "get_hash_from_play_call", self._phase("hash"))
+        self._wrap(renderer, "update_frame", self._phase("render"))
+        self._wrap(renderer, "get_frame", self._phase("render"))
+        writer = renderer.file_writer
+        for method in ("write_frame", "begin_animation", "end_animation"):
+            self._wrap(writer, method, self._phase("encode"))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        while self._restore:
+            self._restore.pop()()
+
+    def _wrap(self, owner, name: str, make: Callable[[Callable], Callable]) -> None:
+        original = getattr(owner, name)
+        # Instance attributes shadow the class's methods until removed again
+        shadowed = name in vars(owner)
+        setattr(owner, name, make(original))
+        self._restore.append(lambda: setattr(owner, name, original) if shadowed else delattr(owner, name))
+
+    def _phase(self, phase: str):
+        def make(original):
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    end = time.perf_counter()
+                    if self._current is not None:
+                        self._current[phase] += end - start
+                        self._slices.append((phase, start - self._t0, end - start))
+            return timed
+        return make
+
+    def _timed_play(self, original):
+        def play(scene, *args, **kwargs):
+            frames_before = self._frames
+            mobjects = len(scene.get_mobject_family_members())
+            self._current = dict.fromkeys(_PHASES, 0.0)
+            start = time.perf_counter()
+            try:
+                return original(scene, *args, **kwargs)
+            finally:
+                wall = time.perf_counter() - start
+                animations = scene.animations or []
+                kind = "wait" if animations and all(isinstance(a, Wait) for a in animations) else "play"
+                self.records.append(PlayRecord(
+                    index=len(self.records),
+                    section=getattr(scene, "current_section", None),
+                    line=self._caller(),
+                    kind=kind,
+                    animations=len(animations),
+                    mobjects=mobjects,
+                    frames=self._frames - frames_before,
+                    start=start - self._t0,
+                    wall=wall,
+                    **self._current,
+                ))
+                self._current = None
+        return play
+
+    def _counted_frames(self, original):
+        def add_frame(frame, num_frames=1):
+            if not self.scene.renderer.skip_animations:
+                self._frames += num_frames
+            return original(frame, num_frames)
+        return add_frame
+
+    def _caller(self) -> str:
+        frame = sys._getframe(2)
+        while frame is not None:
+            if frame.f_code.co_filename == self._source:
+                return f"{os.path.basename(self._source)}:{frame.f_lineno}"
+            frame = frame.f_back
+        return "?"
+
+    # ------------------------------------------------------------------ #
+    #   Reports
+    # ------------------------------------------------------------------ #
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """The records as Chrome trace events (``chrome://tracing``, Perfetto)."""
+        pid, tid = os.getpid(), threading.get_ident()
+        us = 1e6
+        events: list[dict[str, Any]] = []
+        sections: dict[str, list[float]] = {}
+        for r in self.records:
+            events.append({
+                "name": f"{r.kind} {r.line}", "cat": r.kind, "ph": "X", "pid": pid, "tid": tid,
+                "ts": r.start * us, "dur": r.wall * us,
+                "args": {k: getattr(r, k) for k in ("index", "section", "animations", "mobjects", "frames", *_PHASES)},
+            })
+            if r.section is not None:
+                span = sections.setdefault(r.section, [r.start, r.start + r.wall])
+                span[1] = r.start + r.wall
+        for name, (start, end) in sections.items():
+            events.append({"name": name, "cat": "section", "ph": "X", "pid": pid, "tid": 0,
+                           "ts": start * us, "dur": (end - start) * us})
+        for phase, start, duration in self._slices:
+            events.append({"name": phase, "cat": phase, "ph": "X", "pid": pid, "tid": tid,
+                           "ts": start * us, "dur": duration * us})
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "sections"}})
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": "plays"}})
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.write_text(json.dumps(self.chrome_trace()))
+        return path
+
+    def summary(self, top: int = 10) -> str:
+        """Totals per phase, then the *top* slowest steps (section and calling line)."""
+        total = sum(r.wall for r in self.records)
+        lines = [f"{len(self.records)} plays, {sum(r.frames for r in self.records)} frames, {total:.2f}s"]
+        lines.append("  " + ", ".join(
+            f"{phase} {sum(getattr(r, phase) for r in self.records):.2f}s" for phase in _PHASES
+        ))
+
+        by_line: dict[str, list[PlayRecord]] = defaultdict(list)
+        for r in self.records:
+            by_line[f"{r.section or '-'} {r.line}"].append(r)
+        ranked = sorted(by_line.items(), key=lambda item: -sum(r.wall for r in item[1]))
+        lines.append(f"{'wall s':>8} {'calls':>6} {'hash':>7} {'render':>7} {'encode':>7}  step / line")
+        for where, records in ranked[:top]:
+            lines.append(
+                f"{sum(r.wall for r in records):8.2f} {len(records):6d} "
+                + " ".join(f"{sum(getattr(r, p) for r in records):7.2f}" for p in _PHASES)
+                + f"  {where}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,49 @@
+"""Scene registry: scene names mapped to lazily imported scene classes.
+
+Scenes are registered as entry points in the ``network_manim.scenes``
+group, so third-party packs can add their own::
+
+    [project.entry-points."network_manim.scenes"]
+    my-scene = "my_pack.scenes:MyScene"
+
+Listing scenes reads package metadata only; Manim is imported when a scene
+class is loaded.
+"""
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from importlib.metadata import entry_points
+
+ENTRY_POINT_GROUP = "network_manim.scenes"
+
+# Built-in scenes, also available from a source checkout without metadata
+BUILTIN_SCENES = {
+    "multi-clique": "network_manim.scenes.multi_clique:MultiCliqueAnimated7",
+}
+
+
+def _entry_points():
+    if sys.version_info >= (3, 10):
+        return entry_points(group=ENTRY_POINT_GROUP)
+    return entry_points().get(ENTRY_POINT_GROUP, [])
+
+
+def available_scenes() -> dict[str, str]:
+    """Scene name -> ``"module:attribute"`` of its class, built-ins first."""
+    scenes = dict(BUILTIN_SCENES)
+    for ep in _entry_points():
+        scenes.setdefault(ep.name, ep.value)
+    return scenes
+
+
+def load_scene(name: str) -> type:
+    """Import and return the scene class registered as *name*."""
+    target = available_scenes().get(name)
+    if target is None:
+        raise KeyError(name)
+    module, _, attribute = target.partition(":")
+    obj = import_module(module)
+    for part in attribute.split("."):
+        obj = getattr(obj, part)
+    return obj
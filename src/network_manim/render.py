@@ -0,0 +1,275 @@
+"""Render sectioned scenes across a process pool and join the parts losslessly."""
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Optional, Sequence
+
+import av
+from manim import config, logger, tempconfig
+
+from .graph_utils import preload_images, warm_assets
+from .section_cache import SectionCache, section_fingerprints
+from .sections import SectionedScene
+from .text import text_factory
+
+# Short CLI flags for Manim's quality presets
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+    "4k": "fourk_quality",
+}
+
+
+def set_quality(quality: str) -> None:
+    """Apply *quality*, a short flag (``l``, ``m``, ``h``, ``p``, ``4k``) or preset name."""
+    config.quality = QUALITIES.get(quality, quality)
+
+
+def split_sections(sections: Sequence[str], jobs: int) -> list[tuple[str, ...]]:
+    """Deal *sections* round-robin over at most *jobs* workers.
+
+    Every worker fast-forwards through the sections before its own, so
+    interleaving keeps the late, expensive-to-reach sections spread out.
+    """
+    jobs = max(1, min(jobs, len(sections)))
+    return [tuple(sections[j::jobs]) for j in range(jobs)]
+
+
+def concat_videos(videos: Sequence[Path], output: Path) -> Path:
+    """Join *videos* into *output* by stream copy (no re-encoding).
+
+    Uses FFmpeg's concat demuxer through PyAV, as Manim does for partial
+    movie files, so the inputs must share codec and dimensions.
+    """
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as listing:
+        for video in videos:
+            listing.write(f"file 'file:{Path(video).resolve().as_posix()}'\n")
+    try:
+        source = av.open(listing.name, format="concat", options={"safe": "0"})
+        stream = source.streams.video[0]
+        target = av.open(str(output), mode="w")
+        target_stream = target.add_stream(template=stream)
+        for packet in source.demux(stream):
+            if packet.dts is None:  # flush packets
+                continue
+            packet.dts = None  # let libav recompute across file boundaries
+            packet.stream = target_stream
+            target.mux(packet)
+        source.close()
+        target.close()
+    finally:
+        os.unlink(listing.name)
+    return output
+
+
+def _render_part(scene_cls, quality: str, scene_kwargs: dict[str, Any], sections, name: str) -> dict[str, Path]:
+    """Worker: render *sections* of *scene_cls*, returning each section's video."""
+    set_quality(quality)
+    # Scoped, so a worker can go on to render other scenes normally
+    with tempconfig({"save_sections": True, "output_file": name}):
+        scene = scene_cls(render_sections=sections, **scene_kwargs)
+        scene.render()
+    writer = scene.renderer.file_writer
+    index = writer.sections_output_dir / f"{writer.output_name}.json"
+    return {
+        entry["name"]: writer.sections_output_dir / entry["video"]
+        for entry in json.loads(index.read_text())
+        if entry["name"] in sections
+    }
+
+
+def default_output(scene_cls) -> Path:
+    """Where Manim itself would write the movie of *scene_cls*."""
+    module_name = Path(config.input_file).stem if config.input_file else ""
+    video_dir = config.get_dir("video_dir", module_name=module_name)
+    return video_dir / f"{scene_cls.__name__}{config.movie_file_extension}"
+
+
+def render_parallel(
+    scene_cls,
+    *,
+    quality: str = "m",
+    jobs: Optional[int] = None,
+    scene_kwargs: Optional[dict[str, Any]] = None,
+    output: Optional[Path] = None,
+    cache: Optional[SectionCache] = None,
+) -> Path:
+    """Render the sections of *scene_cls* on *jobs* processes and join them.
+
+    Each worker builds its own scene and renders only its share of
+    ``scene_cls.SECTIONS`` (see :class:`~network_manim.sections.SectionedScene`);
+    the section videos are then concatenated, in order, into *output*
+    (default: :func:`default_output`).  With a *cache*, sections whose
+    fingerprint is unchanged are reused and only the others are rendered.
+    """
+    sections = scene_cls.SECTIONS
+    if not sections:
+        raise ValueError(f"{scene_cls.__name__} defines no sections")
+    scene_kwargs = scene_kwargs or {}
+    set_quality(quality)
+
+    # Section -> its video, or None for a section that plays nothing
+    videos: dict[str, Optional[Path]] = {}
+    if cache is not None:
+        fingerprints = section_fingerprints(scene_cls, quality, scene_kwargs)
+        for section in sections:
+            hit, video = cache.lookup(fingerprints[section])
+            if hit:
+                videos[section] = video
+            logger.info(f"Section {section}: {'cache hit' if hit else 're-rendering'}")
+    todo = [s for s in sections if s not in videos]
+    logger.info(f"{len(videos)} cached section(s), {len(todo)} to render")
+
+    if todo:
+        parts = split_sections(todo, jobs or os.cpu_count() or 1)
+        rendered: dict[str, Path] = {}
+        if len(parts) == 1:
+            rendered = _render_part(scene_cls, quality, scene_kwargs, parts[0], f"{scene_cls.__name__}_part00")
+        else:
+            # Spawned workers start without this process's Cairo/Pango state
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=len(parts), mp_context=context) as pool:
+                futures = [
+                    pool.submit(_render_part, scene_cls, quality, scene_kwargs, part, f"{scene_cls.__name__}_part{j:02}")
+                    for j, part in enumerate(parts)
+                ]
+                for future in futures:
+                    rendered.update(future.result())
+        for section in todo:
+            video = rendered.get(section)
+            videos[section] = cache.store(fingerprints[section], video) if cache is not None else video
+
+    # Sections without a single play have no video and are left out
+    ordered = [videos[s] for s in sections if videos[s] is not None]
+    if not ordered:
+        raise RuntimeError(f"{scene_cls.__name__} rendered no section videos")
+    output = output or default_output(scene_cls)
+    logger.info(f"Joining {len(ordered)} sections into {output}")
+    return concat_videos(ordered, output)
+
+
+def render_scene(
+    scene_cls,
+    *,
+    quality: str = "m",
+    jobs: int = 1,
+    scene_kwargs: Optional[dict[str, Any]] = None,
+    cache: Optional[SectionCache] = None,
+) -> Path:
+    """Render *scene_cls* at *quality* and return the movie path.
+
+    Sectioned scenes go through :func:`render_parallel` when rendered on
+    several *jobs* or with a section *cache*; other scenes render as usual.
+    """
+    scene_kwargs = scene_kwargs or {}
+    set_quality(quality)
+    if issubclass(scene_cls, SectionedScene) and (jobs > 1 or cache is not None):
+        return render_parallel(scene_cls, quality=quality, jobs=jobs, scene_kwargs=scene_kwargs, cache=cache)
+    scene = scene_cls(**scene_kwargs)
+    scene.render()
+    return Path(scene.renderer.file_writer.movie_file_path)
+
+
+# --------------------------------------------------------------------------- #
+#   Batches: many scenes and qualities from one warm process
+# --------------------------------------------------------------------------- #
+
+def _render_job(name: str, scene_cls, quality: str, scene_kwargs: dict[str, Any], cache: bool) -> dict[str, Any]:
+    """Worker: render one batch entry and report how it went."""
+    start = time.perf_counter()
+    result: dict[str, Any] = {"scene": name, "quality": quality}
+    try:
+        output = render_scene(
+            scene_cls, quality=quality, scene_kwargs=scene_kwargs, cache=SectionCache() if cache else None
+        )
+        result.update(status="ok", output=str(output))
+    except Exception as exc:  # reported in the summary, the batch goes on
+        logger.exception(f"Rendering {name} at {quality} failed")
+        result.update(status="error", error=f"{type(exc).__name__}: {exc}")
+    result["seconds"] = round(time.perf_counter() - start, 3)
+    return result
+
+
+def _warm_caches(scenes: dict[str, type], qualities: Sequence[str], scene_kwargs: dict[str, Any]) -> None:
+    """Load the asset index, decode every scene's portraits at every quality and lay out its text.
+
+    Scenes say what they need through the ``asset_labels`` and
+    ``text_strings`` class methods; scenes without them are skipped.
+    """
+    warm_assets()
+    for name, scene_cls in scenes.items():
+        asset_labels = getattr(scene_cls, "asset_labels", None)
+        text_strings = getattr(scene_cls, "text_strings", None)
+        try:
+            if asset_labels is not None:
+                labels = asset_labels(**scene_kwargs)
+                # Thumbnails are cut to the node size in pixels of each quality
+                for quality in qualities:
+                    set_quality(quality)
+                    preload_images(labels)
+            if text_strings is not None:
+                text_factory.prerender(text_strings(**scene_kwargs))
+        except Exception as exc:  # the scene's own jobs will report it
+            logger.warning(f"Could not warm the caches for {name}: {exc}")
+
+
+def render_batch(
+    scenes: dict[str, type],
+    qualities: Sequence[str],
+    *,
+    workers: Optional[int] = None,
+    scene_kwargs: Optional[dict[str, Any]] = None,
+    cache: bool = True,
+    summary: Optional[Path] = None,
+) -> list[dict[str, Any]]:
+    """Render every scene of *scenes* (name -> class) at every quality in *qualities*.
+
+    Manim and the package are imported, the asset index loaded, every
+    scene's portraits decoded (at every quality) and its text laid out,
+    once in this process; workers are forked from it where the platform
+    allows, so they start warm and share those caches across scenes and
+    qualities.  Spawned workers warm their own once, when they start.
+    Returns one result per render (status, output path, seconds), also
+    written with the batch timings to *summary* as JSON.
+    """
+    jobs = [(name, scene_cls, quality) for name, scene_cls in scenes.items() for quality in qualities]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    warm = (scenes, tuple(qualities), scene_kwargs or {})
+    # Nothing has been rendered here yet, so forking shares only imports and caches
+    method = "fork" if "fork" in multiprocessing.get_all_start_methods() else "spawn"
+    if method == "fork":
+        _warm_caches(*warm)
+        initializer, initargs = None, ()
+    else:
+        initializer, initargs = _warm_caches, warm
+    started, start = datetime.now(timezone.utc), time.perf_counter()
+    context = multiprocessing.get_context(method)
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=context, initializer=initializer, initargs=initargs
+    ) as pool:
+        futures = [
+            pool.submit(_render_job, name, scene_cls, quality, scene_kwargs or {}, cache)
+            for name, scene_cls, quality in jobs
+        ]
+        results = [future.result() for future in futures]
+
+    if summary is not None:
+        summary.parent.mkdir(parents=True, exist_ok=True)
+        summary.write_text(json.dumps({
+            "started": started.isoformat(timespec="seconds"),
+            "seconds": round(time.perf_counter() - start, 3),
+            "workers": workers,
+            "renders": results,
+        }, indent=2))
+    return results
@@ -0,0 +1,126 @@
+"""On-disk cache of rendered section videos, keyed by content fingerprints."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+import manim
+from manim import config as manim_config
+
+from . import __version__
+from . import config as nm_config
+from .config import CACHE_DIR
+
+_VERSION = 2  # bump when the fingerprint recipe changes
+# Constants that do not change a single pixel
+_IGNORED_CONSTANTS = {"CACHE_DIR", "SHOW_MESSAGES"}
+
+
+def code_version(scene_cls: Optional[type] = None) -> str:
+    """Version of the code a section is rendered with: this package and Manim.
+
+    Includes a digest of the sources of this package and of the module
+    defining *scene_cls*, so that editing a scene or a helper invalidates
+    its sections even when ``__version__`` stays the same.
+    """
+    package = Path(__file__).parent
+    files = sorted(package.rglob("*.py"))
+    module = sys.modules.get(scene_cls.__module__) if scene_cls is not None else None
+    source = getattr(module, "__file__", None)
+    if source is not None and Path(source).resolve() not in {f.resolve() for f in files}:
+        files.append(Path(source))
+    digest = hashlib.sha256()
+    for path in files:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return (
+        f"network-manim {__version__} ({digest.hexdigest()[:16]}), "
+        f"manim {manim.__version__}, cache v{_VERSION}"
+    )
+
+
+def _jsonable(value: Any) -> Any:
+    """``json.dumps`` fallback: files (a spec path) by content, anything else by ``str``."""
+    if isinstance(value, os.PathLike) and Path(value).is_file():
+        return {"path": os.fspath(value), "sha256": hashlib.sha256(Path(value).read_bytes()).hexdigest()}
+    return str(value)
+
+
+def render_constants() -> dict[str, Any]:
+    """The :mod:`network_manim.config` constants and Manim output settings."""
+    constants = {
+        name: value
+        for name, value in vars(nm_config).items()
+        if name.isupper() and name not in _IGNORED_CONSTANTS
+    }
+    for key in ("pixel_width", "pixel_height", "frame_rate", "movie_file_extension", "background_opacity"):
+        constants[f"manim.{key}"] = manim_config[key]
+    return constants
+
+
+def section_fingerprints(scene_cls, quality: str, scene_kwargs: Optional[dict[str, Any]] = None) -> dict[str, str]:
+    """One fingerprint per section of *scene_cls*, from the inputs it depends on.
+
+    Each fingerprint covers the scene, the section and its position, the
+    *quality*, :func:`render_constants`, :func:`code_version` and the input
+    facets of ``scene_cls.section_inputs`` that ``scene_cls.FACETS`` lists
+    for that section (facets it does not list count for every section).
+    Paths among the inputs, such as a ``spec`` file, count by content.
+    """
+    inputs = scene_cls.section_inputs(**(scene_kwargs or {}))
+    common = {
+        "scene": f"{scene_cls.__module__}.{scene_cls.__qualname__}",
+        "quality": quality,
+        "constants": render_constants(),
+        "code": code_version(scene_cls),
+    }
+    fingerprints = {}
+    for position, section in enumerate(scene_cls.SECTIONS):
+        facets = {
+            facet: value
+            for facet, value in inputs.items()
+            if section in scene_cls.FACETS.get(facet, scene_cls.SECTIONS)
+        }
+        payload = dict(common, section=section, position=position, inputs=facets)
+        blob = json.dumps(payload, sort_keys=True, default=_jsonable).encode()
+        fingerprints[section] = hashlib.sha256(blob).hexdigest()[:32]
+    return fingerprints
+
+
+class SectionCache:
+    """Rendered section videos under *root*, one file per fingerprint.
+
+    Sections that play nothing have no video; they are remembered with an
+    empty marker so they are not re-rendered either.
+    """
+
+    def __init__(self, root: str | Path | None = None, *, extension: str = ".mp4") -> None:
+        self.root = Path(root) if root is not None else CACHE_DIR / "sections"
+        self.extension = extension
+
+    def lookup(self, fingerprint: str) -> tuple[bool, Optional[Path]]:
+        """``(hit, video)``; *video* is ``None`` for a cached empty section."""
+        video = self.root / f"{fingerprint}{self.extension}"
+        if video.exists():
+            return True, video
+        return self._marker(fingerprint).exists(), None
+
+    def store(self, fingerprint: str, video: Optional[Path]) -> Optional[Path]:
+        """Copy *video* (``None``: an empty section) into the cache and return its path."""
+        self.root.mkdir(parents=True, exist_ok=True)
+        if video is None:
+            self._marker(fingerprint).touch()
+            return None
+        out = self.root / f"{fingerprint}{self.extension}"
+        tmp = out.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(video, tmp)
+        os.replace(tmp, out)
+        return out
+
+    def _marker(self, fingerprint: str) -> Path:
+        return self.root / f"{fingerprint}.empty"
@@ -0,0 +1,88 @@
+"""Scenes split into named sections that can be rendered on their own."""
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional
+
+import numpy as np
+from manim import Scene
+from manim.utils.exceptions import EndSceneEarlyException
+
+
+class SectionedScene(Scene):
+    """A scene whose ``construct`` is cut into the named :attr:`SECTIONS`.
+
+    ``construct`` calls :meth:`begin_section` at each boundary, in
+    :attr:`SECTIONS` order.  Given *render_sections*, only those sections
+    write frames: the others are fast-forwarded with animations skipped,
+    which rebuilds the scene state at every boundary, and ``construct``
+    stops once the last requested section is done.  With
+    ``config.save_sections`` each rendered section gets its own video.
+
+    With *capture_stills*, the last frame of every section (every
+    requested one, given *render_sections*) is kept in :attr:`stills`,
+    which also works with all animations skipped.
+    """
+
+    SECTIONS: tuple[str, ...] = ()
+    #: Input facet -> the sections it shows in; unlisted facets affect every section
+    FACETS: dict[str, tuple[str, ...]] = {}
+
+    @classmethod
+    def section_inputs(cls, **scene_kwargs) -> dict[str, Any]:
+        """JSON-able inputs of a scene built with *scene_kwargs*, by facet.
+
+        Used to fingerprint sections for the render cache; see
+        :func:`~network_manim.section_cache.section_fingerprints`.
+        """
+        return {"scene_kwargs": scene_kwargs}
+
+    def __init__(
+        self,
+        *args,
+        render_sections: Optional[Iterable[str]] = None,
+        capture_stills: bool = False,
+        **kwargs,
+    ):
+        if render_sections is None:
+            self.render_sections = None
+        else:
+            self.render_sections = frozenset(render_sections)
+            unknown = self.render_sections.difference(self.SECTIONS)
+            if unknown:
+                raise ValueError(f"{type(self).__name__} has no section(s) {sorted(unknown)}")
+        self.current_section: Optional[str] = None
+        #: Section -> its last frame, with *capture_stills*
+        self.stills: Optional[dict[str, np.ndarray]] = {} if capture_stills else None
+        super().__init__(*args, **kwargs)
+
+    def begin_section(self, name: str) -> None:
+        """Start section *name*, skipping it unless it is to be rendered."""
+        if name not in self.SECTIONS:
+            raise ValueError(f"{type(self).__name__} has no section {name!r}")
+        self._capture_still()
+        self.current_section = name
+        todo = self.render_sections
+        if todo is None:
+            self.next_section(name)
+            return
+        if not todo:
+            raise EndSceneEarlyException()
+        last = max(self.SECTIONS.index(s) for s in todo)
+        if self.SECTIONS.index(name) > last:
+            raise EndSceneEarlyException()
+        self.next_section(name, skip_animations=name not in todo)
+
+    def tear_down(self) -> None:
+        self._capture_still()
+        super().tear_down()
+
+    def _capture_still(self) -> None:
+        """Keep the frame the current section ends on, if stills are wanted."""
+        section = self.current_section
+        if self.stills is None or section is None:
+            return
+        if self.render_sections is not None and section not in self.render_sections:
+            return
+        # Draws even when animations are skipped
+        self.renderer.update_frame(self, ignore_skipping=True)
+        self.stills[section] = self.renderer.get_frame()
@@ -0,0 +1,410 @@
+"""Declarative network specs driving the clique scenes.
+
+A spec is a set of *cliques* (nodes drawn on a circle), each belonging to a
+*group* that sits on one side of the frame (``middle``, ``left`` or
+``right``), plus the edges between nodes.  It can be given as
+
+* a :class:`networkx.Graph` whose nodes carry a ``clique`` and ``group``
+  attribute (and optionally ``image``, the portrait label), with optional
+  per-clique settings under ``G.graph["cliques"]`` and per-group settings
+  under ``G.graph["groups"]``;
+* a mapping, or a TOML / JSON file holding one::
+
+    edges = [["X", "BIO1"], ["Y1", "STAT1", 2]]   # optional third item: type
+
+    [groups.middle]
+    color = "#800000"
+
+    [[cliques]]
+    name = "SDS"
+    group = "middle"
+    nodes = ["X", "Y", "Y1", "Y2"]
+    color = "#C4D08D"
+    radius = 1.0            # optional, like center = [x, y], angles (degrees)
+                            # and images = { X = "portrait-label" }
+
+  Cliques given this way are complete graphs; ``edges`` adds the links
+  between them.
+
+Cliques without a ``center`` are arranged on their side of the frame in a
+grid.  With ``layout = { method = "packed" }`` (``G.graph["layout"]`` for a
+graph) they are instead packed as circles sized by clique size, with the
+nodes on each circle or, given ``within = "force"``, force-placed from
+their edges (:func:`~network_manim.graph_utils.force_layout`); ``seed`` and ``gap`` tune the packing (see
+:func:`network_manim.graph_utils.community_layout`).
+
+Everything the scenes need (node positions, edge order and edge types) is
+computed once into numpy arrays when the spec is built.
+"""
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+from typing import Any, Iterable, Mapping, NamedTuple, Sequence
+
+import networkx as nx
+import numpy as np
+
+SIDES = ("middle", "left", "right")
+
+# Edge types, as used by the typed adjacency matrix
+INTRA_LAB, INTER_LAB, INTRA_CLOSE, INTER_CLOSE = 1, 2, 3, 4
+
+# Default placement: left/right cliques fill a column band on their side
+_SIDE_X = (1.5, 5.5)          # |x| range of the left and right bands
+_SIDE_Y = 2.5                 # top and bottom row centres
+_NODE_SPACING = 0.9           # default gap between neighbours on a clique circle
+_MIN_RADIUS = 0.8
+_LAYOUTS = ("grid", "packed")
+
+
+class GroupSpec(NamedTuple):
+    name: str
+    side: str
+    color: str | None
+
+
+class CliqueSpec(NamedTuple):
+    name: str
+    title: str
+    group: str
+    side: str
+    color: str | None
+    center: np.ndarray    # (3,)
+    radius: float
+    members: np.ndarray   # node indices, in build order
+
+
+class GraphSpec:
+    """Cliques, groups and edges of a network, with precomputed geometry.
+
+    Nodes are numbered clique by clique in the order the cliques are given,
+    so ``spec.labels[i]``, ``spec.positions[i]`` and row *i* of
+    :meth:`adjacency` all refer to the same node.  ``spec.edges`` is an
+    ``(E, 2)`` index array with ``a < b``: the edges inside each clique come
+    first, in the order a node-by-node build draws them, then the links
+    between cliques in the order they were given.
+    """
+
+    def __init__(
+        self,
+        cliques: Sequence[Mapping[str, Any]],
+        edges: Iterable[Sequence] = (),
+        *,
+        groups: Mapping[str, Mapping[str, Any]] | None = None,
+        images: Mapping[str, str | None] | None = None,
+        layout: Mapping[str, Any] | None = None,
+    ) -> None:
+        groups = dict(groups or {})
+        self.layout_options = {"method": "grid", **(layout or {})}
+        if self.layout_options["method"] not in _LAYOUTS:
+            raise ValueError(f"unknown layout method {self.layout_options['method']!r}, expected one of {_LAYOUTS}")
+        images = dict(images or {})
+
+        self.labels: list[str] = []
+        self.groups: dict[str, GroupSpec] = {}
+        clique_of: list[int] = []
+        for k, clique in enumerate(cliques):
+            group = clique.get("group", "middle")
+            if group not in self.groups:
+                settings = groups.get(group, {})
+                side = settings.get("side", group)
+                if side not in SIDES:
+                    raise ValueError(f"group {group!r} needs a side, one of {SIDES}")
+                self.groups[group] = GroupSpec(group, side, settings.get("color"))
+            for label in clique["nodes"]:
+                self.labels.append(str(label))
+                clique_of.append(k)
+
+        self.index = {label: i for i, label in enumerate(self.labels)}
+        if len(self.index) != len(self.labels):
+            dup = next(l for i, l in enumerate(self.labels) if self.index[l] != i)
+            raise ValueError(f"node {dup!r} is listed more than once")
+        self.images = [images.get(label, label) for label in self.labels]
+        self.clique_of = np.asarray(clique_of, dtype=np.intp)
+
+        self._packed_offsets: dict[int, np.ndarray] = {}
+        pairs = self._pairs(edges)
+        self.cliques = self._layout(cliques, pairs[0])
+        self.offsets = self._offsets(cliques)
+        centers = np.array([c.center for c in self.cliques]).reshape(-1, 3)
+        radii = np.array([c.radius for c in self.cliques], dtype=float)
+        self.positions = centers[self.clique_of] + radii[self.clique_of, None] * self.offsets
+
+        self.edges, self.edge_types = self._edges(*pairs)
+
+    # ------------------------------------------------------------------ #
+    #   Loaders
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> GraphSpec:
+        """Build a spec from a mapping laid out like the TOML format above."""
+        cliques = data["cliques"]
+        complete = (
+            (a, b) for clique in cliques for i, b in enumerate(clique["nodes"]) for a in clique["nodes"][:i]
+        )
+        images = {}
+        for clique in cliques:
+            images.update(clique.get("images", {}))
+        return cls(
+            cliques,
+            [*complete, *data.get("edges", ())],
+            groups=data.get("groups"),
+            images=images,
+            layout=data.get("layout"),
+        )
+
+    @classmethod
+    def from_graph(cls, graph: nx.Graph) -> GraphSpec:
+        """Build a spec from a graph with ``clique``/``group``/``image`` node data."""
+        settings = graph.graph.get("cliques", {})
+        members: dict[Any, list] = {}
+        group_of: dict[Any, str] = {}
+        images = {}
+        for node, data in graph.nodes(data=True):
+            if "clique" not in data:
+                raise ValueError(f"node {node!r} has no 'clique' attribute")
+            clique = data["clique"]
+            members.setdefault(clique, []).append(node)
+            group = data.get("group", group_of.get(clique, "middle"))
+            if group_of.setdefault(clique, group) != group:
+                raise ValueError(f"clique {clique!r} spans groups {group_of[clique]!r} and {group!r}")
+            if "image" in data:
+                images[str(node)] = data["image"] or None
+
+        cliques = [
+            {**settings.get(name, {}), "name": name, "group": group_of[name], "nodes": nodes}
+            for name, nodes in members.items()
+        ]
+        edges = ((a, b, t) for a, b, t in graph.edges(data="type"))
+        return cls(
+            cliques, edges, groups=graph.graph.get("groups"), images=images, layout=graph.graph.get("layout")
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> GraphSpec:
+        """Read a ``.toml`` or ``.json`` spec file."""
+        path = Path(path)
+        if path.suffix == ".toml":
+            try:
+                import tomllib
+            except ModuleNotFoundError:  # Python < 3.11
+                import tomli as tomllib
+            with path.open("rb") as fh:
+                return cls.from_dict(tomllib.load(fh))
+        if path.suffix == ".json":
+            with path.open(encoding="utf-8") as fh:
+                return cls.from_dict(json.load(fh))
+        raise ValueError(f"unsupported spec format {path.suffix!r} (expected .toml or .json)")
+
+    @classmethod
+    def coerce(cls, spec: GraphSpec | nx.Graph | Mapping | str | Path) -> GraphSpec:
+        """Return *spec* as a :class:`GraphSpec`, whatever form it was given in."""
+        if isinstance(spec, GraphSpec):
+            return spec
+        if isinstance(spec, nx.Graph):
+            return cls.from_graph(spec)
+        if isinstance(spec, Mapping):
+            return cls.from_dict(spec)
+        return cls.load(spec)
+
+    # ------------------------------------------------------------------ #
+    #   Queries
+    # ------------------------------------------------------------------ #
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def cliques_on(self, side: str) -> list[CliqueSpec]:
+        """The cliques on *side* of the frame, in spec order."""
+        return [c for c in self.cliques if c.side == side]
+
+    def node_mask(self, side: str) -> np.ndarray:
+        """Boolean mask of the nodes on *side* of the frame."""
+        on_side = np.array([c.side == side for c in self.cliques], dtype=bool)
+        return on_side[self.clique_of]
+
+    def edges_of_type(self, etype: int) -> np.ndarray:
+        """Indices into :attr:`edges` of the edges of type *etype*."""
+        return np.flatnonzero(self.edge_types == etype)
+
+    def adjacency(self) -> np.ndarray:
+        """Symmetric ``(N, N)`` int8 typed adjacency (0 = no edge)."""
+        out = np.zeros((len(self), len(self)), dtype=np.int8)
+        a, b = self.edges.T
+        out[a, b] = self.edge_types
+        out[b, a] = self.edge_types
+        return out
+
+    # ------------------------------------------------------------------ #
+    #   Geometry
+    # ------------------------------------------------------------------ #
+
+    def _layout(self, cliques: Sequence[Mapping[str, Any]], pairs: np.ndarray) -> list[CliqueSpec]:
+        sizes = np.bincount(self.clique_of, minlength=len(cliques))
+        centers = np.zeros((len(cliques), 3))
+        radii = np.array([_default_radius(n) for n in sizes])
+        given = np.array(["center" in c for c in cliques], dtype=bool)
+        sides = [self.groups[c.get("group", "middle")].side for c in cliques]
+
+        for side in SIDES:
+            auto = np.flatnonzero([s == side and not g for s, g in zip(sides, given)])
+            if not len(auto):
+                continue
+            if self.layout_options["method"] == "packed":
+                self._pack(side, auto, cliques, centers, radii, pairs)
+                continue
+            if side == "middle":
+                centers[auto, 0] = 2.5 * (np.arange(len(auto)) - (len(auto) - 1) / 2)
+                continue
+            # Column-major grid in the side band, first clique at the top
+            k = len(auto)
+            width, height = _SIDE_X[1] - _SIDE_X[0], 2 * _SIDE_Y
+            rows = min(k, max(3, math.ceil(math.sqrt(k * height / width))))
+            cols = math.ceil(k / rows)
+            cell_w = width / cols
+            cell_h = height / (rows - 1) if rows > 1 else height
+            col, row = np.divmod(np.arange(k), rows)
+            x = _SIDE_X[0] + (cols - col - 0.5) * cell_w  # column 0 nearest the edge
+            centers[auto, 0] = -x if side == "left" else x
+            centers[auto, 1] = _SIDE_Y - row * cell_h if rows > 1 else 0.0
+            radii[auto] = np.minimum(radii[auto], 0.4 * min(cell_w, cell_h))
+
+        out = []
+        start = np.concatenate([[0], np.cumsum(sizes)])
+        for k, clique in enumerate(cliques):
+            center = centers[k]
+            if given[k]:
+                center = np.zeros(3)
+                center[: len(clique["center"])] = clique["center"]
+            group = clique.get("group", "middle")
+            name = str(clique.get("name", k))
+            out.append(
+                CliqueSpec(
+                    name=name,
+                    title=clique.get("title", name),
+                    group=group,
+                    side=sides[k],
+                    color=clique.get("color"),
+                    center=center,
+                    radius=float(radii[k] if k in self._packed_offsets else clique.get("radius", radii[k])),
+                    members=np.arange(start[k], start[k + 1]),
+                )
+            )
+        return out
+
+    def _offsets(self, cliques: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """Unit-circle offset of every node from its clique centre, ``(N, 3)``."""
+        angles = np.zeros(len(self.labels))
+        for k, (clique, spec) in enumerate(zip(cliques, self.cliques)):
+            n = len(spec.members)
+            if "angles" in clique:
+                if len(clique["angles"]) != n:
+                    raise ValueError(f"clique {spec.name!r} has {n} nodes but {len(clique['angles'])} angles")
+                angles[spec.members] = np.radians(clique["angles"])
+            elif k in self._packed_offsets:
+                continue
+            else:
+                angles[spec.members] = 2 * np.pi * np.arange(n) / max(n, 1)
+        offsets = np.stack([np.cos(angles), np.sin(angles), np.zeros_like(angles)], axis=1)
+        for k, packed in self._packed_offsets.items():
+            if "angles" not in cliques[k]:
+                offsets[self.cliques[k].members] = packed
+        return offsets
+
+    def _pack(self, side, auto, cliques, centers, radii, pairs) -> None:
+        """Pack the cliques *auto* of *side* with the community layout engine.
+
+        Sets their ``centers`` and ``radii`` in place and keeps their node
+        offsets; the packing is scaled down, if need be, to fit the band of
+        *side*.
+        """
+        # Imported here: the engine lives with the Manim helpers
+        from .graph_utils import community_layout, community_radius
+
+        within = self.layout_options.get("within", "circle")
+        members = np.flatnonzero(np.isin(self.clique_of, auto))
+        local = np.full(len(self.labels), -1, dtype=np.intp)
+        local[members] = np.arange(len(members))
+        a, b = local[pairs[:, 0]], local[pairs[:, 1]]
+        keep = (a >= 0) & (b >= 0)
+        community = np.searchsorted(auto, self.clique_of[members])
+        sizes = np.bincount(community, minlength=len(auto))
+        given = [cliques[k].get("radius") for k in auto]
+        # Engine defaults, floored like the grid's radii, unless given
+        default = community_radius(sizes, within=within, spacing=_NODE_SPACING)
+        default = np.where(sizes < 2, 0.0, np.maximum(_MIN_RADIUS, default))
+        layout = community_layout(
+            community,
+            np.stack([a[keep], b[keep]], axis=1),
+            radii=np.array([g if g is not None else d for g, d in zip(given, default)], dtype=float),
+            within=within,
+            spacing=_NODE_SPACING,
+            gap=self.layout_options.get("gap", 0.6),
+            seed=self.layout_options.get("seed", 0),
+        )
+
+        low = (layout.centers[:, :2] - layout.radii[:, None]).min(axis=0)
+        high = (layout.centers[:, :2] + layout.radii[:, None]).max(axis=0)
+        # Side bands run from |x| = _SIDE_X[0] to the frame edge, the middle between them
+        outer = _SIDE_X[1] + _MIN_RADIUS
+        height = 2 * (_SIDE_Y + _MIN_RADIUS)
+        if side == "middle":
+            anchor, box = 0.0, (2 * _SIDE_X[0], height)
+        else:
+            anchor = (_SIDE_X[0] + outer) / 2 * (-1 if side == "left" else 1)
+            box = (outer - _SIDE_X[0], height)
+        scale = min(1.0, *(np.asarray(box) / np.maximum(high - low, 1e-9)))
+        centers[auto, :2] = scale * (layout.centers[:, :2] - (low + high) / 2) + [anchor, 0.0]
+        radii[auto] = scale * layout.radii
+        for j, k in enumerate(auto):
+            self._packed_offsets[k] = layout.offsets[community == j]
+
+    def _pairs(self, edges: Iterable[Sequence]) -> tuple[np.ndarray, np.ndarray]:
+        """Deduplicated ``(a, b)`` index pairs (``a < b``) and their explicit types."""
+        pairs, explicit, seen = [], [], set()
+        for edge in edges:
+            a, b = self._node(edge[0]), self._node(edge[1])
+            if a == b:
+                raise ValueError(f"self-loop on node {self.labels[a]!r}")
+            key = (a, b) if a < b else (b, a)
+            if key in seen:
+                continue
+            seen.add(key)
+            pairs.append(key)
+            explicit.append(edge[2] if len(edge) > 2 and edge[2] is not None else 0)
+
+        return np.array(pairs, dtype=np.intp).reshape(-1, 2), np.array(explicit, dtype=np.int8)
+
+    def _edges(self, pairs: np.ndarray, explicit: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        a, b = pairs[:, 0], pairs[:, 1]
+
+        side = np.array([SIDES.index(c.side) for c in self.cliques])[self.clique_of]
+        same = self.clique_of[a] == self.clique_of[b]
+        right = (side[a] == SIDES.index("right")) | (side[b] == SIDES.index("right"))
+        types = np.where(
+            same,
+            np.where(right, INTRA_CLOSE, INTRA_LAB),
+            np.where(right, INTER_CLOSE, INTER_LAB),
+        ).astype(np.int8)
+        types = np.where(explicit > 0, explicit, types)
+
+        # Intra-clique edges in build order (by later node, then earlier one),
+        # then the cross links as given.
+        intra = np.flatnonzero(same)
+        order = np.concatenate([intra[np.lexsort((a[intra], b[intra]))], np.flatnonzero(~same)])
+        return pairs[order], types[order]
+
+    def _node(self, label) -> int:
+        try:
+            return self.index[str(label)]
+        except KeyError:
+            raise ValueError(f"edge endpoint {label!r} is not in any clique") from None
+
+
+def _default_radius(n: int) -> float:
+    if n < 2:
+        return 0.0
+    return max(_MIN_RADIUS, _NODE_SPACING / (2 * math.sin(math.pi / n)))
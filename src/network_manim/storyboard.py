@@ -0,0 +1,97 @@
+"""Storyboards: the last frame of every section, laid out on one contact sheet."""
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Mapping, Optional
+
+import numpy as np
+from manim import config, logger, tempconfig
+from PIL import Image, ImageDraw, ImageFont
+
+from .render import set_quality, split_sections
+
+_CAPTION = 22  # pixels below each still for the section name
+
+
+def _capture_part(scene_cls, quality: str, scene_kwargs: dict[str, Any], sections) -> dict[str, np.ndarray]:
+    """Worker: run ``construct`` with every animation skipped, keeping *sections*' last frames."""
+    set_quality(quality)
+    # Nothing is encoded or written; frames are only drawn for the stills
+    with tempconfig({"dry_run": True}):
+        scene = scene_cls(render_sections=sections, capture_stills=True, skip_animations=True, **scene_kwargs)
+        scene.render()
+    return scene.stills
+
+
+def contact_sheet(stills: Mapping[str, np.ndarray], *, columns: int = 6, width: int = 480) -> Image.Image:
+    """Tile *stills* (section -> frame), in order, *columns* per row, each *width* pixels wide.
+
+    Every still is captioned with its section name.
+    """
+    if not stills:
+        raise ValueError("no stills to lay out")
+    columns = max(1, min(columns, len(stills)))
+    rows = math.ceil(len(stills) / columns)
+    first = next(iter(stills.values()))
+    height = round(width * first.shape[0] / first.shape[1])
+    cell = height + _CAPTION
+
+    sheet = Image.new("RGB", (columns * width, rows * cell), "white")
+    draw = ImageDraw.Draw(sheet)
+    font = ImageFont.load_default()
+    for k, (section, frame) in enumerate(stills.items()):
+        x, y = (k % columns) * width, (k // columns) * cell
+        still = Image.fromarray(frame).convert("RGB").resize((width, height), Image.LANCZOS)
+        sheet.paste(still, (x, y))
+        draw.text((x + 6, y + height + 5), section, fill="black", font=font)
+    return sheet
+
+
+def render_storyboard(
+    scene_cls,
+    *,
+    quality: str = "l",
+    jobs: Optional[int] = None,
+    scene_kwargs: Optional[dict[str, Any]] = None,
+    output: Optional[Path] = None,
+    columns: int = 6,
+    width: int = 480,
+) -> Path:
+    """Save a contact sheet of the last frame of every section of *scene_cls*.
+
+    ``construct`` runs with all animations skipped, so only scene logic
+    and one frame per section are paid for.  The sections are dealt over
+    *jobs* processes like :func:`~network_manim.render.render_parallel`
+    does; the sheet goes to *output* (default: ``<Scene>_storyboard.png``
+    in Manim's images directory).
+    """
+    sections = scene_cls.SECTIONS
+    if not sections:
+        raise ValueError(f"{scene_cls.__name__} defines no sections")
+    scene_kwargs = scene_kwargs or {}
+    set_quality(quality)
+
+    parts = split_sections(sections, jobs or os.cpu_count() or 1)
+    stills: dict[str, np.ndarray] = {}
+    if len(parts) == 1:
+        stills = _capture_part(scene_cls, quality, scene_kwargs, parts[0])
+    else:
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=len(parts), mp_context=context) as pool:
+            futures = [pool.submit(_capture_part, scene_cls, quality, scene_kwargs, part) for part in parts]
+            for future in futures:
+                stills.update(future.result())
+
+    # Sections construct never reached (e.g. disabled steps) are left out
+    ordered = {s: stills[s] for s in sections if s in stills}
+    if output is None:
+        module_name = Path(config.input_file).stem if config.input_file else ""
+        output = config.get_dir("images_dir", module_name=module_name) / f"{scene_cls.__name__}_storyboard.png"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    contact_sheet(ordered, columns=columns, width=width).save(output)
+    logger.info(f"Storyboard of {len(ordered)} sections written to {output}")
+    return output
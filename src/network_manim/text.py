@@ -0,0 +1,146 @@
+"""Text mobjects built once per style and handed out as copies."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple, Optional
+
+from manim import ManimColor, Text, config, tempconfig
+from manim.utils.color import ParsableManimColor
+
+# Settings the Pango stage depends on, handed to spawned workers
+_WORKER_CONFIG = ("media_dir", "text_dir", "pixel_width", "pixel_height")
+
+
+class TextKey(NamedTuple):
+    """One cached text: the string, its font and how it is styled."""
+
+    string: str
+    font: str
+    scale: float
+    color: Optional[str]   # hex, or None for Manim's default
+
+
+class TextInfo(NamedTuple):
+    """Counters reported by :meth:`TextFactory.cache_info`."""
+
+    hits: int
+    misses: int
+    rendered: int          # strings laid out by Pango and parsed, here or on the pool
+    currsize: int
+
+
+def _render(strings: list[tuple[str, str]], settings: dict) -> list[Text]:
+    """Worker: lay out and parse ``(string, font)`` pairs into :class:`Text` mobjects."""
+    with tempconfig(settings):
+        return [Text(string, font=font) for string, font in strings]
+
+
+class TextFactory:
+    """In-memory cache of :class:`~manim.Text` mobjects keyed by :class:`TextKey`.
+
+    ``factory("BioStat", scale=0.6, color=BLACK)`` is
+    ``Text("BioStat").set_color(BLACK).scale(0.6)``, but the Pango layout
+    and SVG parsing of each ``(string, font)`` happen once, and every call
+    returns a copy of a cached prototype.  :meth:`prerender` builds all the
+    strings a scene will need up front, on a process pool when there are
+    many of them.
+    """
+
+    def __init__(self, *, font: str = "", pool_threshold: int = 64) -> None:
+        self.font = font
+        #: Fewer new strings than this are rendered in this process
+        self.pool_threshold = pool_threshold
+        self._plain: dict[tuple[str, str], Text] = {}
+        self._styled: dict[TextKey, Text] = {}
+        self._lock = threading.Lock()
+        self._hits = self._misses = self._rendered = 0
+
+    def key(
+        self, string: str, *, scale: float = 1.0, color: ParsableManimColor | None = None, font: str | None = None
+    ) -> TextKey:
+        """The cache key of a :meth:`__call__` with these arguments."""
+        return TextKey(
+            string,
+            self.font if font is None else font,
+            float(scale),
+            None if color is None else ManimColor(color).to_hex(),
+        )
+
+    def __call__(
+        self, string: str, *, scale: float = 1.0, color: ParsableManimColor | None = None, font: str | None = None
+    ) -> Text:
+        """A fresh copy of *string* in *font*, set to *color* and scaled by *scale*."""
+        key = self.key(string, scale=scale, color=color, font=font)
+        with self._lock:
+            prototype = self._styled.get(key)
+            if prototype is not None:
+                self._hits += 1
+        if prototype is None:
+            prototype = self._plain_text(key.string, key.font).copy()
+            if key.color is not None:
+                prototype.set_color(key.color)
+            prototype.scale(key.scale)
+            with self._lock:
+                self._misses += 1
+                self._styled[key] = prototype
+        return prototype.copy()
+
+    def prerender(self, strings: Iterable[str], *, font: str | None = None, workers: Optional[int] = None) -> int:
+        """Lay out every string of *strings* now; return how many were new.
+
+        Styling is cheap and left to the first call for each key.  From
+        :attr:`pool_threshold` new strings on, they are dealt over *workers*
+        processes (default: one per CPU) and sent back as mobjects.  In a
+        worker process (a :func:`~network_manim.render.render_parallel`
+        part, a storyboard or batch job) they are always laid out in
+        process: its own pool already has the CPUs.
+        """
+        font = self.font if font is None else font
+        todo = [(s, font) for s in dict.fromkeys(strings) if (s, font) not in self._plain]
+        if multiprocessing.parent_process() is not None:
+            workers = 1
+        workers = min(workers or os.cpu_count() or 1, len(todo))
+        if workers <= 1 or len(todo) < self.pool_threshold:
+            for pair in todo:
+                self._plain_text(*pair)
+            return len(todo)
+
+        settings = {key: config[key] for key in _WORKER_CONFIG}
+        # Spawned workers start without this process's Cairo/Pango state
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            chunks = [todo[j::workers] for j in range(workers)]
+            results = list(pool.map(_render, chunks, [settings] * workers))
+        with self._lock:
+            for chunk, texts in zip(chunks, results):
+                self._plain.update(zip(chunk, texts))
+                self._rendered += len(texts)
+        return len(todo)
+
+    def cache_info(self) -> TextInfo:
+        with self._lock:
+            return TextInfo(self._hits, self._misses, self._rendered, len(self._styled))
+
+    def cache_clear(self) -> None:
+        """Drop every cached text and reset the counters."""
+        with self._lock:
+            self._plain.clear()
+            self._styled.clear()
+            self._hits = self._misses = self._rendered = 0
+
+    def _plain_text(self, string: str, font: str) -> Text:
+        with self._lock:
+            text = self._plain.get((string, font))
+        if text is None:
+            text = Text(string, font=font)
+            with self._lock:
+                self._plain[string, font] = text
+                self._rendered += 1
+        return text
+
+
+#: Process-wide factory used by the scenes.
+text_factory = TextFactory()
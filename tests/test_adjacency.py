@@ -0,0 +1,73 @@
+"""Unit tests for the raster adjacency matrix in `network_manim.adjacency`."""
+import numpy as np
+
+from network_manim.adjacency import (
+    AdjacencyMatrixMobject,
+    RecolorCells,
+    RevealMatrix,
+    grid_lines,
+)
+
+TYPES = np.array([[0, 1, 2], [1, 0, 0], [2, 0, 0]], dtype=np.int8)
+
+
+def _matrix(**kwargs):
+    return AdjacencyMatrixMobject(
+        TYPES, cell_size=0.5, colors={1: "#FF0000", 2: "#0000FF"}, **kwargs
+    )
+
+
+def test_matrix_renders_one_pixel_per_cell():
+    matrix = _matrix()
+
+    assert matrix.pixel_array.shape == (3, 3, 4)
+    assert np.allclose([matrix.width, matrix.height], [1.5, 1.5])
+    np.testing.assert_array_equal(matrix.pixel_array[0, 1], [255, 0, 0, 255])
+    np.testing.assert_array_equal(matrix.pixel_array[2, 0], [0, 0, 255, 255])
+    assert matrix.pixel_array[1, 1, 3] == 0  # no edge → transparent
+
+
+def test_set_type_color_touches_only_that_type():
+    matrix = _matrix().set_type_color(2, "#00FF00")
+
+    np.testing.assert_array_equal(matrix.pixel_array[0, 2], [0, 255, 0, 255])
+    np.testing.assert_array_equal(matrix.pixel_array[0, 1], [255, 0, 0, 255])
+
+
+def test_reveal_matrix_by_row():
+    matrix = _matrix(hidden=True)
+    reveal = RevealMatrix(matrix, axis="row")
+    reveal.begin()
+    assert not matrix.pixel_array[..., 3].any()
+
+    reveal.interpolate(0.5)  # first row (of 3) only
+    np.testing.assert_array_equal(matrix.pixel_array[..., 3] > 0, TYPES * [[1], [0], [0]] > 0)
+
+    reveal.finish()
+    np.testing.assert_array_equal(matrix.pixel_array[..., 3] > 0, TYPES > 0)
+
+
+def test_recolor_cells_interpolates_palette():
+    matrix = _matrix()
+    recolor = RecolorCells(matrix, {1: "#000000"})
+    recolor.begin()
+    recolor.interpolate(0.5)
+    assert 120 <= matrix.pixel_array[0, 1, 0] <= 135
+
+    recolor.finish()
+    np.testing.assert_array_equal(matrix.pixel_array[1, 0], [0, 0, 0, 255])
+
+
+def test_grid_lines_is_one_mobject():
+    grid = grid_lines(4, 3, 0.25, top_left=(-1, 1, 0))
+
+    assert len(grid.submobjects) == 0
+    assert len(grid.get_subpaths()) == (4 + 1) + (3 + 1)
+    assert np.allclose(grid.get_corner([-1, 1, 0])[:2], [-1, 1])
+
+
+def test_grid_lines_can_reach_past_the_cells():
+    grid = grid_lines(2, 2, 0.5, top_left=(0, 0, 0), size=(1.25, 1.5))
+
+    assert len(grid.get_subpaths()) == 3 + 3
+    assert np.allclose(grid.get_corner([1, -1, 0])[:2], [1.25, -1.5])
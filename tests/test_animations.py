@@ -0,0 +1,64 @@
+"""Unit tests for play batching in `network_manim.animations`."""
+import pytest
+from manim import AnimationGroup, Dot, FadeIn, Succession, Wait
+
+from network_manim.animations import AnimationBatch, coalesce
+
+FRAME = 1 / 30
+
+
+class _RecordingScene:
+    def __init__(self):
+        self.played = []
+        self.front = []
+
+    def play(self, *animations):
+        self.played.append(animations)
+
+    def bring_to_front(self, *mobjects):
+        self.front.extend(mobjects)
+
+
+def test_coalesce_merges_sub_frame_steps_of_distinct_mobjects():
+    steps = [FadeIn(Dot(), run_time=0.01) for _ in range(7)]
+
+    merged = coalesce(steps, FRAME)
+
+    # 0.01 s each: runs close once they last a frame (4 steps), then the rest.
+    assert [len(group.animations) for group in merged] == [4, 3]
+    assert all(isinstance(group, AnimationGroup) for group in merged)
+    assert merged[0].run_time == pytest.approx(0.04)
+
+
+def test_coalesce_keeps_long_and_same_mobject_steps_apart():
+    dot = Dot()
+    short_a, short_b = FadeIn(dot, run_time=0.01), FadeIn(dot, run_time=0.01)
+    long = Wait(0.5)
+
+    assert coalesce([short_a, short_b, long], FRAME) == [short_a, short_b, long]
+
+
+def test_batch_plays_once_with_same_total_time():
+    scene = _RecordingScene()
+    dots = [Dot() for _ in range(5)]
+
+    with AnimationBatch(scene) as batch:
+        for dot in dots:
+            batch.play(dot.animate.set_fill("#FF0000"), run_time=0.1)
+        batch.wait(2)
+        batch.bring_to_front(dots[0], None)
+
+    assert len(scene.played) == 1
+    (succession,) = scene.played[0]
+    assert isinstance(succession, Succession)
+    assert succession.get_run_time() == pytest.approx(2.5)
+    assert scene.front == [dots[0]]
+
+
+def test_batch_discarded_on_error():
+    scene = _RecordingScene()
+    with pytest.raises(RuntimeError):
+        with AnimationBatch(scene) as batch:
+            batch.wait(1)
+            raise RuntimeError
+    assert scene.played == []
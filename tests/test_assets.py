@@ -0,0 +1,192 @@
+"""Unit tests for the asset helpers in `network_manim.assets`."""
+import os
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from network_manim.assets import AssetIndex, ImageCache, make_thumbnail
+
+
+def _write_png(path, size=(8, 8), color=(255, 0, 0, 255)):
+    Image.new("RGBA", size, color).save(path)
+    return path
+
+
+def _stat(path):
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# --------------------------------------------------------------------------- #
+#   AssetIndex
+# --------------------------------------------------------------------------- #
+
+def test_asset_index_first_root_wins(tmp_path):
+    for folder in ("sds", "fam"):
+        (tmp_path / folder).mkdir()
+    _write_png(tmp_path / "sds" / "alice.png")
+    _write_png(tmp_path / "fam" / "alice.png")
+    _write_png(tmp_path / "fam" / "bob.png")
+    index = AssetIndex(
+        [tmp_path / "sds", tmp_path / "fam", tmp_path / "missing"],
+        manifest=tmp_path / "manifest.json",
+    )
+
+    assert index.get("ALICE") == tmp_path / "sds" / "alice.png"
+    assert index.get("Bob") == tmp_path / "fam" / "bob.png"
+    assert index.get("carol") is None
+    assert index.get("carol", "picture2.png").name == "picture2.png"
+
+
+def test_asset_index_manifest_reused_until_dir_changes(tmp_path):
+    root = tmp_path / "assets"
+    root.mkdir()
+    _write_png(root / "alice.png")
+    manifest = tmp_path / "manifest.json"
+    assert "alice" in AssetIndex([root], manifest=manifest)
+
+    # A fresh index trusts the manifest while the directory mtime is unchanged …
+    stat = os.stat(root)
+    (root / "bob.png").write_bytes(b"")
+    os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert "bob" not in AssetIndex([root], manifest=manifest)
+
+    # … and rescans once it moves.
+    os.utime(root, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert "bob" in AssetIndex([root], manifest=manifest)
+
+
+# --------------------------------------------------------------------------- #
+#   make_thumbnail
+# --------------------------------------------------------------------------- #
+
+def test_thumbnail_is_circular_crop(tmp_path):
+    png = _write_png(tmp_path / "wide.png", size=(300, 200))
+    thumb = make_thumbnail(png, 32, cache_dir=tmp_path / "thumbs")
+
+    with Image.open(thumb) as img:
+        assert img.size == (32, 32)
+        alpha = np.asarray(img.getchannel("A"))
+    assert alpha[0, 0] == 0 and alpha[-1, -1] == 0
+    assert alpha[16, 16] == 255
+
+
+def test_thumbnail_keyed_by_content(tmp_path):
+    a = _write_png(tmp_path / "a.png")
+    b = _write_png(tmp_path / "b.png")  # same bytes, different name
+    c = _write_png(tmp_path / "c.png", color=(0, 255, 0, 255))
+    cache_dir = tmp_path / "thumbs"
+
+    assert make_thumbnail(a, 16, cache_dir=cache_dir) == make_thumbnail(b, 16, cache_dir=cache_dir)
+    assert make_thumbnail(a, 16, cache_dir=cache_dir) != make_thumbnail(c, 16, cache_dir=cache_dir)
+    assert make_thumbnail(a, 16, cache_dir=cache_dir) != make_thumbnail(a, 8, cache_dir=cache_dir)
+
+
+# --------------------------------------------------------------------------- #
+#   ImageCache
+# --------------------------------------------------------------------------- #
+
+def test_image_cache_hit_shares_buffer(tmp_path):
+    png = _write_png(tmp_path / "a.png")
+    cache = ImageCache(maxsize=4)
+
+    first = cache.get(png)
+    second = cache.get(png)
+
+    assert first is second
+    assert first.shape == (8, 8, 4)
+    assert not first.flags.writeable
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions) == (1, 1, 0)
+
+
+def test_image_cache_shares_identical_files(tmp_path):
+    placeholder = _write_png(tmp_path / "picture2.png")
+    copy = _write_png(tmp_path / "copy.png")  # same bytes
+    other = _write_png(tmp_path / "other.png", color=(0, 0, 255, 255))
+    cache = ImageCache()
+
+    assert cache.get(placeholder) is cache.get(copy)
+    assert cache.get(other) is not cache.get(placeholder)
+    assert cache.get(placeholder, 4) is not cache.get(placeholder)
+
+
+def test_image_cache_evicts_least_recently_used(tmp_path):
+    # Distinct contents: identical files share one entry
+    pngs = [_write_png(tmp_path / f"{i}.png", color=(i, 0, 0, 255)) for i in range(3)]
+    cache = ImageCache(maxsize=2)
+
+    cache.get(pngs[0])
+    cache.get(pngs[1])
+    cache.get(pngs[0])  # refresh 0, so 1 is the LRU entry
+    cache.get(pngs[2])
+
+    info = cache.cache_info()
+    assert info.evictions == 1 and info.currsize == 2
+    cache.get(pngs[0])
+    assert cache.cache_info().hits == 2
+
+
+def test_image_cache_invalidated_by_mtime(tmp_path):
+    png = _write_png(tmp_path / "a.png")
+    cache = ImageCache()
+    old = cache.get(png)
+
+    _write_png(png, color=(0, 0, 255, 255))
+    stat = os.stat(png)
+    os.utime(png, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    new = cache.get(png)
+
+    assert cache.cache_info().misses == 2
+    assert not np.array_equal(old, new)
+
+
+def test_image_cache_without_a_writable_thumbnail_dir(tmp_path, monkeypatch):
+    from network_manim import assets
+
+    png = _write_png(tmp_path / "a.png", size=(40, 30))
+    (tmp_path / "file").write_bytes(b"")
+    # mkdir fails under a regular file, even for root
+    monkeypatch.setattr(assets, "_THUMBNAIL_DIR", tmp_path / "file" / "thumbs")
+
+    pixels = ImageCache().get(png, 16)
+    assert pixels.shape == (16, 16, 4)
+    assert not pixels.flags.writeable
+    expected = make_thumbnail(png, 16, cache_dir=tmp_path / "thumbs")
+    assert np.array_equal(pixels, np.asarray(Image.open(expected).convert("RGBA")))
+
+
+def test_content_digests_are_bounded(tmp_path, monkeypatch):
+    from network_manim import assets
+
+    monkeypatch.setattr(assets, "_DIGEST_CACHE_SIZE", 2)
+    monkeypatch.setattr(assets, "_digests", type(assets._digests)())
+    pngs = [_write_png(tmp_path / f"{i}.png") for i in range(3)]
+
+    assert len({assets.content_digest(p) for p in pngs}) == 1
+    assert list(assets._digests) == [(str(p), *_stat(p)) for p in pngs[1:]]
+
+
+def test_image_cache_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ImageCache().get(tmp_path / "nope.png")
+
+
+def test_image_cache_preload_on_threads(tmp_path):
+    pngs = [_write_png(tmp_path / f"{i}.png", color=(i, 0, 0, 255)) for i in range(12)]
+    copies = [_write_png(tmp_path / f"copy{i}.png") for i in range(4)]  # one content, cropped at once
+    cache = ImageCache()
+
+    assert cache.preload([(p, None) for p in pngs + pngs] + [(p, 4) for p in copies], workers=8) == 16
+    misses = cache.cache_info().misses
+    for png in pngs:
+        cache.get(png)
+    assert cache.get(copies[0], 4).shape == (4, 4, 4)
+    assert cache.cache_info().misses == misses
+    assert cache.preload([]) == 0
+
+
+def test_image_cache_preload_reports_errors(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        ImageCache().preload([(tmp_path / "nope.png", None)])
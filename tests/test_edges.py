@@ -0,0 +1,103 @@
+"""Unit tests for the bucketed edge collections in `network_manim.edges`."""
+import numpy as np
+from manim import BLACK, RED, ManimColor, linear
+
+from network_manim.edges import DrawEdges, EdgeCollection, MoveEdges, RestyleEdges
+
+STARTS = np.array([[0, 0, 0], [0, 1, 0], [0, 2, 0], [0, 3, 0]], dtype=float)
+ENDS = STARTS + [1, 0, 0]
+
+
+def _collection(**kwargs):
+    return EdgeCollection(STARTS, ENDS, color=BLACK, **kwargs)
+
+
+def _num_subpaths(bucket):
+    return len(bucket.points) // bucket.n_points_per_cubic_curve
+
+
+def test_one_bucket_holds_every_edge():
+    edges = _collection()
+
+    assert edges.num_edges == 4
+    assert len(edges.submobjects) == 1
+    assert _num_subpaths(edges.bucket(BLACK)) == 4
+    np.testing.assert_allclose(edges.bucket(BLACK).points[-1], ENDS[-1])
+
+
+def test_restyle_moves_edges_between_buckets():
+    edges = _collection()
+    edges.set_style([1, 3], color=RED)
+
+    assert len(edges.submobjects) == 2
+    assert _num_subpaths(edges.bucket(BLACK)) == 2
+    red = edges.bucket(RED)
+    assert _num_subpaths(red) == 2
+    assert red.get_stroke_color() == ManimColor(RED)
+
+    # Same style again: no new bucket, edges go back
+    edges.set_style([1, 3], color=BLACK)
+    assert len(edges.submobjects) == 2 and _num_subpaths(red) == 0
+
+
+def test_progress_draws_partial_edges():
+    edges = _collection(drawn=False)
+    assert len(edges.bucket(BLACK).points) == 0
+
+    edges.set_progress([2], 0.5)
+    np.testing.assert_allclose(edges.bucket(BLACK).points[[0, -1]], [[0, 2, 0], [0.5, 2, 0]])
+
+
+def test_digest_tracks_changes():
+    edges = _collection()
+    before = edges.edges_digest
+    edges.put_endpoints([0], [0, 0, 0], [2, 0, 0])
+
+    assert edges.edges_digest != before
+
+
+def test_draw_edges_one_after_another():
+    edges = _collection(drawn=False)
+    anim = DrawEdges(edges, [0, 1], lag_ratio=1, rate_func=linear)
+    anim.begin()
+    anim.interpolate(0.75)
+
+    np.testing.assert_allclose(edges.progress, [1, 0.5, 0, 0])
+
+
+def test_restyle_edges_sweeps_and_reverts():
+    edges = _collection()
+    anim = RestyleEdges(edges, [0, 1, 2, 3], color=RED, rate_func=linear)
+    anim.begin()
+    anim.interpolate(0.5)
+    assert _num_subpaths(edges.bucket(RED)) == 2
+
+    anim.interpolate(0.25)
+    assert _num_subpaths(edges.bucket(RED)) == 1
+    anim.interpolate(1)
+    assert _num_subpaths(edges.bucket(BLACK)) == 0
+
+
+def test_move_edges_interpolates_from_start():
+    edges = _collection()
+    anim = MoveEdges(edges, [0], [[0, -2, 0]], [[1, -2, 0]], rate_func=linear)
+    anim.begin()
+    anim.interpolate(0.5)
+
+    np.testing.assert_allclose(edges.starts[0], [0, -1, 0])
+    np.testing.assert_allclose(edges.ends[1], ENDS[1])
+
+
+def test_moving_visible_edges_writes_points_in_place():
+    edges = _collection()
+    edges.set_progress([0], 0)
+    bucket = edges.bucket(BLACK)
+    points = bucket.points
+
+    edges.put_endpoints([0, 2], [[0, -1, 0], [0, -2, 0]], [[1, -1, 0], [1, -2, 0]])
+
+    assert bucket.points is points
+    # Edge 0 is hidden, so edge 2 is the second subpath
+    np.testing.assert_allclose(points[[4, 7]], [[0, -2, 0], [1, -2, 0]])
+    edges.set_progress([0], 1)
+    np.testing.assert_allclose(bucket.points[[0, 3]], [[0, -1, 0], [1, -1, 0]])
@@ -2,11 +2,34 @@
 
 These tests focus on *logic*, not rendered pixels, so they run quickly in CI.
 """
+import os
 from itertools import combinations
 
+import networkx as nx
+import numpy as np
+import pytest
 from manim import Dot, Line
+from PIL import Image
 
-from network_manim.graph_utils import CustomDot, build_edge, build_clique
+from network_manim import graph_utils
+from network_manim.assets import AssetIndex, ImageCache
+
+from network_manim.graph_utils import (
+    CachedImageMobject,
+    CustomDot,
+    EdgeTypeIndex,
+    ReplacementMap,
+    build_clique,
+    build_edge,
+    build_edges,
+    circular_image_node,
+    community_layout,
+    edge_endpoints,
+    force_layout,
+    pack_circles,
+    preload_images,
+    replace_dot_list,
+)
 
 
 # --------------------------------------------------------------------------- #
@@ -25,6 +48,71 @@ def test_customdot_fallback_dot():
     assert isinstance(dot, Dot)
 
 
+# --------------------------------------------------------------------------- #
+#   Shared image buffers
+# --------------------------------------------------------------------------- #
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        pytest.skip("needs /proc/self/statm")
+
+
+def _placeholder(tmp_path, size=1024):
+    png = tmp_path / "picture2.png"
+    Image.new("RGBA", (size, size), (200, 100, 50, 255)).save(png)
+    return png
+
+
+def test_duplicate_image_nodes_add_bounded_rss(tmp_path):
+    png = _placeholder(tmp_path)
+    cache = ImageCache()
+    pixels = cache.get(png)  # 4 MiB decoded
+    nodes = [CachedImageMobject(pixels)]
+    before = _rss_bytes()
+    for _ in range(100):
+        node = CachedImageMobject(cache.get(png))
+        nodes += [node, node.copy()]
+    per_node = (_rss_bytes() - before) / 200
+
+    assert all(node.pixel_array is pixels for node in nodes)
+    assert per_node < 0.05 * pixels.nbytes
+
+
+def test_tinting_copies_only_that_node(tmp_path):
+    pixels = ImageCache().get(_placeholder(tmp_path, 8))
+    tinted, plain = CachedImageMobject(pixels), CachedImageMobject(pixels)
+
+    tinted.set_opacity(0.5)
+    assert tinted.pixel_array is not pixels and plain.pixel_array is pixels
+    assert pixels[0, 0, 3] == 255 and tinted.pixel_array[0, 0, 3] == 127
+
+    # A fade in ends on the shared buffer, not on a private copy
+    start, end = plain.copy().fade(1), plain.copy()
+    assert end.pixel_array is pixels
+    plain.interpolate(start, end, 0.5)
+    assert plain.pixel_array is not pixels
+    plain.interpolate(start, end, 1.0)
+    assert plain.pixel_array is pixels
+
+
+def test_preloaded_nodes_never_decode(tmp_path, monkeypatch):
+    for k, label in enumerate(("alice", "bob", "carol")):
+        Image.new("RGBA", (64, 64), (k, 0, 0, 255)).save(tmp_path / f"{label}.png")
+    monkeypatch.setattr(graph_utils, "_ASSET_INDEX", AssetIndex([tmp_path], manifest=tmp_path / "index.json"))
+    monkeypatch.setattr(graph_utils, "image_cache", cache := ImageCache())
+
+    assert preload_images(["Alice", "bob", "BOB", "dave"], workers=4) == 2
+    misses = cache.cache_info().misses
+    circular_image_node("alice")
+    circular_image_node("Bob")
+    assert cache.cache_info().misses == misses
+    circular_image_node("carol")
+    assert cache.cache_info().misses == misses + 1
+
+
 # --------------------------------------------------------------------------- #
 #   build_edge
 # --------------------------------------------------------------------------- #
@@ -51,4 +139,210 @@ def test_build_clique_edge_count():
     clique = build_clique(nodes)
 
     expected_edges = len(list(combinations(nodes, 2)))  # nC2
-    assert len(clique) == expected_edges
\ No newline at end of file
+    assert len(clique) == expected_edges
+
+
+# --------------------------------------------------------------------------- #
+#   edge_endpoints / build_edges
+# --------------------------------------------------------------------------- #
+
+def test_edge_endpoints_trim_both_ends():
+    positions = np.array([[0, 0, 0], [2, 0, 0], [2, 0, 0], [2.3, 0, 0]], dtype=float)
+    starts, ends = edge_endpoints(positions, np.array([[0, 1], [1, 2], [1, 3]]), 0.2)
+
+    np.testing.assert_allclose(starts[0], [0.2, 0, 0])
+    np.testing.assert_allclose(ends[0], [1.8, 0, 0])
+    # Zero-length edge collapses onto its node instead of producing NaNs
+    np.testing.assert_allclose(starts[1], ends[1])
+    np.testing.assert_allclose(starts[1], [2, 0, 0])
+    # Overlapping nodes: both ends meet between the borders
+    np.testing.assert_allclose(starts[2], ends[2])
+
+
+def test_edge_endpoints_per_node_trim():
+    positions = np.array([[0, 0, 0], [0, 3, 0]], dtype=float)
+    starts, ends = edge_endpoints(positions, [[0, 1]], np.array([0.5, 1.0]))
+
+    np.testing.assert_allclose(starts, [[0, 0.5, 0]])
+    np.testing.assert_allclose(ends, [[0, 2.0, 0]])
+
+
+def test_build_edges_returns_trimmed_lines():
+    positions = np.array([[0, 0, 0], [4, 0, 0], [0, 3, 0]], dtype=float)
+    edges = build_edges(positions, np.array([[0, 1], [0, 2]]), trim=0.5, width=3)
+
+    assert len(edges) == 2 and all(isinstance(e, Line) for e in edges)
+    np.testing.assert_allclose(edges[0].get_start(), [0.5, 0, 0])
+    np.testing.assert_allclose(edges[1].get_end(), [0, 2.5, 0])
+    assert edges[1].stroke_width == 3
+    # Lines are independent copies
+    edges[0].shift([0, 1, 0])
+    np.testing.assert_allclose(edges[1].get_start(), [0, 0.5, 0])
+
+
+# --------------------------------------------------------------------------- #
+#   ReplacementMap / replace_dot_list
+# --------------------------------------------------------------------------- #
+
+def test_replacement_map_identity_and_key():
+    a, b = Dot([0, 0, 0]), Dot([1, 0, 0])
+    new_a, new_b = Dot([0, 0, 0]), Dot([1, 0, 0])
+    mapping = ReplacementMap()
+    mapping.add(a, new_a)
+    mapping.add(b, new_b, key="B")
+
+    assert mapping.replace([a, b]) == [new_a, new_b]
+    assert mapping.get(Dot([5, 5, 0]), key="B") is new_b
+    assert mapping.get(Dot([5, 5, 0])) is None
+
+
+def test_replacement_map_position_fallback():
+    old, new = Dot([2, 1, 0]), Dot([2, 1, 0])
+    mapping = ReplacementMap([(old, new)])
+
+    assert mapping[Dot([2, 1, 0])] is new
+    with pytest.raises(KeyError):
+        mapping[Dot([2.1, 1, 0])]
+
+
+def test_replacement_map_overlap_is_ambiguous():
+    a, b = Dot([0, 0, 0]), Dot([0, 0, 0])
+    mapping = ReplacementMap([(a, Dot()), (b, Dot())])
+
+    assert mapping[a] is not mapping[b]  # identity still works
+    with pytest.raises(ValueError):
+        mapping.get(Dot([0, 0, 0]))
+
+
+def test_replace_dot_list_accepts_dict():
+    dots = [Dot([i, 0, 0]) for i in range(3)]
+    white = Dot([1, 0, 0])
+    assert replace_dot_list(dots, {dots[1]: white}) == [dots[0], white, dots[2]]
+
+
+# --------------------------------------------------------------------------- #
+#   EdgeTypeIndex
+# --------------------------------------------------------------------------- #
+
+def test_edge_type_index_lookup_is_unordered():
+    index = EdgeTypeIndex()
+    index.add_edges([("a", "b"), ("b", "c")], 3)
+    index.add("b", "a", 1)  # lower type wins
+
+    assert index.lookup("a", "b") == index.lookup("b", "a") == 1
+    assert index.lookup("c", "b") == 3
+    assert index.lookup("a", "c") is None
+    assert ("a", "z") not in index
+    assert len(index) == 2
+
+
+def test_edge_type_index_matrix():
+    index = EdgeTypeIndex()
+    index.add("a", "b", 1)
+    index.add("b", "c", 4)
+    index.add("c", "outside", 2)
+
+    matrix = index.matrix(["c", "a", "b"])
+    assert matrix.dtype == np.int8
+    np.testing.assert_array_equal(matrix, [[0, 0, 4], [0, 0, 1], [4, 1, 0]])
+    with pytest.raises(ValueError):
+        index.matrix(["a", "a"])
+
+
+# --------------------------------------------------------------------------- #
+#   Force layout
+# --------------------------------------------------------------------------- #
+
+def test_barnes_hut_repulsion_matches_the_exact_sum():
+    from network_manim.graph_utils import _barnes_hut_repulsion
+
+    points = np.random.default_rng(0).normal(size=(800, 2))
+    points[:4] = points[4]  # coincident nodes do not push each other
+    delta = points[:, None] - points[None]
+    dist2 = np.einsum("ijk,ijk->ij", delta, delta)
+    dist2[dist2 == 0] = np.inf
+    exact = (delta / dist2[..., None]).sum(axis=1)
+
+    approx = _barnes_hut_repulsion(points, theta=0.8, max_depth=10)
+    error = np.linalg.norm(approx - exact, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.median(error) < 0.01 and error.max() < 0.2
+
+
+def _ring_of_cliques(cliques=6, size=5):
+    graph = nx.ring_of_cliques(cliques, size)
+    return graph.number_of_nodes(), np.array(graph.edges)
+
+
+def test_force_layout_pulls_neighbours_together():
+    n, edges = _ring_of_cliques()
+    positions = force_layout(n, edges, seed=1)
+
+    assert positions.shape == (n, 3) and not positions[:, 2].any()
+    linked = np.linalg.norm(positions[edges[:, 0]] - positions[edges[:, 1]], axis=1)
+    pairs = np.random.default_rng(0).integers(0, n, (500, 2))
+    anywhere = np.linalg.norm(positions[pairs[:, 0]] - positions[pairs[:, 1]], axis=1)
+    assert linked.mean() < 0.5 * anywhere.mean()
+    np.testing.assert_array_equal(positions, force_layout(n, edges, seed=1))
+
+
+def test_force_layout_warm_start_stays_put():
+    n, edges = _ring_of_cliques()
+    before = force_layout(n, edges, seed=1, iterations=200)
+    after = force_layout(n, np.vstack([edges, [[0, 17]]]), initial=before, iterations=20)
+
+    extent = np.ptp(before[:, :2], axis=0).max()
+    assert np.median(np.linalg.norm(after - before, axis=1)) < 0.1 * extent
+    with pytest.raises(ValueError):
+        force_layout(n + 1, edges, initial=before)
+
+
+# --------------------------------------------------------------------------- #
+#   Community layout
+# --------------------------------------------------------------------------- #
+
+def test_pack_circles_leaves_gaps():
+    radii = np.random.default_rng(1).uniform(0.3, 2.0, 40)
+    centers = pack_circles(radii, gap=0.5, seed=2)
+
+    distance = np.linalg.norm(centers[:, None] - centers[None], axis=2)
+    clearance = distance - radii[:, None] - radii[None]
+    np.fill_diagonal(clearance, np.inf)
+    assert clearance.min() >= 0.5 - 1e-3
+    # Packed, not scattered: the circles cover a fair share of their bounding box
+    extent = (centers + radii[:, None]).max(axis=0) - (centers - radii[:, None]).min(axis=0)
+    assert np.pi * np.sum(radii**2) / extent.prod() > 0.4
+    np.testing.assert_array_equal(centers, pack_circles(radii, gap=0.5, seed=2))
+
+
+@pytest.mark.parametrize("within", ["circle", "force"])
+def test_community_layout_places_nodes_inside_their_circle(within, tmp_path):
+    community = np.repeat(np.arange(4), [6, 3, 1, 9])
+    edges = np.array([(i, j) for j in range(19) for i in range(j) if community[i] == community[j]])
+    layout = community_layout(community, edges, within=within, cache_dir=tmp_path)
+
+    assert layout.positions.shape == (19, 3)
+    distance = np.linalg.norm(layout.positions - layout.centers[community], axis=1)
+    assert np.all(distance <= layout.radii[community] + 1e-9)
+    if within == "circle":
+        np.testing.assert_allclose(distance[community == 0], layout.radii[0])
+
+
+def test_community_layout_is_cached_by_graph_and_seed(tmp_path):
+    community = np.repeat(np.arange(5), 4)
+    first = community_layout(community, seed=1, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.npz"))) == 1
+
+    again = community_layout(community, seed=1, cache_dir=tmp_path)
+    np.testing.assert_array_equal(first.positions, again.positions)
+    community_layout(community, seed=2, cache_dir=tmp_path)
+    assert len(list(tmp_path.glob("*.npz"))) == 2
+
+
+def test_community_layout_without_a_writable_cache_dir(tmp_path):
+    community = np.repeat(np.arange(3), 4)
+    (tmp_path / "file").write_bytes(b"")
+    # mkdir fails under a regular file, even for root
+    layout = community_layout(community, seed=1, cache_dir=tmp_path / "file" / "layouts")
+
+    expected = community_layout(community, seed=1, cache=False)
+    np.testing.assert_array_equal(layout.positions, expected.positions)
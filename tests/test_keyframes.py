@@ -0,0 +1,42 @@
+"""Unit tests for the array-interpolated node animations in `network_manim.keyframes`."""
+import numpy as np
+import pytest
+from manim import BLUE, RED, Dot, ImageMobject, linear
+from manim.utils.color import color_to_rgba
+
+from network_manim.keyframes import NodeKeyframes
+
+
+def _dots(n=4):
+    return [Dot([i, 0, 0], radius=0.2, color=RED) for i in range(n)]
+
+
+def test_moves_and_scales_about_each_centre():
+    dots = _dots()
+    targets = np.array([[0, 2, 0], [1, 2, 0], [2, 2, 0], [3, 2, 0]], dtype=float)
+    anim = NodeKeyframes(dots, positions=targets, scale=0.5, rate_func=linear)
+    anim.begin()
+
+    anim.interpolate(0.5)
+    np.testing.assert_allclose(dots[1].get_center(), [1, 1, 0], atol=1e-9)
+    np.testing.assert_allclose(dots[1].width, 0.4 * 0.75)
+    anim.finish()
+    np.testing.assert_allclose([d.get_center() for d in dots], targets, atol=1e-9)
+    np.testing.assert_allclose(dots[3].width, 0.2)
+
+
+def test_recolours_one_after_another():
+    dots = _dots()
+    anim = NodeKeyframes(dots, colors=[BLUE] * 4, lag_ratio=1, rate_func=linear)
+    anim.begin()
+
+    anim.interpolate(0.5)  # the first two are done, the others not started
+    np.testing.assert_allclose(dots[1].fill_rgbas[0], color_to_rgba(BLUE))
+    np.testing.assert_allclose(dots[2].fill_rgbas[0], color_to_rgba(RED))
+    anim.interpolate(0.625)
+    np.testing.assert_allclose(dots[2].fill_rgbas[0], (color_to_rgba(RED) + color_to_rgba(BLUE)) / 2)
+
+
+def test_only_vmobjects_can_be_recoloured():
+    with pytest.raises(TypeError):
+        NodeKeyframes([ImageMobject(np.zeros((2, 2, 4), dtype=np.uint8))], colors=BLUE)
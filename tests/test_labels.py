@@ -0,0 +1,92 @@
+"""Unit tests for the glyph-atlas node labels in `network_manim.labels`."""
+import numpy as np
+from manim import LEFT, UP, config, linear
+from PIL import Image, ImageDraw
+
+from network_manim.labels import AtlasLabels, GlyphAtlas, ShowLabels
+from network_manim.layout import MoveNodes, NodeLayout
+
+
+def _covered(labels):
+    rows, cols = np.nonzero(labels.get_pixel_array()[..., 3])
+    return rows, cols
+
+
+def test_sprite_matches_drawing_the_string():
+    atlas = GlyphAtlas("Hello World", 24)
+    sprite = atlas.sprite("Hello World")
+
+    image = Image.new("L", (sprite.shape[1], atlas.height), 0)
+    ImageDraw.Draw(image).text((-atlas.font.getbbox("H")[0], 0), "Hello World", font=atlas.font, fill=255)
+    np.testing.assert_array_equal(sprite, np.array(image))
+
+
+def test_labels_start_hidden_and_fade_in():
+    labels = AtlasLabels(["A", None, "B"], np.zeros((3, 3)), size=0.5)
+    assert not _covered(labels)[0].size
+
+    anim = ShowLabels(labels, [0], rate_func=linear)
+    anim.begin()
+    anim.interpolate(0.5)
+    half = labels.get_pixel_array()[..., 3].max()
+    anim.finish()
+    full = labels.get_pixel_array()[..., 3].max()
+    assert full > 0 and abs(int(half) - full / 2) <= 0.5
+    np.testing.assert_array_equal(labels.alphas, [1, 0, 0])
+
+
+def test_label_sits_beside_its_node():
+    labels = AtlasLabels(["X"], np.zeros((1, 3)), size=0.5, direction=LEFT, buff=0.1, radius=0.3)
+    labels.alphas[:] = 1
+    rows, cols = _covered(labels)
+    ppu = config.pixel_height / config.frame_height
+
+    assert cols.max() <= config.pixel_width / 2 - 0.4 * ppu + 1
+    assert abs((rows.min() + rows.max()) / 2 - config.pixel_height / 2) < 0.3 * ppu
+
+
+def test_labels_follow_the_layout():
+    layout = NodeLayout(np.array([[0, 0, 0], [1, 0, 0]], dtype=float), np.array([[0, 1]]))
+    labels = layout.follow(AtlasLabels(["A", "B"], layout.positions, size=0.5, direction=UP))
+    labels.alphas[:] = 1
+    rows, cols = _covered(labels)
+    digest = labels.labels_digest
+
+    anim = MoveNodes(layout, [0, 1], layout.positions + [0, -1, 0])
+    assert labels in anim.mobject.submobjects
+    anim.begin()
+    anim.finish()
+    moved_rows, moved_cols = _covered(labels)
+    ppu = config.pixel_height / config.frame_height
+
+    np.testing.assert_array_equal(moved_cols, cols)
+    np.testing.assert_allclose(moved_rows, rows + ppu, atol=1)
+    assert labels.labels_digest != digest
+
+
+def test_labels_are_clipped_at_the_frame_edge():
+    left_edge = [[-config.frame_width / 2, 0, 0]]
+    labels = AtlasLabels(["Edge"], np.array(left_edge, dtype=float), size=0.5)
+    labels.alphas[:] = 1
+    rows, cols = _covered(labels)
+    whole = AtlasLabels(["Edge"], np.zeros((1, 3)), size=0.5)
+    whole.alphas[:] = 1
+    whole_rows, whole_cols = _covered(whole)
+
+    # The same pixels, shifted left by half the frame, minus those off screen
+    shifted = whole_cols - config.pixel_width // 2
+    expected = set(zip(whole_rows[shifted >= 0], shifted[shifted >= 0]))
+    assert 0 < len(expected) < len(whole_rows)
+    assert set(zip(rows, cols)) == expected
+
+
+def test_fade_and_copies_share_the_layout():
+    positions = np.zeros((1, 3))
+    labels = AtlasLabels(["A"], positions, size=0.5)
+    labels.alphas[:] = 1
+    full = labels.get_pixel_array()[..., 3].max()
+    faded = labels.copy().fade(1)
+
+    assert faded.positions is positions and faded.opacity == 0
+    labels.interpolate_color(labels.copy(), faded, 0.5)
+    assert labels.get_pixel_array()[..., 3].max() == np.rint(full / 2)
@@ -0,0 +1,52 @@
+"""Unit tests for the array-backed node layouts in `network_manim.layout`."""
+import numpy as np
+from manim import Dot, linear
+
+from network_manim.layout import MoveNodes, NodeLayout
+
+POSITIONS = np.array([[0, 0, 0], [2, 0, 0], [2, 2, 0], [0, 2, 0], [5, 5, 0]], dtype=float)
+EDGES = np.array([[0, 1], [1, 2], [0, 2], [2, 3]])
+
+
+def test_incident_edges_from_csr_index():
+    layout = NodeLayout(POSITIONS, EDGES)
+
+    assert layout.incident_edges([0]).tolist() == [0, 2]
+    assert layout.incident_edges([1, 3]).tolist() == [0, 1, 3]
+    assert layout.incident_edges([4]).tolist() == []
+
+
+def test_move_updates_only_incident_edges():
+    layout = NodeLayout(POSITIONS, EDGES, radius=0.5)
+    edges = layout.edge_mobject
+    untouched = edges.starts[1].copy(), edges.ends[1].copy()
+    dot = Dot(POSITIONS[3])
+    layout.attach(3, dot)
+
+    layout.move([3], [[0, 4, 0]])
+
+    np.testing.assert_allclose(dot.get_center(), [0, 4, 0])
+    # Edge 2-3 now runs along (-1, 1), trimmed by 0.5 at node 3
+    np.testing.assert_allclose(edges.ends[3], [0, 4, 0] + 0.5 * np.array([1, -1, 0]) / np.sqrt(2))
+    np.testing.assert_allclose(edges.starts[1], untouched[0])
+    np.testing.assert_allclose(edges.ends[1], untouched[1])
+
+
+def test_labels_keep_their_offset():
+    layout = NodeLayout(POSITIONS, EDGES)
+    dot, label = Dot(POSITIONS[0]), Dot(POSITIONS[0] + [0, 0.3, 0])
+    layout.attach(0, dot, label)
+
+    layout.move([0], [[1, 1, 0]])
+
+    np.testing.assert_allclose(label.get_center() - dot.get_center(), [0, 0.3, 0])
+
+
+def test_move_nodes_interpolates_positions():
+    layout = NodeLayout(POSITIONS, EDGES)
+    anim = MoveNodes(layout, [0, 1], [[0, -2, 0], [2, -2, 0]], rate_func=linear)
+    anim.begin()
+    anim.interpolate(0.5)
+
+    np.testing.assert_allclose(layout.positions[:2], [[0, -1, 0], [2, -1, 0]])
+    np.testing.assert_allclose(layout.edge_mobject.starts[0], [0, -1, 0])
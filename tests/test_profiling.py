@@ -0,0 +1,37 @@
+"""Unit tests for per-play profiling in `network_manim.profiling`."""
+import json
+
+from manim import Dot, FadeIn, Scene, tempconfig
+
+from network_manim.profiling import PlayProfiler
+
+
+class _TwoPlays(Scene):
+    def construct(self):
+        self.play(FadeIn(Dot()), run_time=0.4)
+        self.wait(0.2)
+
+
+def test_every_play_is_recorded(tmp_path):
+    with tempconfig({"dry_run": True, "quality": "low_quality", "frame_rate": 10, "disable_caching": True}):
+        scene = _TwoPlays()
+        with PlayProfiler(scene) as profiler:
+            scene.render()
+
+    first, second = profiler.records
+    assert (first.kind, first.animations, first.frames) == ("play", 1, 4)
+    assert second.kind == "wait"
+    assert first.line.startswith("test_profiling.py:")
+    assert first.render > 0 and first.wall >= first.render
+
+    trace = json.loads(profiler.write_chrome_trace(tmp_path / "trace.json").read_text())
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert {"render", "encode", f"play {first.line}"} <= names
+    assert "2 plays" in profiler.summary()
+
+
+def test_instrumentation_is_removed_afterwards():
+    scene = _TwoPlays()
+    with PlayProfiler(scene):
+        assert "play" in vars(scene.renderer)
+    assert "play" not in vars(scene.renderer)
@@ -0,0 +1,64 @@
+"""Unit tests for the lazy scene registry in `network_manim.registry`."""
+import pytest
+
+from network_manim import registry
+
+
+def test_builtin_scenes_are_listed_without_import():
+    assert registry.available_scenes()["multi-clique"].endswith(":MultiCliqueAnimated7")
+
+
+def test_entry_points_add_scenes_without_shadowing(monkeypatch):
+    class _EntryPoint:
+        def __init__(self, name, value):
+            self.name, self.value = name, value
+
+    plugins = [_EntryPoint("json-dump", "json:dumps"), _EntryPoint("multi-clique", "json:loads")]
+    monkeypatch.setattr(registry, "_entry_points", lambda: plugins)
+
+    scenes = registry.available_scenes()
+    assert scenes["json-dump"] == "json:dumps"
+    assert scenes["multi-clique"] == registry.BUILTIN_SCENES["multi-clique"]
+
+    import json
+    assert registry.load_scene("json-dump") is json.dumps
+
+
+def test_unknown_scene():
+    with pytest.raises(KeyError):
+        registry.load_scene("nope")
+
+
+def test_cli_renders_scenes_without_a_spec(tmp_path, monkeypatch):
+    """Third-party scenes need not accept ``spec``; it is only passed with ``--spec``."""
+    from manim import tempconfig
+    from typer.testing import CliRunner
+
+    from network_manim import cli, render
+
+    (tmp_path / "plain_pack.py").write_text(
+        "from manim import Dot, Scene\n\n"
+        "class PlainScene(Scene):\n"
+        "    def construct(self):\n"
+        "        self.add(Dot())\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    class _EntryPoint:
+        name, value = "plain", "plain_pack:PlainScene"
+
+    monkeypatch.setattr(registry, "_entry_points", lambda: [_EntryPoint()])
+    built = []
+
+    def render_scene(scene_cls, *, scene_kwargs, **options):
+        with tempconfig({"dry_run": True}):
+            scene = scene_cls(**scene_kwargs)
+            scene.render()
+        built.append(scene)
+        return tmp_path / "PlainScene.mp4"
+
+    monkeypatch.setattr(render, "render_scene", render_scene)
+    result = CliRunner().invoke(cli.app, ["render", "plain", "--quality", "l", "--no-cache"])
+
+    assert result.exit_code == 0, result.output
+    assert type(built[0]).__name__ == "PlainScene"
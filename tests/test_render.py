@@ -0,0 +1,50 @@
+"""Unit tests for the batch renderer in `network_manim.render`."""
+import json
+
+from manim import Scene
+
+from network_manim.render import render_batch
+
+
+class _Broken(Scene):
+    def construct(self):
+        raise ValueError("no network")
+
+
+def test_batch_reports_every_render_in_the_summary(tmp_path):
+    summary = tmp_path / "summary.json"
+
+    results = render_batch({"broken": _Broken}, ["l", "m"], workers=2, cache=False, summary=summary)
+
+    assert [(r["scene"], r["quality"], r["status"]) for r in results] == [
+        ("broken", "l", "error"), ("broken", "m", "error"),
+    ]
+    assert "no network" in results[0]["error"]
+    written = json.loads(summary.read_text())
+    assert written["workers"] == 2 and written["renders"] == results
+
+
+def test_batch_warms_images_per_quality_and_text_once(monkeypatch):
+    from manim import config, tempconfig
+
+    from network_manim import render
+
+    class _Portraits(Scene):
+        @classmethod
+        def asset_labels(cls, spec=None):
+            return ["alice", "bob"]
+
+        @classmethod
+        def text_strings(cls, spec=None):
+            return ["IntraLab"]
+
+    preloaded, laid_out = [], []
+    monkeypatch.setattr(render, "preload_images", lambda labels: preloaded.append((config.pixel_height, labels)))
+    monkeypatch.setattr(render.text_factory, "prerender", laid_out.append)
+
+    with tempconfig({}):  # warming sets each quality in turn
+        render._warm_caches({"portraits": _Portraits, "broken": _Broken}, ["l", "m"], {})
+
+    assert [height for height, _ in preloaded] == [480, 720]
+    assert all(labels == ["alice", "bob"] for _, labels in preloaded)
+    assert laid_out == [["IntraLab"]]
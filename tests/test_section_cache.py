@@ -0,0 +1,73 @@
+"""Unit tests for section fingerprints and the section video cache."""
+from network_manim.section_cache import SectionCache, section_fingerprints
+from network_manim.sections import SectionedScene
+
+
+class _Slides(SectionedScene):
+    SECTIONS = ("intro", "body", "legend")
+    FACETS = {"legend": ("legend",)}
+
+    @classmethod
+    def section_inputs(cls, title="Network", legend="InterProche"):
+        return {"title": title, "legend": legend}
+
+
+def test_facet_change_only_touches_its_sections():
+    before = section_fingerprints(_Slides, "m", {})
+    after = section_fingerprints(_Slides, "m", {"legend": "InterLab"})
+
+    assert [before[s] == after[s] for s in _Slides.SECTIONS] == [True, True, False]
+    # Unlisted facets count for every section
+    retitled = section_fingerprints(_Slides, "m", {"title": "Graph"})
+    assert all(before[s] != retitled[s] for s in _Slides.SECTIONS)
+
+
+def test_fingerprints_depend_on_quality_and_position():
+    medium, low = section_fingerprints(_Slides, "m", {}), section_fingerprints(_Slides, "l", {})
+
+    assert all(medium[s] != low[s] for s in _Slides.SECTIONS)
+    assert len(set(medium.values())) == len(_Slides.SECTIONS)
+
+
+def test_cache_round_trip(tmp_path):
+    cache = SectionCache(tmp_path / "cache")
+    video = tmp_path / "section.mp4"
+    video.write_bytes(b"frames")
+
+    assert cache.lookup("abc") == (False, None)
+    stored = cache.store("abc", video)
+    assert cache.lookup("abc") == (True, stored)
+    assert stored.read_bytes() == b"frames"
+
+    # Sections without a video are remembered too
+    cache.store("empty", None)
+    assert cache.lookup("empty") == (True, None)
+
+
+def test_fingerprints_follow_the_scene_source(tmp_path, monkeypatch):
+    import importlib
+
+    module = tmp_path / "edited_slides.py"
+    module.write_text(
+        "from network_manim.sections import SectionedScene\n\n"
+        "class Edited(SectionedScene):\n"
+        "    SECTIONS = ('intro',)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    scene_cls = importlib.import_module("edited_slides").Edited
+    before = section_fingerprints(scene_cls, "m", {})
+
+    module.write_text(module.read_text() + "    # construct changed\n")
+    assert section_fingerprints(scene_cls, "m", {}) != before
+
+
+def test_spec_files_count_by_content(tmp_path):
+    class _Plain(SectionedScene):
+        SECTIONS = ("intro",)
+
+    spec = tmp_path / "network.toml"
+    spec.write_text("labels = ['A']\n")
+    before = section_fingerprints(_Plain, "m", {"spec": spec})
+
+    spec.write_text("labels = ['B']\n")
+    assert section_fingerprints(_Plain, "m", {"spec": spec}) != before
@@ -0,0 +1,42 @@
+"""Unit tests for sectioned scenes and the parallel section renderer."""
+import pytest
+from manim.utils.exceptions import EndSceneEarlyException
+
+from network_manim.render import split_sections
+from network_manim.sections import SectionedScene
+
+
+class _ThreeSections(SectionedScene):
+    SECTIONS = ("a", "b", "c")
+
+    def next_section(self, name="unnamed", section_type="default.normal", skip_animations=False):
+        self.started.append((name, skip_animations))
+
+
+def _walk(scene):
+    """Begin every section in order, noting where construct would stop."""
+    scene.started = []
+    try:
+        for name in scene.SECTIONS:
+            scene.begin_section(name)
+    except EndSceneEarlyException:
+        scene.started.append("end")
+    return scene.started
+
+
+def test_all_sections_render_by_default():
+    assert _walk(_ThreeSections()) == [("a", False), ("b", False), ("c", False)]
+
+
+def test_other_sections_are_skipped_and_the_tail_cut():
+    assert _walk(_ThreeSections(render_sections=["b"])) == [("a", True), ("b", False), "end"]
+
+
+def test_unknown_sections_are_rejected():
+    with pytest.raises(ValueError, match="no section"):
+        _ThreeSections(render_sections=["z"])
+
+
+def test_split_sections_round_robin():
+    assert split_sections(list("abcde"), 2) == [("a", "c", "e"), ("b", "d")]
+    assert split_sections(list("ab"), 8) == [("a",), ("b",)]
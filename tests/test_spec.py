@@ -0,0 +1,115 @@
+"""Unit tests for the declarative network specs in `network_manim.spec`."""
+import json
+
+import networkx as nx
+import numpy as np
+import pytest
+
+from network_manim.spec import GraphSpec
+
+SPEC = {
+    "groups": {"middle": {"color": "#800000"}},
+    "cliques": [
+        {"name": "SDS", "group": "middle", "nodes": ["X", "Y", "Y1"], "radius": 1.0},
+        {"name": "Bio", "group": "left", "nodes": ["B1", "B2"]},
+        {"name": "Fam", "group": "right", "nodes": ["F1", "F2"]},
+    ],
+    "edges": [["X", "B1"], ["F1", "X"], ["Y1", "B2", 4]],
+}
+
+
+def test_dict_spec_orders_and_types_edges():
+    spec = GraphSpec.from_dict(SPEC)
+
+    assert spec.labels == ["X", "Y", "Y1", "B1", "B2", "F1", "F2"]
+    # Complete cliques first, in build order, then the links as given
+    assert spec.edges.tolist() == [
+        [0, 1], [0, 2], [1, 2], [3, 4], [5, 6], [0, 3], [0, 5], [2, 4],
+    ]
+    assert spec.edge_types.tolist() == [1, 1, 1, 1, 3, 2, 4, 4]
+
+
+def test_layout_is_precomputed():
+    spec = GraphSpec.from_dict(SPEC)
+
+    assert spec.positions.shape == (7, 3)
+    np.testing.assert_allclose(spec.positions[0], [1, 0, 0])  # radius 1 at angle 0
+    bio, fam = spec.cliques[1], spec.cliques[2]
+    assert bio.center[0] < 0 < fam.center[0]
+    distances = np.linalg.norm(spec.positions[bio.members] - bio.center, axis=1)
+    np.testing.assert_allclose(distances, bio.radius)
+
+
+def test_adjacency_is_symmetric():
+    adjacency = GraphSpec.from_dict(SPEC).adjacency()
+
+    np.testing.assert_array_equal(adjacency, adjacency.T)
+    assert adjacency[0, 5] == 4 and adjacency[0, 4] == 0
+
+
+def test_graph_spec_matches_dict_spec():
+    graph = nx.Graph(groups=SPEC["groups"], cliques={"SDS": {"radius": 1.0}})
+    for clique in SPEC["cliques"]:
+        for node in clique["nodes"]:
+            graph.add_node(node, clique=clique["name"], group=clique["group"])
+        graph.add_edges_from(nx.complete_graph(clique["nodes"]).edges)
+    graph.add_edges_from([("X", "B1"), ("F1", "X")])
+    graph.add_edge("Y1", "B2", type=4)
+
+    from_graph, from_dict = GraphSpec.from_graph(graph), GraphSpec.from_dict(SPEC)
+
+    assert from_graph.labels == from_dict.labels
+    np.testing.assert_array_equal(from_graph.adjacency(), from_dict.adjacency())
+    np.testing.assert_allclose(from_graph.positions, from_dict.positions)
+
+
+def test_load_json(tmp_path):
+    path = tmp_path / "net.json"
+    path.write_text(json.dumps(SPEC))
+
+    assert GraphSpec.coerce(path).labels == GraphSpec.from_dict(SPEC).labels
+
+
+def test_many_cliques_fit_their_side():
+    cliques = [
+        {"name": f"G{k}", "group": "left", "nodes": [f"G{k}-{i}" for i in range(6)]}
+        for k in range(25)
+    ]
+    spec = GraphSpec.from_dict({"cliques": cliques})
+
+    assert np.all(spec.positions[:, 0] < 0)
+    assert np.all(np.abs(spec.positions[:, :2]) < [7.1, 4.0])
+
+
+def test_packed_layout_keeps_cliques_apart_on_their_side(monkeypatch, tmp_path):
+    from network_manim import graph_utils
+
+    monkeypatch.setattr(graph_utils, "CACHE_DIR", tmp_path)
+    cliques = [
+        {"name": f"G{k}", "group": ("left", "right")[k % 2], "nodes": [f"G{k}-{i}" for i in range(3 + k % 7)]}
+        for k in range(20)
+    ]
+    spec = GraphSpec.from_dict({"cliques": cliques, "layout": {"method": "packed", "within": "force"}})
+
+    assert np.all(spec.positions[spec.node_mask("left"), 0] < 0)
+    assert np.all(spec.positions[spec.node_mask("right"), 0] > 0)
+    assert np.all(np.abs(spec.positions[:, :2]) < [7.1, 4.0])
+    centers = np.array([c.center for c in spec.cliques])
+    radii = np.array([c.radius for c in spec.cliques])
+    clearance = np.linalg.norm(centers[:, None] - centers[None], axis=2) - radii[:, None] - radii[None]
+    np.fill_diagonal(clearance, np.inf)
+    assert clearance.min() > 0
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        ({"cliques": [{"group": "top", "nodes": ["a"]}]}, "needs a side"),
+        ({"cliques": [{"nodes": ["a", "a"]}]}, "more than once"),
+        ({"cliques": [{"nodes": ["a"]}], "edges": [["a", "b"]]}, "not in any clique"),
+        ({"cliques": [{"nodes": ["a"]}], "layout": {"method": "spiral"}}, "unknown layout"),
+    ],
+)
+def test_invalid_specs(data, message):
+    with pytest.raises(ValueError, match=message):
+        GraphSpec.from_dict(data)
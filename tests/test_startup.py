@@ -0,0 +1,53 @@
+"""Startup regression tests: the CLI's help and listing must not import Manim."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Generous for slow CI machines; importing Manim alone takes longer
+HELP_BUDGET_SECONDS = 1.5
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from typer.testing import CliRunner
+from network_manim.cli import app
+result = CliRunner().invoke(app, sys.argv[1:])
+print(json.dumps({
+    "exit_code": result.exit_code,
+    "output": result.output,
+    "seconds": time.perf_counter() - start,
+    "manim": "manim" in sys.modules,
+}))
+"""
+
+
+def _probe(*args):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE, *args], env=env, capture_output=True, text=True, check=True
+    )
+    return json.loads(out.stdout.splitlines()[-1])
+
+
+@pytest.mark.parametrize("args", [["--help"], ["render", "--help"], ["list"]])
+def test_cli_starts_without_manim(args):
+    run = _probe(*args)
+
+    assert run["exit_code"] == 0, run["output"]
+    assert not run["manim"]
+    assert run["seconds"] < HELP_BUDGET_SECONDS
+
+
+def test_list_shows_builtin_scenes():
+    assert "multi-clique" in _probe("list")["output"]
+
+
+def test_package_import_is_lazy():
+    code = "import sys, network_manim; print('manim' in sys.modules, network_manim.__version__)"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    out = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True)
+
+    assert out.stdout.split()[0] == "False"
@@ -0,0 +1,25 @@
+"""Unit tests for the section storyboard in `network_manim.storyboard`."""
+import numpy as np
+import pytest
+
+from network_manim.storyboard import contact_sheet
+
+
+def _frame(value, shape=(90, 160)):
+    return np.full((*shape, 4), value, dtype=np.uint8)
+
+
+def test_contact_sheet_tiles_stills_in_order():
+    stills = {name: _frame(v) for name, v in zip("abcde", (0, 50, 100, 150, 200))}
+    sheet = contact_sheet(stills, columns=3, width=80)
+    cell = 45 + 22  # scaled still + caption
+    assert sheet.size == (3 * 80, 2 * cell)
+    # Row-major: "d" (150) starts the second row, the last cell stays blank
+    assert sheet.getpixel((40, 20))[0] == 0
+    assert sheet.getpixel((40, cell + 20))[0] == 150
+    assert sheet.getpixel((200, cell + 20)) == (255, 255, 255)
+
+
+def test_contact_sheet_needs_stills():
+    with pytest.raises(ValueError):
+        contact_sheet({})
@@ -0,0 +1,58 @@
+"""Unit tests for the cached text factory in `network_manim.text`."""
+import numpy as np
+from manim import BLACK, Text
+
+from network_manim.text import TextFactory
+
+
+def test_matches_text_and_hands_out_copies():
+    factory = TextFactory()
+    first = factory("BioStat", scale=0.6, color=BLACK)
+    second = factory("BioStat", scale=0.6, color=BLACK)
+    expected = Text("BioStat").set_color(BLACK).scale(0.6)
+
+    assert first is not second
+    np.testing.assert_allclose(first.get_all_points(), expected.get_all_points())
+    assert first.get_color() == expected.get_color()
+    first.shift([1, 0, 0])
+    np.testing.assert_allclose(second.get_center(), expected.get_center())
+    info = factory.cache_info()
+    assert (info.hits, info.misses, info.rendered) == (1, 1, 1)
+
+
+def test_styles_share_one_layout():
+    factory = TextFactory()
+    factory("Stat", scale=0.6, color=BLACK)
+    small = factory("Stat", scale=0.4, color="#000000")
+
+    info = factory.cache_info()
+    assert (info.rendered, info.currsize) == (1, 2)
+    np.testing.assert_allclose(small.height, Text("Stat").scale(0.4).height)
+
+
+def test_prerender_on_pool():
+    factory = TextFactory(pool_threshold=2)
+    labels = ["X", "Y", "Y1", "Y2", "X"]
+
+    assert factory.prerender(labels, workers=2) == 4
+    assert factory.prerender(labels) == 0
+    label = factory("Y1", scale=0.5)
+    info = factory.cache_info()
+    assert (info.rendered, info.misses) == (4, 1)
+    np.testing.assert_allclose(label.get_all_points(), Text("Y1").scale(0.5).get_all_points())
+
+
+
+def test_prerender_in_a_worker_stays_in_process(monkeypatch):
+    from network_manim import text
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("nested pool started")
+
+    # As in a render_parallel part: this process was started by a pool
+    monkeypatch.setattr(text.multiprocessing, "parent_process", lambda: object())
+    monkeypatch.setattr(text, "ProcessPoolExecutor", no_pool)
+    factory = TextFactory(pool_threshold=2)
+
+    assert factory.prerender(["A", "B", "C"], workers=4) == 3
+    assert factory.cache_info().rendered == 3